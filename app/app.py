@@ -1,11 +1,36 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app.cache.http_cache import ConditionalGetMiddleware
+from app.client.embrapa_client import close_client, start_client
+from app.metrics.timing import ServerTimingMiddleware, TimedJSONResponse
+from app.routes.aggregate_routes import router as aggregate_router
+from app.routes.export_routes import router as export_router
+from app.routes.metrics_routes import router as metrics_router
 from app.routes.routes import router
+from app.routes.series_routes import router as series_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_client()
+    yield
+    await close_client()
+
 
 app = FastAPI(
     title="Embrapa Vitivinicultura API",
     description="API para consulta de dados de vitivinicultura da Embrapa.",
     version="1.0",
+    lifespan=lifespan,
+    default_response_class=TimedJSONResponse,
 )
+app.add_middleware(ConditionalGetMiddleware)
+app.add_middleware(ServerTimingMiddleware)
 
 app.include_router(router, prefix="/api/v1", tags=["Vitivinicultura"])
+app.include_router(export_router, prefix="/api/v1", tags=["Exportação"])
+app.include_router(series_router, prefix="/api/v1", tags=["Séries"])
+app.include_router(aggregate_router, prefix="/api/v1", tags=["Agregados"])
+app.include_router(metrics_router, tags=["Observabilidade"])
@@ -0,0 +1,262 @@
+"""
+Corpos de resposta pré-serializados e pré-comprimidos.
+
+Cada chave (aba, sub_aba, ano) guarda o JSON final em bytes e suas
+variantes gzip e brotli. Enquanto a versão dos dados não muda, as
+respostas reaproveitam esses bytes sem validar, serializar ou comprimir
+de novo; o formato é escolhido pelo header Accept-Encoding.
+
+A serialização usa o orjson quando instalado (extra `fast`) e só valida
+o conteúdo contra o schema com VALIDATE_RESPONSES ligado.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse, Response
+
+from app.config.settings import (
+    CACHE_MAX_SIZE,
+    COMPRESSION_MIN_SIZE,
+    VALIDATE_RESPONSES,
+)
+from app.metrics.timing import phase
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependência opcional
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependência opcional
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+# Níveis intermediários: quase a mesma taxa dos máximos em uma fração
+# do tempo, já que cada versão nova dos dados é codificada de novo.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def dump_json(content):
+    """
+    Serializa o conteúdo em JSON compacto (UTF-8), com o orjson quando
+    disponível. Chaves não textuais (ex: anos) viram strings.
+
+    Returns:
+        bytes: JSON serializado.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def prepare_payload(payload, schema):
+    """
+    Valida o payload contra o schema da rota quando VALIDATE_RESPONSES
+    está ligado; caso contrário, devolve os dados como vieram.
+
+    Args:
+        payload (dict): Dados no formato {"data": ...}.
+        schema (type[BaseModel]): response_model da rota.
+
+    Returns:
+        dict: Conteúdo pronto para serializar.
+    """
+    if not VALIDATE_RESPONSES:
+        return payload
+    return schema.model_validate(payload).model_dump(mode="json")
+
+
+class EncodedBody(NamedTuple):
+    identity: bytes
+    gzip: bytes | None
+    br: bytes | None
+    etag: str
+
+
+def encode_body(payload, schema):
+    """
+    Gera o JSON final, no mesmo formato do FastAPI, e suas versões
+    comprimidas; com VALIDATE_RESPONSES, valida antes contra o schema.
+    Cada etapa é medida como uma fase (validate, serialize e compress).
+    Faz uso intenso de CPU: chame fora do event loop.
+
+    Args:
+        payload (dict): Dados no formato {"data": ...}.
+        schema (type[BaseModel]): response_model da rota.
+
+    Returns:
+        EncodedBody: Bytes por codificação e ETag do conteúdo.
+    """
+    if VALIDATE_RESPONSES:
+        with phase("validate"):
+            payload = prepare_payload(payload, schema)
+    with phase("serialize"):
+        identity = dump_json(payload)
+    compressed_gzip = compressed_br = None
+    with phase("compress"):
+        if len(identity) >= COMPRESSION_MIN_SIZE:
+            compressed_gzip = gzip.compress(
+                identity, compresslevel=GZIP_LEVEL, mtime=0
+            )
+            if brotli is not None:
+                compressed_br = brotli.compress(
+                    identity, quality=BROTLI_QUALITY
+                )
+    etag = hashlib.sha256(identity).hexdigest()[:32]
+    return EncodedBody(identity, compressed_gzip, compressed_br, etag)
+
+
+class BodyCache:
+    """
+    Cache LRU de corpos codificados. Cada entrada guarda a versão dos
+    dados que a gerou (o próprio valor do cache de respostas ou a
+    assinatura do fallback) e só é reaproveitada com a mesma versão.
+    """
+
+    def __init__(self, max_size=CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not (
+                entry[0] is version or entry[0] == version
+            ):
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, version, body):
+        with self._lock:
+            self._entries[key] = (version, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_encode(self, key, version, payload, schema):
+        """
+        Retorna o corpo da chave, codificando o payload se a versão
+        mudou ou a chave ainda não existe.
+        """
+        body = self.get(key, version)
+        if body is None:
+            body = encode_body(payload, schema)
+            self.set(key, version, body)
+        return body
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+body_cache = BodyCache()
+
+
+def accepted_encodings(accept_encoding):
+    """
+    Lista as codificações aceitas pelo cliente (q > 0). O curinga `*`
+    só vale para as codificações que não foram listadas: uma recusa
+    explícita (ex: `gzip;q=0`) prevalece (RFC 9110, seção 12.5.3).
+
+    Returns:
+        set: Nomes das codificações, em minúsculas.
+    """
+    accepted = set()
+    refused = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = params.strip().removeprefix("q=").strip() or "1"
+        try:
+            (accepted if float(quality) > 0 else refused).add(name)
+        except ValueError:
+            continue
+    if "*" in accepted:
+        accepted |= {"br", "gzip"} - refused
+    return accepted - refused
+
+
+class EncodedJSONResponse(Response):
+    """
+    Resposta JSON a partir de um EncodedBody: escolhe brotli, gzip ou o
+    JSON puro conforme o Accept-Encoding da requisição, sem reprocessar
+    o conteúdo. A ETag varia com a codificação enviada.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, body, status_code=200, headers=None):
+        self.encoded = body
+        super().__init__(
+            content=body.identity, status_code=status_code, headers=headers
+        )
+
+    async def __call__(self, scope, receive, send):
+        accepted = accepted_encodings(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        headers = MutableHeaders(raw=self.raw_headers)
+        headers["Vary"] = "Accept-Encoding"
+        headers["ETag"] = f'"{self.encoded.etag}"'
+        for encoding in ("br", "gzip"):
+            variant = getattr(self.encoded, encoding)
+            if variant is not None and encoding in accepted:
+                self.body = variant
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(variant))
+                headers["ETag"] = f'"{self.encoded.etag}-{encoding}"'
+                break
+        await super().__call__(scope, receive, send)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Resposta JSON para dados confiáveis (vindos dos extratores), que
+    dispensa a revalidação do response_model pelo FastAPI. O schema
+    continua declarado na rota e aparece no OpenAPI.
+    """
+
+    def render(self, content):  # noqa: PLR6301
+        with phase("serialize"):
+            return dump_json(content)
+
+
+def trusted_response(payload, schema, headers=None):
+    """
+    Monta uma FastJSONResponse, validando o payload apenas com
+    VALIDATE_RESPONSES ligado (depuração e testes).
+
+    Args:
+        payload (dict): Dados no formato {"data": ...}.
+        schema (type[BaseModel]): response_model da rota.
+        headers (dict): Headers adicionais da resposta.
+
+    Returns:
+        FastJSONResponse: Resposta serializada.
+    """
+    if VALIDATE_RESPONSES:
+        with phase("validate"):
+            payload = prepare_payload(payload, schema)
+    return FastJSONResponse(payload, headers=headers)
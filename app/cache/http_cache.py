@@ -0,0 +1,105 @@
+import hashlib
+from http import HTTPStatus
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.cache.response_cache import cache_ttl
+from app.config.settings import (
+    CACHE_CONTROL_FALLBACK_MAX_AGE,
+    CACHE_STALE_TTL,
+    CACHE_SWR_ENABLED,
+)
+
+# Dados do fallback podem estar desatualizados: cache curto
+FALLBACK_CACHE_CONTROL = f"public, max-age={CACHE_CONTROL_FALLBACK_MAX_AGE}"
+
+
+def cache_control(option, year):
+    """
+    Política de Cache-Control de uma aba e ano: o max-age acompanha o
+    TTL do cache em memória (curto para anos recentes, longo para anos
+    históricos) e, com stale-while-revalidate ativo, caches
+    intermediários também podem servir a versão expirada.
+
+    Args:
+        option (str): Aba consultada (ex: 'producao').
+        year (int): Ano de referência; em intervalos, o ano mais recente.
+
+    Returns:
+        str: Valor do header Cache-Control.
+    """
+    value = f"public, max-age={int(cache_ttl(option, year))}"
+    if CACHE_SWR_ENABLED:
+        value += f", stale-while-revalidate={int(CACHE_STALE_TTL)}"
+    return value
+
+
+def compute_etag(body):
+    """ETag forte a partir do corpo serializado da resposta."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match, etag):
+    """
+    Compara o header If-None-Match com a ETag da resposta, usando a
+    comparação fraca exigida para requisições condicionais GET.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag.removeprefix("W/") for tag in candidates)
+
+
+class ConditionalGetMiddleware:
+    """
+    Middleware ASGI que adiciona ETag às respostas JSON de GET e
+    responde 304 Not Modified, sem corpo, quando o cliente já tem a
+    mesma versão (If-None-Match). Respostas que já trazem ETag mantêm
+    a sua; streams e outros formatos passam direto.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in {"GET", "HEAD"}:
+            await self.app(scope, receive, send)
+            return
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start = None
+        chunks = []
+
+        async def buffered_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if message["status"] == HTTPStatus.OK and (
+                    content_type.startswith("application/json")
+                ):
+                    start = message
+                    return
+            elif start is not None:
+                chunks.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+                await self._send_buffered(
+                    send, start, b"".join(chunks), if_none_match
+                )
+                return
+            await send(message)
+
+        await self.app(scope, receive, buffered_send)
+
+    @staticmethod
+    async def _send_buffered(send, start, body, if_none_match):
+        headers = MutableHeaders(scope=start)
+        etag = headers.get("etag") or compute_etag(body)
+        headers["ETag"] = etag
+        if if_none_match and etag_matches(if_none_match, etag):
+            start["status"] = HTTPStatus.NOT_MODIFIED
+            del headers["content-length"]
+            del headers["content-type"]
+            body = b""
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,159 @@
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, NamedTuple
+
+from app.config.settings import (
+    CACHE_MAX_SIZE,
+    CACHE_RECENT_YEARS,
+    CACHE_STALE_TTL,
+    CACHE_TTL_HISTORICAL,
+    CACHE_TTL_RECENT,
+)
+
+# TTLs por aba: (anos recentes, anos históricos), em segundos
+CACHE_TTLS = {
+    "producao": (CACHE_TTL_RECENT, CACHE_TTL_HISTORICAL),
+    "processamento": (CACHE_TTL_RECENT, CACHE_TTL_HISTORICAL),
+    "comercializacao": (CACHE_TTL_RECENT, CACHE_TTL_HISTORICAL),
+    "importacao": (CACHE_TTL_RECENT, CACHE_TTL_HISTORICAL),
+    "exportacao": (CACHE_TTL_RECENT, CACHE_TTL_HISTORICAL),
+}
+
+
+def cache_key(option, suboption, year):
+    """Monta a chave (aba, sub_aba, ano) normalizando enums para str."""
+    suboption = getattr(suboption, "value", suboption)
+    return (option, suboption, int(year))
+
+
+def cache_ttl(option, year):
+    """
+    Define o TTL de uma entrada conforme a aba e o ano consultado.
+
+    Anos recentes ainda podem ser revisados pela Embrapa e expiram
+    rápido; anos antigos praticamente não mudam.
+
+    Args:
+        option (str): Aba consultada (ex: 'producao').
+        year (int): Ano de referência.
+
+    Returns:
+        float: TTL em segundos.
+    """
+    recent_ttl, historical_ttl = CACHE_TTLS.get(
+        option, (CACHE_TTL_RECENT, CACHE_TTL_HISTORICAL)
+    )
+    if int(year) >= date.today().year - CACHE_RECENT_YEARS:
+        return recent_ttl
+    return historical_ttl
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    age: float
+    fresh: bool
+
+
+class ResponseCache:
+    """
+    Cache em memória com expiração por entrada (TTL), despejo LRU e
+    limite de tamanho.
+
+    Entradas expiradas continuam disponíveis como "stale" por mais
+    `stale_ttl` segundos, para servir o último valor conhecido enquanto
+    uma atualização roda em segundo plano.
+    """
+
+    def __init__(
+        self,
+        max_size=CACHE_MAX_SIZE,
+        stale_ttl=CACHE_STALE_TTL,
+        clock=time.monotonic,
+    ):
+        self.max_size = max_size
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _find(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at, expires_at = entry
+        now = self._clock()
+        if expires_at + self.stale_ttl <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return CacheEntry(value, now - stored_at, now < expires_at)
+
+    def lookup(self, key):
+        """
+        Busca uma entrada, fresca ou stale.
+
+        Returns:
+            CacheEntry | None: Valor, idade em segundos e se ainda está
+                dentro do TTL; None se ausente ou além da janela stale.
+        """
+        entry = self._find(key)
+        if entry is None:
+            self.misses += 1
+        elif entry.fresh:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return entry
+
+    def get(self, key):
+        """Retorna o valor em cache ou None se ausente ou expirado."""
+        entry = self._find(key)
+        if entry is None or not entry.fresh:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.value
+
+    def peek(self, key):
+        """
+        Retorna o valor fresco sem alterar contadores nem a ordem LRU,
+        para leituras em lote (ex: exportação).
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[2] <= self._clock():
+            return None
+        return entry[0]
+
+    def set(self, key, value, ttl):
+        """Armazena o valor, despejando as entradas menos usadas."""
+        now = self._clock()
+        self._entries[key] = (value, now, now + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.stale_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,43 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Coalesce chamadas concorrentes com a mesma chave: a primeira executa
+    a corrotina e as demais aguardam o mesmo resultado (ou exceção).
+    """
+
+    def __init__(self):
+        self._inflight = {}
+
+    def __len__(self):
+        return len(self._inflight)
+
+    async def do(self, key, func):
+        """
+        Executa `func()` uma única vez por chave entre chamadas simultâneas.
+
+        Args:
+            key (hashable): Identificador da operação.
+            func (callable): Função sem argumentos que retorna a corrotina.
+
+        Returns:
+            Any: Resultado compartilhado da corrotina.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+
+            def _done(finished):
+                self._inflight.pop(key, None)
+                # Marca a exceção como lida caso ninguém mais aguarde
+                if not finished.cancelled():
+                    finished.exception()
+
+            task.add_done_callback(_done)
+        # shield: o cancelamento de um cliente não derruba os demais
+        return await asyncio.shield(task)
+
+
+upstream_flight = SingleFlight()
@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+
+from app.config.settings import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Chamada recusada porque o circuito do upstream está aberto."""
+
+
+class CircuitBreaker:
+    """
+    Disjuntor do upstream. Após `failure_threshold` falhas seguidas o
+    circuito abre e as chamadas são recusadas na hora. Passados
+    `reset_timeout` segundos, uma única chamada de teste (half-open) é
+    liberada: se der certo o circuito fecha, senão volta a abrir. O
+    teste é disparado pela próxima requisição após o intervalo.
+    """
+
+    def __init__(
+        self,
+        failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=CIRCUIT_RESET_TIMEOUT,
+        clock=time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def state(self):
+        return self._state
+
+    def allow(self):
+        """
+        Indica se uma chamada ao upstream pode ser feita agora.
+
+        Returns:
+            bool: False enquanto o circuito estiver aberto ou com a
+                chamada de teste em andamento.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            # Uma chamada de teste que não terminou (ex: cancelada) é
+            # substituída por outra após o mesmo intervalo
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+                self._opened_at = self._clock()
+                logger.info("Circuito do upstream em teste (half-open)")
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info("Circuito do upstream fechado")
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (
+                self._failures >= self.failure_threshold
+            ):
+                if self._state != OPEN:
+                    logger.warning(
+                        f"Circuito do upstream aberto após "
+                        f"{self._failures} falha(s)"
+                    )
+                self._state = OPEN
+                self._opened_at = self._clock()
+
+    def reset(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._opened_at = None
+
+
+upstream_breaker = CircuitBreaker()
@@ -0,0 +1,140 @@
+import asyncio
+import time
+from http import HTTPStatus
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.client.circuit_breaker import CircuitOpenError, upstream_breaker
+from app.client.hedging import hedge_delay, hedged, upstream_latency
+from app.config.settings import (
+    HEDGE_ENABLED,
+    UPSTREAM_CONNECT_TIMEOUT,
+    UPSTREAM_KEEPALIVE_EXPIRY,
+    UPSTREAM_POOL_SIZE,
+    UPSTREAM_TIMEOUT,
+)
+
+_client = None
+
+
+def build_async_client(pool_size=UPSTREAM_POOL_SIZE):
+    """
+    Cria um cliente HTTP assíncrono com os timeouts e o pool de
+    conexões keep-alive configurados para a Embrapa.
+
+    Args:
+        pool_size (int): Número máximo de conexões mantidas com o host.
+
+    Returns:
+        httpx.AsyncClient: Cliente configurado.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            UPSTREAM_TIMEOUT, connect=UPSTREAM_CONNECT_TIMEOUT
+        ),
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=UPSTREAM_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def get_client():
+    """
+    Retorna o cliente HTTP compartilhado da aplicação, criando-o sob
+    demanda caso o startup ainda não tenha sido executado.
+
+    Returns:
+        httpx.AsyncClient: Cliente com pool de conexões keep-alive.
+    """
+    global _client  # noqa: PLW0603
+    if _client is None or _client.is_closed:
+        _client = build_async_client()
+    return _client
+
+
+async def start_client(pool_size=UPSTREAM_POOL_SIZE):
+    """Cria o cliente compartilhado. Chamado no startup da aplicação."""
+    global _client  # noqa: PLW0603
+    await close_client()
+    _client = build_async_client(pool_size)
+
+
+async def close_client():
+    """Fecha o cliente compartilhado e suas conexões abertas."""
+    global _client  # noqa: PLW0603
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _fetch_once(url, timeout):
+    if not upstream_breaker.allow():
+        raise CircuitOpenError("Circuito do upstream aberto")
+    started = time.perf_counter()
+    try:
+        response = await asyncio.wait_for(
+            get_client().get(url), timeout=timeout
+        )
+    except (asyncio.TimeoutError, httpx.HTTPError):
+        upstream_breaker.record_failure()
+        raise
+    if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+        upstream_breaker.record_failure()
+    else:
+        upstream_breaker.record_success()
+        upstream_latency.record(time.perf_counter() - started)
+    response.raise_for_status()
+    return response
+
+
+async def fetch_page(url, timeout=UPSTREAM_TIMEOUT, hedge=HEDGE_ENABLED):
+    """
+    Busca uma página do site da Embrapa sem bloquear o event loop,
+    reaproveitando as conexões do cliente compartilhado.
+
+    A chamada passa pelo circuit breaker do upstream: com o circuito
+    aberto ela falha na hora, sem esperar o timeout. Erros de rede,
+    timeouts e status 5xx contam como falha; status 4xx não.
+
+    Com hedge ativo, se a página não chegar dentro do percentil
+    configurado das latências recentes, uma segunda requisição é
+    enviada e a primeira resposta bem-sucedida é usada.
+
+    Args:
+        url (str): URL a ser consultada.
+        timeout (float): Tempo total máximo, em segundos, por tentativa.
+        hedge (bool): Envia uma requisição de hedge em caso de demora.
+
+    Returns:
+        httpx.Response: Resposta com status de sucesso.
+
+    Raises:
+        CircuitOpenError: Se o circuito do upstream estiver aberto.
+        asyncio.TimeoutError: Se o tempo total for excedido.
+        httpx.HTTPError: Em falhas de rede ou status de erro.
+    """
+    if hedge:
+        return await hedged(lambda: _fetch_once(url, timeout), hedge_delay())
+    return await _fetch_once(url, timeout)
+
+
+def build_session(pool_size=UPSTREAM_POOL_SIZE):
+    """
+    Cria uma sessão síncrona com pool de conexões keep-alive, usada
+    pelos processos em lote (ex: criação do fallback).
+
+    Args:
+        pool_size (int): Número máximo de conexões mantidas com o host.
+
+    Returns:
+        requests.Session: Sessão configurada.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from collections import deque
+
+from app.config.settings import (
+    HEDGE_DEFAULT_DELAY,
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_PERCENTILE,
+)
+
+
+class LatencyTracker:
+    """
+    Janela deslizante com as latências mais recentes do upstream, usada
+    para calcular o atraso do hedge a partir de um percentil.
+    """
+
+    def __init__(self, size=256):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def record(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p):
+        """
+        Calcula o percentil `p` (0-100) das latências registradas.
+
+        Returns:
+            float | None: Latência em segundos ou None sem amostras.
+        """
+        with self._lock:
+            values = sorted(self._samples)
+        if not values:
+            return None
+        index = round(p / 100 * (len(values) - 1))
+        return values[index]
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+
+upstream_latency = LatencyTracker()
+
+
+def hedge_delay(tracker=upstream_latency):
+    """
+    Atraso antes de enviar a requisição de hedge: o percentil
+    HEDGE_PERCENTILE das latências recentes, com piso HEDGE_MIN_DELAY.
+    Com poucas amostras, usa HEDGE_DEFAULT_DELAY.
+
+    Returns:
+        float: Atraso em segundos.
+    """
+    if len(tracker) < HEDGE_MIN_SAMPLES:
+        return HEDGE_DEFAULT_DELAY
+    return max(HEDGE_MIN_DELAY, tracker.percentile(HEDGE_PERCENTILE))
+
+
+async def hedged(func, delay):
+    """
+    Executa `func()` e, se não houver resposta em `delay` segundos,
+    dispara uma segunda tentativa. Vence a primeira que terminar com
+    sucesso; a outra é cancelada.
+
+    Args:
+        func (callable): Função sem argumentos que retorna a corrotina.
+        delay (float): Espera, em segundos, antes do hedge.
+
+    Returns:
+        Any: Resultado da primeira tentativa bem-sucedida.
+
+    Raises:
+        Exception: Erro da última tentativa, se todas falharem.
+    """
+    pending = {asyncio.ensure_future(func())}
+    done, pending = await asyncio.wait(pending, timeout=delay)
+    if not done:
+        pending.add(asyncio.ensure_future(func()))
+    try:
+        while True:
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+            if not pending:
+                return task.result()
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+    finally:
+        for task in pending:
+            task.cancel()
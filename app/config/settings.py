@@ -0,0 +1,106 @@
+import os
+
+
+def _env_float(name, default):
+    return float(os.getenv(name, default))
+
+
+def _env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+def _env_bool(name, default):
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+# Modo de depuração: liga diagnósticos como o header Server-Timing.
+DEBUG = _env_bool("DEBUG", False)
+# Header Server-Timing com o tempo de cada fase da requisição.
+SERVER_TIMING_ENABLED = _env_bool("SERVER_TIMING", DEBUG)
+# Revalida as respostas contra o response_model antes de serializar.
+# Os dados vêm dos extratores e já têm o formato dos schemas, então a
+# validação completa fica para depuração e testes.
+VALIDATE_RESPONSES = _env_bool("VALIDATE_RESPONSES", DEBUG)
+
+# Tempo máximo (em segundos) que uma consulta à Embrapa pode levar,
+# somando conexão, envio e leitura da resposta.
+UPSTREAM_TIMEOUT = _env_float("EMBRAPA_TIMEOUT", 10.0)
+UPSTREAM_CONNECT_TIMEOUT = _env_float("EMBRAPA_CONNECT_TIMEOUT", 5.0)
+
+# Pool de conexões keep-alive com o host da Embrapa.
+UPSTREAM_POOL_SIZE = _env_int("EMBRAPA_POOL_SIZE", 20)
+UPSTREAM_KEEPALIVE_EXPIRY = _env_float("EMBRAPA_KEEPALIVE_EXPIRY", 30.0)
+
+# Hedging: se a Embrapa não responder dentro do percentil
+# HEDGE_PERCENTILE das latências recentes, uma segunda requisição é
+# enviada e vence a primeira resposta.
+HEDGE_ENABLED = _env_bool("HEDGE_ENABLED", False)
+HEDGE_PERCENTILE = _env_float("HEDGE_PERCENTILE", 95.0)
+HEDGE_MIN_DELAY = _env_float("HEDGE_MIN_DELAY", 0.2)
+HEDGE_DEFAULT_DELAY = _env_float("HEDGE_DEFAULT_DELAY", 1.0)
+HEDGE_MIN_SAMPLES = _env_int("HEDGE_MIN_SAMPLES", 20)
+
+# Orçamento de latência (em segundos) de uma consulta ao upstream por
+# rota. Esgotado o orçamento, a rota responde com o cache ou o fallback.
+LATENCY_BUDGET = _env_float("LATENCY_BUDGET", 5.0)
+LATENCY_BUDGETS = {
+    aba: _env_float(f"LATENCY_BUDGET_{aba.upper()}", LATENCY_BUDGET)
+    for aba in (
+        "producao",
+        "processamento",
+        "comercializacao",
+        "importacao",
+        "exportacao",
+    )
+}
+
+# Circuit breaker do upstream: falhas seguidas para abrir o circuito e
+# tempo (em segundos) até liberar uma chamada de teste.
+CIRCUIT_FAILURE_THRESHOLD = _env_int("CIRCUIT_FAILURE_THRESHOLD", 5)
+CIRCUIT_RESET_TIMEOUT = _env_float("CIRCUIT_RESET_TIMEOUT", 30.0)
+
+# Cache em memória das respostas extraídas da Embrapa.
+CACHE_MAX_SIZE = _env_int("CACHE_MAX_SIZE", 2048)
+# Anos "recentes" (ainda sujeitos a revisão) recebem TTL curto.
+CACHE_RECENT_YEARS = _env_int("CACHE_RECENT_YEARS", 2)
+CACHE_TTL_RECENT = _env_float("CACHE_TTL_RECENT", 60 * 60)
+CACHE_TTL_HISTORICAL = _env_float("CACHE_TTL_HISTORICAL", 7 * 24 * 60 * 60)
+# Stale-while-revalidate: por quanto tempo após expirar uma resposta
+# ainda é servida enquanto é atualizada em segundo plano.
+CACHE_SWR_ENABLED = _env_bool("CACHE_SWR_ENABLED", True)
+CACHE_STALE_TTL = _env_float("CACHE_STALE_TTL", 24 * 60 * 60)
+SWR_MAX_CONCURRENCY = _env_int("SWR_MAX_CONCURRENCY", 4)
+# Tamanho mínimo (em bytes) do JSON para guardar versões gzip/brotli.
+COMPRESSION_MIN_SIZE = _env_int("COMPRESSION_MIN_SIZE", 1024)
+# max-age (em segundos) do Cache-Control em respostas do fallback.
+CACHE_CONTROL_FALLBACK_MAX_AGE = _env_int("CACHE_CONTROL_FALLBACK_MAX_AGE", 60)
+
+# Arquivo de fallback: SQLite (.db) ou JSON monolítico legado (.json).
+FALLBACK_PATH = os.getenv("FALLBACK_PATH", "app/fallback/fallback_data.db")
+# No modo incremental, anos históricos já verificados há menos que este
+# intervalo (em dias) não são baixados novamente.
+FALLBACK_RECHECK_DAYS = _env_float("FALLBACK_RECHECK_DAYS", 30)
+
+# Crawler assíncrono do fallback: latência (em segundos) acima da qual
+# a concorrência por host é reduzida e intervalo entre os relatórios
+# de progresso.
+CRAWLER_TARGET_LATENCY = _env_float("CRAWLER_TARGET_LATENCY", 2.0)
+CRAWLER_PROGRESS_INTERVAL = _env_float("CRAWLER_PROGRESS_INTERVAL", 5.0)
+# Novas tentativas para páginas com erro, com backoff exponencial e
+# jitter a partir de CRAWLER_RETRY_BASE_DELAY segundos.
+CRAWLER_MAX_RETRIES = _env_int("CRAWLER_MAX_RETRIES", 3)
+CRAWLER_RETRY_BASE_DELAY = _env_float("CRAWLER_RETRY_BASE_DELAY", 1.0)
+CRAWLER_RETRY_MAX_DELAY = _env_float("CRAWLER_RETRY_MAX_DELAY", 30.0)
+
+# Backend de extração das tabelas HTML: "stream" (padrão), "lxml" ou "bs4".
+SCRAPER_BACKEND = os.getenv("SCRAPER_BACKEND", "stream")
+
+# Máximo de anos buscados em paralelo nas rotas de intervalo.
+RANGE_MAX_CONCURRENCY = _env_int("RANGE_MAX_CONCURRENCY", 8)
+
+# Intervalo (em segundos) para reconstruir os índices de séries temporais
+# e os cubos de agregados.
+SERIES_INDEX_TTL = _env_float("SERIES_INDEX_TTL", 60 * 60)
@@ -0,0 +1,100 @@
+import io
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+from app.dataset.dataset import iter_dataset
+from app.schemas.responses_schema import (
+    ImportacaoExportacaoSchema,
+    ProcessamentoSchema,
+    ProdutoSchema,
+)
+
+# Schema dos registros de cada aba
+ABA_SCHEMAS = {
+    "producao": ProdutoSchema,
+    "processamento": ProcessamentoSchema,
+    "comercializacao": ProdutoSchema,
+    "importacao": ImportacaoExportacaoSchema,
+    "exportacao": ImportacaoExportacaoSchema,
+}
+
+_DTYPES = {str: "category", int: "int64"}
+
+
+def build_frame(aba, items):
+    """
+    Monta a tabela colunar de uma aba: `sub_aba`, `ano` e os campos do
+    schema da aba. Textos viram colunas categóricas (dicionário), que o
+    Parquet/Arrow gravam com dictionary encoding.
+
+    Args:
+        aba (str): Aba exportada.
+        items (iterable): Pares ((aba, sub_aba, ano), registros).
+
+    Returns:
+        pandas.DataFrame: Uma linha por registro.
+    """
+    fields = ABA_SCHEMAS[aba].model_fields
+    columns = {"sub_aba": [], "ano": [], **{name: [] for name in fields}}
+    for (_, sub_aba, ano), records in items:
+        for record in records:
+            columns["sub_aba"].append(sub_aba)
+            columns["ano"].append(ano)
+            for name in fields:
+                columns[name].append(record.get(name))
+    dtypes = {"sub_aba": "category", "ano": "int16"}
+    dtypes.update({
+        name: _DTYPES[field.annotation] for name, field in fields.items()
+    })
+    return pd.DataFrame(columns).astype(dtypes)
+
+
+def to_parquet_bytes(frame):
+    buffer = io.BytesIO()
+    frame.to_parquet(buffer, engine="pyarrow", index=False)
+    return buffer.getvalue()
+
+
+def to_arrow_bytes(frame):
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+FORMATS = {
+    "parquet": (to_parquet_bytes, "application/vnd.apache.parquet"),
+    "arrow": (to_arrow_bytes, "application/vnd.apache.arrow.file"),
+}
+
+
+def export_aba(aba, formato="parquet", store=None):
+    """
+    Gera o arquivo colunar de uma aba a partir do dataset local.
+
+    Returns:
+        tuple: (conteúdo em bytes, media type).
+    """
+    serialize, media_type = FORMATS[formato]
+    return serialize(build_frame(aba, iter_dataset(aba, store))), media_type
+
+
+def write_parquet_dir(dest, store=None):
+    """
+    Grava um arquivo `<aba>.parquet` por aba em `dest`.
+
+    Returns:
+        list: Caminhos gravados.
+    """
+    os.makedirs(dest, exist_ok=True)
+    paths = []
+    for aba in ABA_SCHEMAS:
+        path = os.path.join(dest, f"{aba}.parquet")
+        build_frame(aba, iter_dataset(aba, store)).to_parquet(
+            path, engine="pyarrow", index=False
+        )
+        paths.append(path)
+    return paths
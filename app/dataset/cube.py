@@ -0,0 +1,235 @@
+import time
+
+import numpy as np
+
+from app.config.settings import SERIES_INDEX_TTL
+from app.dataset.columnar import ABA_SCHEMAS
+from app.dataset.series_index import (
+    GROUP_FIELDS,
+    ITEM_FIELDS,
+    AmbiguousSeriesError,
+    normalize,
+)
+from app.dataset.snapshot import DatasetSnapshot
+
+
+def measures(aba):
+    """Campos numéricos (medidas) do schema de uma aba."""
+    fields = ABA_SCHEMAS[aba].model_fields
+    return [name for name, field in fields.items() if field.annotation is int]
+
+
+def _encode(aba, names, records_by_year):
+    """
+    Codifica os itens como inteiros (na ordem em que aparecem) e achata
+    os registros em coordenadas (ano, item) e valores das medidas.
+    """
+    item_field = ITEM_FIELDS[aba]
+    group_field = GROUP_FIELDS.get(aba)
+    codes = {}
+    itens = []
+    rows, cols, points = [], [], []
+    for ano, records in records_by_year:
+        for record in records:
+            grupo = record.get(group_field) if group_field else None
+            item = record[item_field]
+            key = (normalize(grupo or ""), normalize(item))
+            if key not in codes:
+                codes[key] = len(itens)
+                itens.append((grupo, item))
+            rows.append(ano)
+            cols.append(codes[key])
+            points.append([record.get(name) or 0 for name in names])
+    points = np.asarray(points, dtype=np.float64).reshape(-1, len(names))
+    return itens, rows, np.asarray(cols, dtype=np.intp), points
+
+
+class DataCube:
+    """
+    Cubo denso ano × item de uma (aba, sub_aba). Anos e itens são
+    codificados como índices inteiros e cada medida é uma matriz
+    float64, com NaN onde o item não aparece no ano. Consultas por ano
+    ou item são buscas em dicionário; agregações são vetorizadas.
+    """
+
+    def __init__(self, anos, itens, valores):
+        self.anos = anos
+        self.itens = itens
+        self.valores = valores
+        self._ano_idx = {int(ano): i for i, ano in enumerate(anos)}
+        self._item_idx = {}
+        self._by_name = {}
+        for i, (grupo, item) in enumerate(itens):
+            self._item_idx[normalize(grupo or ""), normalize(item)] = i
+            self._by_name.setdefault(normalize(item), []).append(i)
+
+    @classmethod
+    def from_records(cls, aba, records_by_year):
+        """
+        Monta o cubo a partir dos registros de cada ano.
+
+        Args:
+            aba (str): Aba dos registros.
+            records_by_year (iterable): Pares (ano, registros).
+
+        Returns:
+            DataCube: Cubo com uma matriz por medida da aba.
+        """
+        names = measures(aba)
+        itens, rows, cols, points = _encode(aba, names, records_by_year)
+        anos, year_codes = np.unique(
+            np.asarray(rows, dtype=np.int16), return_inverse=True
+        )
+        present = np.zeros((len(anos), len(itens)), dtype=bool)
+        present[year_codes, cols] = True
+        valores = {}
+        for i, name in enumerate(names):
+            matrix = np.zeros((len(anos), len(itens)))
+            # Itens repetidos no mesmo ano são somados
+            np.add.at(matrix, (year_codes, cols), points[:, i])
+            matrix[~present] = np.nan
+            valores[name] = matrix
+        return cls(anos, itens, valores)
+
+    def _matrix(self, medida):
+        if medida not in self.valores:
+            raise ValueError(f"Medida inválida: {medida}")
+        return self.valores[medida]
+
+    def _item_col(self, item, grupo=None):
+        """
+        Coluna de um item, sem diferenciar acentos e caixa. Sem o grupo,
+        o nome precisa existir em um único grupo.
+
+        Raises:
+            AmbiguousSeriesError: Item em mais de um grupo, sem `grupo`.
+        """
+        if grupo is not None:
+            return self._item_idx.get((normalize(grupo), normalize(item)))
+        cols = self._by_name.get(normalize(item), [])
+        if len(cols) > 1:
+            grupos = sorted(self.itens[i][0] for i in cols)
+            raise AmbiguousSeriesError(item, grupos)
+        return cols[0] if cols else None
+
+    def value(self, medida, item, ano, grupo=None):
+        """
+        Valor da medida de um item em um ano, em O(1).
+
+        Returns:
+            float | None: Valor, ou None se o item não aparece no ano.
+        """
+        matrix = self._matrix(medida)
+        col = self._item_col(item, grupo)
+        if col is None or ano not in self._ano_idx:
+            return None
+        valor = matrix[self._ano_idx[ano], col]
+        return None if np.isnan(valor) else float(valor)
+
+    def slice(self, medida, item, grupo=None, de=None, ate=None):
+        """
+        Fatia da medida de um item ao longo dos anos do intervalo.
+
+        Returns:
+            tuple | None: (anos, valores) como arrays NumPy, com NaN nos
+                anos em que o item não aparece; None se o item não existe.
+        """
+        matrix = self._matrix(medida)
+        col = self._item_col(item, grupo)
+        if col is None:
+            return None
+        mask = self._year_mask(de, ate)
+        return self.anos[mask], matrix[mask, col]
+
+    def _year_mask(self, de=None, ate=None):
+        mask = np.ones(len(self.anos), dtype=bool)
+        if de is not None:
+            mask &= self.anos >= de
+        if ate is not None:
+            mask &= self.anos <= ate
+        return mask
+
+    def totals(self, medida, de=None, ate=None):
+        """
+        Soma a medida de todos os itens em cada ano do intervalo.
+
+        Returns:
+            tuple: (anos, totais) como arrays NumPy.
+        """
+        mask = self._year_mask(de, ate)
+        totais = np.nansum(self._matrix(medida)[mask], axis=1)
+        return self.anos[mask], totais
+
+    def growth(self, medida, de=None, ate=None):
+        """
+        Crescimento relativo do total em relação ao ano anterior
+        disponível. O primeiro ano e anos com total anterior zero ficam
+        com NaN.
+
+        Returns:
+            tuple: (anos, totais, crescimento) como arrays NumPy.
+        """
+        anos, totais = self.totals(medida, de, ate)
+        crescimento = np.full(len(totais), np.nan)
+        anterior = totais[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crescimento[1:] = np.where(
+                anterior != 0, (totais[1:] - anterior) / anterior, np.nan
+            )
+        return anos, totais, crescimento
+
+    def top(self, medida, ano, n=10):
+        """
+        Maiores itens de um ano pela medida, em ordem decrescente.
+
+        Returns:
+            list: Pares ((grupo, item), valor); vazia se o ano não existe.
+        """
+        if ano not in self._ano_idx:
+            return []
+        row = self._matrix(medida)[self._ano_idx[ano]]
+        validos = np.flatnonzero(~np.isnan(row))
+        ordem = validos[np.argsort(-row[validos], kind="stable")][:n]
+        return [(self.itens[i], row[i]) for i in ordem]
+
+
+def build_cubes(items):
+    """
+    Agrupa o dataset por (aba, sub_aba) e monta um cubo para cada.
+
+    Args:
+        items (iterable): Pares ((aba, sub_aba, ano), registros).
+
+    Returns:
+        dict: {(aba, sub_aba): DataCube}.
+    """
+    grouped = {}
+    for (aba, sub_aba, ano), records in items:
+        grouped.setdefault((aba, sub_aba), []).append((ano, records))
+    return {
+        (aba, sub_aba): DataCube.from_records(aba, records)
+        for (aba, sub_aba), records in grouped.items()
+    }
+
+
+class DataCubes(DatasetSnapshot):
+    """
+    Cubos de todas as abas, montados a partir do dataset local e
+    reconstruídos a cada `ttl` segundos.
+    """
+
+    def __init__(self, ttl=SERIES_INDEX_TTL, clock=time.monotonic):
+        super().__init__(build_cubes, ttl, clock)
+
+    def get(self, aba, sub_aba=None):
+        """
+        Busca o cubo de uma (aba, sub_aba).
+
+        Returns:
+            DataCube | None: Cubo ou None se não houver dados.
+        """
+        aba = getattr(aba, "value", aba)
+        return self.current().get((aba, sub_aba))
+
+
+data_cubes = DataCubes()
@@ -0,0 +1,20 @@
+from app.cache.response_cache import response_cache
+from app.fallback import fallback_handler
+
+
+def iter_dataset(aba=None, store=None):
+    """
+    Percorre o dataset local chave a chave: os dados do fallback ou,
+    quando houver, a versão mais recente em cache.
+
+    Args:
+        aba (str): Restringe a uma aba.
+        store: Store de fallback a ler; por padrão, o da aplicação.
+
+    Yields:
+        tuple: ((aba, sub_aba, ano), registros).
+    """
+    store = store or fallback_handler.fallback_store
+    for key, stored in store.iter_items(aba):
+        cached = response_cache.peek(key)
+        yield key, cached["data"] if cached is not None else stored
@@ -0,0 +1,130 @@
+import time
+import unicodedata
+
+from app.config.settings import SERIES_INDEX_TTL
+from app.dataset.snapshot import DatasetSnapshot
+
+# Campo que identifica o item de cada aba
+ITEM_FIELDS = {
+    "producao": "produto",
+    "processamento": "cultivo",
+    "comercializacao": "produto",
+    "importacao": "pais",
+    "exportacao": "pais",
+}
+
+# Campo que agrupa os itens (tipo de produto ou de uva), quando existe
+GROUP_FIELDS = {
+    "producao": "tipo_produto",
+    "processamento": "tipo_uva",
+    "comercializacao": "tipo_produto",
+}
+
+
+class AmbiguousSeriesError(LookupError):
+    """O item aparece em mais de um grupo e nenhum grupo foi informado."""
+
+    def __init__(self, item, grupos):
+        super().__init__(f"Item '{item}' em mais de um grupo: {grupos}")
+        self.item = item
+        self.grupos = grupos
+
+
+def normalize(text):
+    """Normaliza nomes para busca: sem acentos, caixa e espaços extras."""
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    ascii_text = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(ascii_text.casefold().split())
+
+
+def build_series(items):
+    """
+    Agrupa os registros por grupo e item ao longo dos anos. Abas sem
+    grupo usam "" no lugar do grupo.
+
+    Args:
+        items (iterable): Pares ((aba, sub_aba, ano), registros).
+
+    Returns:
+        dict: {(aba, sub_aba, grupo, item): [registro + ano, ...]}, com
+            grupo e item normalizados e cada série ordenada por ano.
+    """
+    index = {}
+    for (aba, sub_aba, ano), records in items:
+        field = ITEM_FIELDS[aba]
+        group_field = GROUP_FIELDS.get(aba)
+        for record in records:
+            grupo = record.get(group_field) if group_field else None
+            key = (
+                aba,
+                sub_aba,
+                normalize(grupo or ""),
+                normalize(record[field]),
+            )
+            index.setdefault(key, []).append({"ano": ano, **record})
+    for serie in index.values():
+        serie.sort(key=lambda point: point["ano"])
+    return index
+
+
+def build_groups(index):
+    """
+    Lista os grupos de cada item, para buscas sem o grupo informado.
+
+    Returns:
+        dict: {(aba, sub_aba, item): {grupo normalizado: grupo}}.
+    """
+    groups = {}
+    for (aba, sub_aba, grupo, item), serie in index.items():
+        field = GROUP_FIELDS.get(aba)
+        nome = serie[0][field] if field else grupo
+        groups.setdefault((aba, sub_aba, item), {})[grupo] = nome
+    return groups
+
+
+def _build_index(items):
+    index = build_series(items)
+    return index, build_groups(index)
+
+
+class SeriesIndex(DatasetSnapshot):
+    """
+    Índice em memória das séries temporais por produto, cultivo e país,
+    montado a partir do dataset local e reconstruído a cada `ttl`
+    segundos. Cada consulta é uma única busca no dicionário, pela chave
+    (aba, sub_aba, grupo, item).
+    """
+
+    def __init__(self, ttl=SERIES_INDEX_TTL, clock=time.monotonic):
+        super().__init__(_build_index, ttl, clock)
+
+    def get(self, aba, sub_aba, item, grupo=None):
+        """
+        Busca a série de um item. Sem o grupo, o item precisa existir
+        em um único grupo da aba.
+
+        Args:
+            aba (str): Aba consultada.
+            sub_aba (str): Sub-aba, ou None.
+            item (str): Produto, cultivo ou país.
+            grupo (str): Tipo de produto ou de uva, quando a aba agrupa.
+
+        Returns:
+            list | None: Pontos ordenados por ano ou None se não houver.
+
+        Raises:
+            AmbiguousSeriesError: Item em mais de um grupo, sem `grupo`.
+        """
+        sub_aba = getattr(sub_aba, "value", sub_aba)
+        index, groups = self.current()
+        item_key = normalize(item)
+        if grupo is not None:
+            return index.get((aba, sub_aba, normalize(grupo), item_key))
+        candidatos = groups.get((aba, sub_aba, item_key), {})
+        if len(candidatos) > 1:
+            raise AmbiguousSeriesError(item, sorted(candidatos.values()))
+        grupo_key = next(iter(candidatos), "")
+        return index.get((aba, sub_aba, grupo_key, item_key))
+
+
+series_index = SeriesIndex()
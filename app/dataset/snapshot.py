@@ -0,0 +1,40 @@
+import threading
+import time
+
+from app.config.settings import SERIES_INDEX_TTL
+from app.dataset.dataset import iter_dataset
+
+
+class DatasetSnapshot:
+    """
+    Estrutura derivada do dataset local (índice, cubos...), montada sob
+    demanda por `build` e reconstruída a cada `ttl` segundos. A
+    reconstrução é feita por uma única thread; as demais seguem lendo a
+    versão anterior até a troca.
+    """
+
+    def __init__(self, build, ttl=SERIES_INDEX_TTL, clock=time.monotonic):
+        self.ttl = ttl
+        self._build = build
+        self._clock = clock
+        self._value = None
+        self._built_at = None
+        self._lock = threading.Lock()
+
+    def _expired(self):
+        return self._value is None or self._clock() - self._built_at >= (
+            self.ttl
+        )
+
+    def current(self):
+        """Retorna a versão atual, reconstruindo-a se expirou."""
+        if self._expired():
+            with self._lock:
+                if self._expired():
+                    self._value = self._build(iter_dataset())
+                    self._built_at = self._clock()
+        return self._value
+
+    def invalidate(self):
+        with self._lock:
+            self._value = None
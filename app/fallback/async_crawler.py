@@ -0,0 +1,194 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from app.client.embrapa_client import build_async_client
+from app.config.settings import (
+    CRAWLER_PROGRESS_INTERVAL,
+    CRAWLER_TARGET_LATENCY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AimdController:
+    """
+    Controle de concorrência AIMD (additive increase, multiplicative
+    decrease): cada resposta rápida soma 1/limite ao limite (cerca de +1
+    por janela completa) e cada erro ou resposta acima de
+    `target_latency` multiplica o limite por `BACKOFF`. Reduções ficam
+    espaçadas por `cooldown` segundos, para que uma rajada de respostas
+    lentas da mesma janela conte uma única vez.
+    """
+
+    BACKOFF = 0.5
+
+    def __init__(
+        self,
+        max_limit,
+        min_limit=1,
+        initial=2,
+        target_latency=CRAWLER_TARGET_LATENCY,
+        clock=time.monotonic,
+    ):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.target_latency = target_latency
+        self.cooldown = target_latency
+        self._clock = clock
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._last_decrease = None
+
+    @property
+    def limit(self):
+        return int(self._limit)
+
+    def on_success(self, latency):
+        if latency > self.target_latency:
+            self._decrease()
+        else:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def on_failure(self):
+        self._decrease()
+
+    def _decrease(self):
+        now = self._clock()
+        if (
+            self._last_decrease is not None
+            and now - self._last_decrease < self.cooldown
+        ):
+            return
+        self._limit = max(self.min_limit, self._limit * self.BACKOFF)
+        self._last_decrease = now
+
+
+class HostLimiter:
+    """Limita as requisições simultâneas a um host ao limite do AIMD."""
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self.in_flight < self.controller.limit
+            )
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+
+class AdaptiveCrawler:
+    """
+    Cliente HTTP assíncrono para o crawl do fallback, com um limitador
+    AIMD por host: a concorrência cresce enquanto o servidor responde
+    rápido e cai com erros, status 5xx ou latência acima do alvo.
+
+    Args:
+        max_per_host (int): Teto de requisições simultâneas por host.
+        client (httpx.AsyncClient): Cliente a usar; por padrão, um
+            cliente próprio criado e fechado pelo contexto.
+    """
+
+    def __init__(self, max_per_host, client=None):
+        self.max_per_host = max_per_host
+        self._client = client
+        self._owns_client = client is None
+        self._limiters = {}
+
+    async def __aenter__(self):
+        if self._client is None:
+            self._client = build_async_client(pool_size=self.max_per_host)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._owns_client:
+            await self._client.aclose()
+
+    def _limiter(self, url):
+        host = urlsplit(url).netloc
+        if host not in self._limiters:
+            self._limiters[host] = HostLimiter(
+                AimdController(max_limit=self.max_per_host)
+            )
+        return self._limiters[host]
+
+    def concurrency(self, url):
+        """Limite de concorrência atual do host da URL."""
+        return self._limiter(url).controller.limit
+
+    async def get(self, url, headers=None):
+        """
+        Faz um GET respeitando o limite do host e alimenta o controle
+        AIMD com a latência ou a falha da requisição.
+
+        Returns:
+            httpx.Response: Resposta recebida (o status não é validado).
+        """
+        limiter = self._limiter(url)
+        async with limiter.slot():
+            started = time.monotonic()
+            try:
+                response = await self._client.get(url, headers=headers)
+            except Exception:
+                limiter.controller.on_failure()
+                raise
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            limiter.controller.on_failure()
+        else:
+            limiter.controller.on_success(time.monotonic() - started)
+        return response
+
+
+class CrawlProgress:
+    """
+    Contagem de páginas processadas por status, com relatório periódico
+    no log (andamento, páginas/s, concorrência e tempo restante).
+    """
+
+    def __init__(
+        self, total, interval=CRAWLER_PROGRESS_INTERVAL, clock=time.monotonic
+    ):
+        self.total = total
+        self.interval = interval
+        self.counts = {"saved": 0, "unchanged": 0, "errors": 0}
+        self._clock = clock
+        self._started = clock()
+        self._last_report = self._started
+
+    @property
+    def done(self):
+        return sum(self.counts.values())
+
+    def update(self, status, concurrency=None):
+        self.counts[status] += 1
+        now = self._clock()
+        if now - self._last_report >= self.interval or (
+            self.done == self.total
+        ):
+            self._last_report = now
+            logger.info(self.report(concurrency))
+
+    def report(self, concurrency=None):
+        elapsed = max(self._clock() - self._started, 1e-9)
+        rate = self.done / elapsed
+        remaining = (self.total - self.done) / rate if rate else float("inf")
+        text = (
+            f"Progresso: {self.done}/{self.total} páginas, "
+            f"{rate:.1f} páginas/s, {self.counts['errors']} erro(s), "
+            f"restam ~{remaining:.0f}s"
+        )
+        if concurrency is not None:
+            text += f", concorrência {concurrency}"
+        return text
@@ -1,11 +1,31 @@
-import json
+import argparse
+import asyncio
+import hashlib
 import logging
 import os
+import random
+import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from http import HTTPStatus
 
-import requests
-
+from app.client.embrapa_client import build_session
+from app.config.settings import (
+    CACHE_RECENT_YEARS,
+    CRAWLER_MAX_RETRIES,
+    CRAWLER_RETRY_BASE_DELAY,
+    CRAWLER_RETRY_MAX_DELAY,
+    FALLBACK_PATH,
+    FALLBACK_RECHECK_DAYS,
+)
+from app.dataset.columnar import write_parquet_dir
+from app.fallback.async_crawler import AdaptiveCrawler, CrawlProgress
+from app.fallback.fallback_store import (
+    SqliteFallbackStore,
+    import_json,
+    key_from_path,
+)
 from app.mapper.url_mapper import URLMapper
 from app.schemas.invocation_parameters_schema import (
     SubAbaExportacaoSchema,
@@ -28,7 +48,12 @@ anos_producao = range(1970, 2024)
 anos_processamento = range(1970, 2024)
 anos_comercializacao = range(1970, 2024)
 anos_import_export = range(1970, 2025)
-fallback_data = {}
+
+# Sessão compartilhada: reaproveita as conexões com o host da Embrapa
+http_session = build_session()
+
+# Indica que a página não mudou desde a última atualização
+UNCHANGED = object()
 
 # Monta a lista de tarefas (função, url, key_path)
 tasks = []
@@ -79,41 +104,401 @@ for sub in SubAbaExportacaoSchema:
         ))
 
 
-def fetch_and_store(func, url, key_path):
+def content_hash(html):
+    """
+    Calcula o hash do conteúdo relevante da página: apenas a tabela de
+    dados, para que mudanças no layout do site não forcem reprocessamento.
+    """
+    start = html.find('<table class="tb_base tb_dados"')
+    end = html.find("</table>", start) if start != -1 else -1
+    if end != -1:
+        html = html[start:end]
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+def _conditional_headers(meta):
+    headers = {}
+    if meta and meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta and meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _check_response(response, meta):
+    """
+    Valida a resposta e calcula os novos metadados da página.
+
+    Returns:
+        tuple: (resposta ou None se a página não mudou, metadados).
+    """
+    if response.status_code == HTTPStatus.NOT_MODIFIED:
+        return None, meta
+    response.raise_for_status()
+    new_meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content_hash": content_hash(response.text),
+    }
+    if meta and meta.get("content_hash") == new_meta["content_hash"]:
+        return None, new_meta
+    return response, new_meta
+
+
+def _download(url, meta):
+    time.sleep(0.5)  # Aguarda 0.5 segundos antes de cada requisição
+    # (ajuste conforme necessário)
+    response = http_session.get(
+        url, timeout=15, headers=_conditional_headers(meta)
+    )
+    return _check_response(response, meta)
+
+
+def fetch_and_store(func, url, key_path, meta=None):
+    """
+    Baixa e extrai uma página. Com `meta` de uma execução anterior, faz
+    uma requisição condicional e não reprocessa páginas inalteradas.
+
+    Returns:
+        tuple: (key_path, dados, metadados). Os dados são None em caso
+            de erro e UNCHANGED quando a página não mudou.
+    """
     logger.info(f"Processando {url} ...")
     try:
-        time.sleep(0.5)  # Aguarda 0.5 segundos antes de cada requisição
-        # (ajuste conforme necessário)
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
+        response, new_meta = _download(url, meta)
+        if response is None:
+            logger.info(f"Sem alterações em {url}")
+            return (key_path, UNCHANGED, new_meta)
         data = func(response)
         logger.info(f"Dados salvos para {url}")
-        return (key_path, data)
+        return (key_path, data, new_meta)
+    except Exception as e:
+        logger.error(f"Erro ao processar {url}: {e}")
+        return (key_path, None, None)
+
+
+async def fetch_and_store_async(crawler, func, url, key_path, meta=None):
+    """
+    Versão assíncrona de `fetch_and_store`: o download passa pelo
+    controle de concorrência do crawler, sem pausa fixa, e a extração
+    roda em uma thread.
+
+    Returns:
+        tuple: (key_path, dados, metadados), como em `fetch_and_store`.
+    """
+    try:
+        response = await crawler.get(url, headers=_conditional_headers(meta))
+        response, new_meta = _check_response(response, meta)
+        if response is None:
+            return (key_path, UNCHANGED, new_meta)
+        data = await asyncio.to_thread(func, response)
+        return (key_path, data, new_meta)
     except Exception as e:
         logger.error(f"Erro ao processar {url}: {e}")
-        return (key_path, None)
+        return (key_path, None, None)
+
+
+def backoff_delay(
+    attempt, base=CRAWLER_RETRY_BASE_DELAY, cap=CRAWLER_RETRY_MAX_DELAY
+):
+    """
+    Espera antes da nova tentativa `attempt` (a partir de 0): backoff
+    exponencial com jitter completo, sorteada entre 0 e base * 2^attempt,
+    limitada a `cap` segundos.
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def _fetch_with_retries(func, url, key_path, meta):
+    result = fetch_and_store(func, url, key_path, meta)
+    for attempt in range(CRAWLER_MAX_RETRIES):
+        if result[1] is not None:
+            break
+        delay = backoff_delay(attempt)
+        logger.warning(f"Nova tentativa para {url} em {delay:.1f}s")
+        time.sleep(delay)
+        result = fetch_and_store(func, url, key_path, meta)
+    return result
+
+
+async def _fetch_with_retries_async(crawler, func, url, key_path, meta):
+    result = await fetch_and_store_async(crawler, func, url, key_path, meta)
+    for attempt in range(CRAWLER_MAX_RETRIES):
+        if result[1] is not None:
+            break
+        delay = backoff_delay(attempt)
+        logger.warning(f"Nova tentativa para {url} em {delay:.1f}s")
+        await asyncio.sleep(delay)
+        result = await fetch_and_store_async(
+            crawler, func, url, key_path, meta
+        )
+    return result
+
+
+def _is_fresh(key_path, meta):
+    """Anos históricos verificados recentemente não precisam ser baixados."""
+    if not meta:
+        return False
+    recent_year = date.today().year - CACHE_RECENT_YEARS
+    checked_age = time.time() - meta["checked_at"]
+    return (
+        int(key_path[-1]) < recent_year
+        and checked_age < FALLBACK_RECHECK_DAYS * 24 * 60 * 60
+    )
+
+
+# Status do checkpoint de URLs que não precisam ser buscadas de novo
+# ao retomar: concluídas ou puladas pelo modo incremental
+FINISHED = {"done", "skipped"}
 
 
-def run_fallback_creation(max_workers=12):
+def _checkpoint_incomplete(checkpoint):
+    """
+    Indica se o checkpoint é de um crawl interrompido ou com falhas:
+    alguma URL falhou ou não chegou a ser registrada.
+    """
+    if not checkpoint:
+        return False
+    return any(checkpoint.get(url) not in FINISHED for _, url, _ in tasks)
+
+
+def _pending_jobs(store, incremental, checkpoint):
+    """
+    Seleciona as tarefas a baixar, com os metadados da última execução,
+    pulando as URLs já concluídas no checkpoint. As URLs puladas por
+    estarem atualizadas (modo incremental) são registradas como
+    "skipped", para que o checkpoint de um crawl que terminou fique
+    completo.
+
+    Returns:
+        tuple: (lista de (func, url, key_path, meta), chaves puladas).
+    """
+    jobs = []
+    fresh = []
+    skipped = 0
+    for func, url, key_path in tasks:
+        if checkpoint.get(url) in FINISHED:
+            skipped += 1
+            continue
+        meta = store.get_meta(url) if incremental else None
+        if incremental and _is_fresh(key_path, meta):
+            fresh.append(url)
+            continue
+        jobs.append((func, url, key_path, meta))
+    store.set_checkpoint_many(fresh, "skipped")
+    return jobs, skipped + len(fresh)
+
+
+def _save_result(store, url, result):
+    """
+    Grava o resultado de uma página no fallback e marca a URL no
+    checkpoint, para que um crawl interrompido possa ser retomado.
+
+    Returns:
+        str: Status da página: "saved", "unchanged" ou "errors".
+    """
+    key_path, data, meta = result
+    if data is None:
+        store.set_checkpoint(url, "failed")
+        return "errors"
+    if data is UNCHANGED:
+        status = "unchanged"
+    else:
+        store.put(*key_from_path(key_path), data)
+        status = "saved"
+    store.put_meta(url, meta)
+    store.set_checkpoint(url, "done")
+    return status
+
+
+def _missing_keys(store):
+    """
+    Lista as chaves que falharam em todas as tentativas do crawl.
+
+    Returns:
+        list: key_paths das URLs com falha no checkpoint.
+    """
+    checkpoint = store.get_checkpoint()
+    return [
+        key_path
+        for _, url, key_path in tasks
+        if checkpoint.get(url) == "failed"
+    ]
+
+
+def _report_missing(store, missing):
+    for key_path in missing:
+        previous = store.get(*key_from_path(key_path)) is not None
+        logger.error(
+            f"Chave ausente: {'/'.join(key_path)}"
+            + (" (mantida a versão anterior)" if previous else "")
+        )
+    if missing:
+        logger.error(
+            f"{len(missing)} chave(s) falharam após "
+            f"{CRAWLER_MAX_RETRIES} nova(s) tentativa(s); rode novamente "
+            "para buscar apenas as que faltam"
+        )
+
+
+def _crawl_threads(jobs, store, max_workers):
+    progress = CrawlProgress(len(jobs))
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(fetch_and_store, func, url, key_path)
-            for func, url, key_path in tasks
-        ]
+        futures = {
+            executor.submit(
+                _fetch_with_retries, func, url, key_path, meta
+            ): url
+            for func, url, key_path, meta in jobs
+        }
         for future in as_completed(futures):
-            key_path, data = future.result()
-            if data is not None:
-                d = fallback_data
-                for key in key_path[:-1]:
-                    d = d.setdefault(key, {})
-                d[key_path[-1]] = data
+            url = futures[future]
+            progress.update(_save_result(store, url, future.result()))
+    return progress.counts
+
+
+async def _crawl_async(jobs, store, max_per_host):
+    progress = CrawlProgress(len(jobs))
+    async with AdaptiveCrawler(max_per_host=max_per_host) as crawler:
+
+        async def _run(func, url, key_path, meta):
+            result = await _fetch_with_retries_async(
+                crawler, func, url, key_path, meta
+            )
+            status = _save_result(store, url, result)
+            progress.update(status, crawler.concurrency(url))
+
+        await asyncio.gather(*(_run(*job) for job in jobs))
+    return progress.counts
+
+
+def run_fallback_creation(
+    max_workers=12,
+    path=FALLBACK_PATH,
+    incremental=False,
+    use_async=False,
+    full=False,
+):
+    """
+    Baixa as páginas de `tasks` e grava cada chave no SQLite de fallback
+    assim que fica pronta, sem acumular tudo em memória.
+
+    No modo incremental, anos históricos verificados recentemente são
+    pulados e as demais páginas usam requisição condicional e hash do
+    conteúdo: só as chaves que mudaram são reprocessadas e regravadas.
+
+    O modo assíncrono troca as threads com pausa fixa por um crawler
+    asyncio com concorrência adaptativa (AIMD) por host, limitada a
+    `max_workers`.
+
+    Cada página concluída fica registrada no checkpoint do SQLite. Se o
+    último crawl foi interrompido ou teve falhas, ele é retomado e só as
+    páginas que faltaram ou falharam são buscadas; `full` força um crawl
+    completo. Páginas com erro são tentadas novamente com
+    backoff exponencial e jitter; as que falharem em todas as
+    tentativas são listadas no log ao final.
+
+    Args:
+        max_workers (int): Número de threads de download, ou teto de
+            requisições simultâneas por host no modo assíncrono.
+        path (str): Caminho do arquivo SQLite de fallback.
+        incremental (bool): Ativa a atualização incremental.
+        use_async (bool): Usa o crawler assíncrono adaptativo.
+        full (bool): Ignora o checkpoint e busca todas as páginas.
+
+    Returns:
+        list: key_paths que ficaram sem atualização.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    store = SqliteFallbackStore(path)
+    try:
+        checkpoint = store.get_checkpoint()
+        if full or not _checkpoint_incomplete(checkpoint):
+            store.clear_checkpoint()
+            checkpoint = {}
+        else:
+            logger.info(
+                "Retomando o crawl anterior: "
+                f"{sum(v in FINISHED for v in checkpoint.values())} "
+                "página(s) já concluída(s)"
+            )
+        jobs, skipped = _pending_jobs(store, incremental, checkpoint)
+        if use_async:
+            counts = asyncio.run(_crawl_async(jobs, store, max_workers))
+        else:
+            counts = _crawl_threads(jobs, store, max_workers)
+        missing = _missing_keys(store)
+        _report_missing(store, missing)
+    finally:
+        store.close()
+
+    logger.info(
+        f"Fallback {path} atualizado: {counts['saved']} chaves gravadas, "
+        f"{counts['unchanged']} sem alterações, {skipped} puladas, "
+        f"{counts['errors']} erro(s)"
+    )
+    return missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cria o fallback local com os dados da Embrapa."
+    )
+    parser.add_argument("--path", default=FALLBACK_PATH)
+    parser.add_argument("--workers", type=int, default=12)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Baixa e regrava apenas as páginas que mudaram.",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Usa o crawler assíncrono com concorrência adaptativa; "
+        "--workers passa a ser o teto de requisições por host.",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignora o checkpoint de um crawl interrompido e busca todas "
+        "as páginas.",
+    )
+    parser.add_argument(
+        "--from-json",
+        metavar="JSON",
+        help="Apenas migra um fallback_data.json existente para o SQLite.",
+    )
+    parser.add_argument(
+        "--parquet-dir",
+        metavar="DIR",
+        help="Ao final, grava também um arquivo Parquet por aba em DIR.",
+    )
+    args = parser.parse_args(argv)
+
+    missing = []
+    if args.from_json:
+        store = SqliteFallbackStore(args.path)
+        total = import_json(args.from_json, store)
+        store.close()
+        logger.info(f"{total} chaves importadas de {args.from_json}")
+    else:
+        missing = run_fallback_creation(
+            max_workers=args.workers,
+            path=args.path,
+            incremental=args.incremental,
+            use_async=args.use_async,
+            full=args.full,
+        )
 
-    os.makedirs("app/fallback", exist_ok=True)
-    with open("app/fallback/fallback_data.json", "w", encoding="utf-8") as f:
-        json.dump(fallback_data, f, ensure_ascii=False, indent=2)
+    if args.parquet_dir:
+        store = SqliteFallbackStore(args.path)
+        for path in write_parquet_dir(args.parquet_dir, store):
+            logger.info(f"Parquet gravado em {path}")
+        store.close()
 
-    logger.info("Arquivo fallback_data.json criado com sucesso!")
+    # Código de saída 1 quando alguma chave não pôde ser atualizada
+    return 1 if missing else 0
 
 
 if __name__ == "__main__":
-    run_fallback_creation()
+    sys.exit(main())
@@ -1,20 +1,52 @@
-import json
 import logging
 
-FALLBACK_PATH = "app/fallback/fallback_data.json"
+from app.cache.encoded_body import body_cache, encode_body
+from app.cache.response_cache import cache_key
+from app.config.settings import FALLBACK_PATH
+from app.fallback.fallback_store import open_fallback_store
+from app.metrics.metrics import fallback_served
+from app.metrics.timing import phase
+
+fallback_store = open_fallback_store(FALLBACK_PATH)
 
 
 def get_fallback_data(aba, schema_obj):
-    try:
-        with open(FALLBACK_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        key_path = [aba]
-        if hasattr(schema_obj, "sub_aba"):
-            key_path.append(str(schema_obj.sub_aba))
-        key_path.append(str(schema_obj.ano))
-        for key in key_path:
-            data = data[key]
-        return {"data": data}
-    except Exception as e:
-        logging.error(f"Erro ao buscar fallback: {e}")
+    sub_aba = getattr(schema_obj, "sub_aba", None)
+    with phase("fallback"):
+        data = fallback_store.get(aba, sub_aba, schema_obj.ano)
+    fallback_served.labels(aba, str(data is not None).lower()).inc()
+    if data is None:
+        logging.error(
+            f"Erro ao buscar fallback: chave ausente {aba} {sub_aba} "
+            f"{schema_obj.ano}"
+        )
         return {"data": []}
+    return {"data": data}
+
+
+def get_fallback_body(aba, schema_obj, response_schema):
+    """
+    Versão pré-serializada de `get_fallback_data`: o JSON e suas
+    variantes comprimidas ficam guardados por chave enquanto o arquivo
+    de fallback não muda. Chaves ausentes não são guardadas.
+
+    Args:
+        aba (str): Aba consultada.
+        schema_obj (BaseModel): Parâmetros da rota (sub_aba e ano).
+        response_schema (type[BaseModel]): response_model da rota.
+
+    Returns:
+        EncodedBody: Corpo pronto para a resposta.
+    """
+    sub_aba = getattr(schema_obj, "sub_aba", None)
+    key = ("fallback", *cache_key(aba, sub_aba, schema_obj.ano))
+    version = fallback_store.version()
+    with phase("fallback"):
+        body = body_cache.get(key, version)
+    if body is not None:
+        fallback_served.labels(aba, "true").inc()
+        return body
+    payload = get_fallback_data(aba, schema_obj)
+    if not payload["data"]:
+        return encode_body(payload, response_schema)
+    return body_cache.get_or_encode(key, version, payload, response_schema)
@@ -0,0 +1,394 @@
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from app.cache.response_cache import cache_key
+
+logger = logging.getLogger(__name__)
+
+
+def build_index(data):
+    """
+    Achata o JSON de fallback em um dicionário indexado por
+    (aba, sub_aba, ano). Abas sem sub-aba usam sub_aba None.
+
+    Args:
+        data (dict): Conteúdo de fallback_data.json.
+
+    Returns:
+        dict: Índice {(aba, sub_aba, ano): lista de registros}.
+    """
+    index = {}
+    for aba, by_aba in data.items():
+        for key, value in by_aba.items():
+            if isinstance(value, list):
+                index[cache_key(aba, None, key)] = value
+                continue
+            for ano, rows in value.items():
+                index[cache_key(aba, key, ano)] = rows
+    return index
+
+
+class JsonFallbackStore:
+    """
+    Mantém o fallback em memória, carregado sob demanda e recarregado
+    quando o arquivo muda. A troca do índice é atômica: leitores veem
+    sempre o índice antigo completo ou o novo completo.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._index = {}
+        self._signature = None
+        self._lock = threading.Lock()
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _reload_if_changed(self):
+        signature = self._file_signature()
+        if signature is None or signature == self._signature:
+            return
+        with self._lock:
+            if signature == self._signature:
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    index = build_index(json.load(f))
+            except (OSError, ValueError, AttributeError) as e:
+                logger.error(f"Erro ao carregar fallback {self.path}: {e}")
+                return
+            self._index = index
+            self._signature = signature
+            logger.info(f"Fallback carregado: {len(index)} chaves")
+
+    def version(self):
+        """Identifica a versão dos dados: muda quando o arquivo muda."""
+        return self._file_signature()
+
+    def iter_items(self, aba=None):
+        """Percorre ((aba, sub_aba, ano), registros) em ordem de chave."""
+        self._reload_if_changed()
+        index = self._index
+        for key in sorted(index, key=lambda k: (k[0], k[1] or "", k[2])):
+            if aba is None or key[0] == aba:
+                yield key, index[key]
+
+    def get(self, aba, sub_aba, ano):
+        """
+        Busca os registros de uma chave em O(1).
+
+        Returns:
+            list | None: Registros ou None se a chave não existir.
+        """
+        self._reload_if_changed()
+        return self._index.get(cache_key(aba, sub_aba, ano))
+
+    def __len__(self):
+        self._reload_if_changed()
+        return len(self._index)
+
+
+def key_from_path(key_path):
+    """
+    Converte um key_path do crawler (ex: ['importacao', 'espumantes',
+    '2020']) na chave (aba, sub_aba, ano).
+    """
+    sub_aba = key_path[1] if len(key_path) == 3 else None  # noqa: PLR2004
+    return cache_key(key_path[0], sub_aba, key_path[-1])
+
+
+class SqliteFallbackStore:
+    """
+    Fallback em um arquivo SQLite, uma linha por (aba, sub_aba, ano).
+    Cada chave é lida isoladamente pelo índice da chave primária, sem
+    carregar o restante dos dados em memória.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS fallback (
+            aba TEXT NOT NULL,
+            sub_aba TEXT NOT NULL DEFAULT '',
+            ano INTEGER NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (aba, sub_aba, ano)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS fallback_meta (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content_hash TEXT,
+            checked_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS crawl_checkpoint (
+            url TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self):
+        # sqlite3 não compartilha conexões entre threads por padrão
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self.SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def get(self, aba, sub_aba, ano):
+        """
+        Busca os registros de uma chave.
+
+        Returns:
+            list | None: Registros ou None se a chave não existir.
+        """
+        if not os.path.exists(self.path):
+            return None
+        aba, sub_aba, ano = cache_key(aba, sub_aba, ano)
+        try:
+            row = (
+                self
+                ._connection()
+                .execute(
+                    "SELECT data FROM fallback "
+                    "WHERE aba = ? AND sub_aba = ? AND ano = ?",
+                    (aba, sub_aba or "", ano),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Erro ao ler fallback {self.path}: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+
+    def put(self, aba, sub_aba, ano, data):
+        """Grava (ou substitui) os registros de uma chave."""
+        self.put_many([((aba, sub_aba, ano), data)])
+
+    def put_many(self, items):
+        """
+        Grava vários registros em uma única transação.
+
+        Args:
+            items (iterable): Pares ((aba, sub_aba, ano), registros).
+        """
+        rows = []
+        for key, data in items:
+            aba, sub_aba, ano = cache_key(*key)
+            payload = json.dumps(
+                data, ensure_ascii=False, separators=(",", ":")
+            )
+            rows.append((aba, sub_aba or "", ano, payload))
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO fallback (aba, sub_aba, ano, data) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        self._writes += 1
+
+    def version(self):
+        """
+        Identifica a versão dos dados. Muda com gravações deste store e
+        com alterações do arquivo (e do WAL) por outros processos, como
+        a atualização do fallback.
+        """
+        signature = [self._writes]
+        for path in (self.path, self.path + "-wal"):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                signature.append(None)
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def get_meta(self, url):
+        """
+        Retorna os metadados da última consulta a uma URL (ETag,
+        Last-Modified, hash do conteúdo e horário da verificação).
+
+        Returns:
+            dict | None: Metadados ou None se a URL nunca foi baixada.
+        """
+        if not os.path.exists(self.path):
+            return None
+        row = (
+            self
+            ._connection()
+            .execute(
+                "SELECT etag, last_modified, content_hash, checked_at "
+                "FROM fallback_meta WHERE url = ?",
+                (url,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        etag, last_modified, content_hash, checked_at = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash,
+            "checked_at": checked_at,
+        }
+
+    def put_meta(self, url, meta):
+        """Registra os metadados de uma URL recém-verificada."""
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO fallback_meta "
+                "(url, etag, last_modified, content_hash, checked_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    url,
+                    meta.get("etag"),
+                    meta.get("last_modified"),
+                    meta.get("content_hash"),
+                    time.time(),
+                ),
+            )
+
+    def get_checkpoint(self):
+        """
+        Lê o checkpoint do último crawl.
+
+        Returns:
+            dict: {url: status}, com status "done", "skipped" (pulada
+                pelo modo incremental) ou "failed".
+        """
+        if not os.path.exists(self.path):
+            return {}
+        rows = self._connection().execute(
+            "SELECT url, status FROM crawl_checkpoint"
+        )
+        return dict(rows)
+
+    def set_checkpoint(self, url, status):
+        """Registra o resultado de uma URL no checkpoint do crawl."""
+        self.set_checkpoint_many([url], status)
+
+    def set_checkpoint_many(self, urls, status):
+        """Registra o mesmo status para várias URLs em uma transação."""
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO crawl_checkpoint "
+                "(url, status, updated_at) VALUES (?, ?, ?)",
+                [(url, status, now) for url in urls],
+            )
+
+    def clear_checkpoint(self):
+        """Descarta o checkpoint, no início de um crawl completo."""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM crawl_checkpoint")
+
+    def iter_items(self, aba=None):
+        """
+        Percorre ((aba, sub_aba, ano), registros) em ordem de chave, lendo
+        do banco aos poucos, sem carregar tudo em memória.
+
+        Usa uma conexão própria, que pode ser consumida de threads
+        diferentes (ex: respostas em streaming do Starlette).
+        """
+        if not os.path.exists(self.path):
+            return
+        query = "SELECT aba, sub_aba, ano, data FROM fallback"
+        args = ()
+        if aba is not None:
+            query += " WHERE aba = ?"
+            args = (aba,)
+        query += " ORDER BY aba, sub_aba, ano"
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            cursor = conn.execute(query, args)
+            while rows := cursor.fetchmany(64):
+                for row_aba, sub_aba, ano, data in rows:
+                    yield (row_aba, sub_aba or None, ano), json.loads(data)
+        finally:
+            conn.close()
+
+    def keys(self):
+        """Lista as chaves (aba, sub_aba, ano) armazenadas."""
+        if not os.path.exists(self.path):
+            return []
+        rows = self._connection().execute(
+            "SELECT aba, sub_aba, ano FROM fallback ORDER BY aba, sub_aba, ano"
+        )
+        return [(aba, sub_aba or None, ano) for aba, sub_aba, ano in rows]
+
+    def __len__(self):
+        if not os.path.exists(self.path):
+            return 0
+        return (
+            self
+            ._connection()
+            .execute("SELECT COUNT(*) FROM fallback")
+            .fetchone()[0]
+        )
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def import_json(json_path, store):
+    """
+    Migra um fallback_data.json monolítico para o store informado.
+
+    Returns:
+        int: Quantidade de chaves importadas.
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        index = build_index(json.load(f))
+    store.put_many(index.items())
+    return len(index)
+
+
+def open_fallback_store(path):
+    """
+    Escolhe o backend de fallback pela extensão do arquivo.
+
+    Um `.db` que ainda não existe, mas tem ao lado o `.json` legado de
+    mesmo nome (ex: fallback_data.json), é criado a partir dele. Se a
+    migração falhar, o JSON é usado diretamente.
+    """
+    if path.endswith(".json"):
+        return JsonFallbackStore(path)
+    store = SqliteFallbackStore(path)
+    legacy = os.path.splitext(path)[0] + ".json"
+    if os.path.exists(path) or not os.path.exists(legacy):
+        return store
+    try:
+        total = import_json(legacy, store)
+    except (OSError, ValueError, AttributeError, sqlite3.Error) as e:
+        logger.error(f"Erro ao migrar {legacy} para {path}: {e}")
+        store.close()
+        # Um .db parcial impediria uma nova tentativa no próximo início
+        with contextlib.suppress(OSError):
+            os.remove(path)
+        return JsonFallbackStore(legacy)
+    logger.info(f"Fallback migrado de {legacy} para {path}: {total} chaves")
+    return store
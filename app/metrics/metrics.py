@@ -0,0 +1,285 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from app.cache.response_cache import response_cache
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value):
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _CounterValue:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeValue(_CounterValue):
+    def dec(self, amount=1):
+        self.inc(-amount)
+
+    def set(self, value):
+        with self._lock:
+            self.value = value
+
+    @contextmanager
+    def track_inprogress(self):
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+
+class _HistogramValue:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    @contextmanager
+    def time(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class Metric:
+    """
+    Métrica com labels no formato de exposição do Prometheus. Cada
+    combinação de valores de label tem seu próprio contador, criado na
+    primeira chamada a `labels`. Com `func`, o valor é lido na hora da
+    coleta (um número, ou um dicionário {valores dos labels: número}).
+    """
+
+    TYPE = "untyped"
+    CHILD = _CounterValue
+
+    def __init__(
+        self, name, documentation, labelnames=(), *, func=None, registry=None
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.func = func
+        self._children = {}
+        self._lock = threading.Lock()
+        (registry if registry is not None else default_registry).register(self)
+
+    def _new_child(self):
+        return self.CHILD()
+
+    def labels(self, *values):
+        """Retorna o contador da combinação de valores de label."""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _samples(self):
+        if self.func is None:
+            return list(self._children.items())
+        value = self.func()
+        return (
+            list(value.items()) if isinstance(value, dict) else [((), value)]
+        )
+
+    def expose(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        for values, child in self._samples():
+            value = getattr(child, "value", child)
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    TYPE = "counter"
+
+    def inc(self, amount=1):
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    TYPE = "gauge"
+    CHILD = _GaugeValue
+
+    def inc(self, amount=1):
+        self.labels().inc(amount)
+
+    def dec(self, amount=1):
+        self.labels().dec(amount)
+
+    def set(self, value):
+        self.labels().set(value)
+
+    def track_inprogress(self):
+        return self.labels().track_inprogress()
+
+
+class Histogram(Metric):
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name,
+        documentation,
+        labelnames=(),
+        *,
+        buckets=DEFAULT_BUCKETS,
+        registry=None,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry=registry)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value):
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+    def expose(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        for values, child in self._samples():
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                labels = _format_labels(
+                    self.labelnames, values, ("le", _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Conjunto de métricas exposto pela rota /metrics."""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+
+    def render(self):
+        """
+        Gera o texto de todas as métricas no formato do Prometheus.
+
+        Returns:
+            str: Exposição em text format 0.0.4.
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+
+default_registry = Registry()
+
+upstream_duration = Histogram(
+    "embrapa_upstream_request_duration_seconds",
+    "Tempo das consultas ao site da Embrapa, por aba.",
+    ["option"],
+)
+upstream_requests = Counter(
+    "embrapa_upstream_requests_total",
+    "Consultas ao site da Embrapa, por aba e resultado.",
+    ["option", "outcome"],
+)
+upstream_in_flight = Gauge(
+    "embrapa_upstream_in_flight",
+    "Consultas ao site da Embrapa em andamento.",
+)
+parse_duration = Histogram(
+    "embrapa_parse_duration_seconds",
+    "Tempo de extração das tabelas HTML, por aba.",
+    ["option"],
+)
+fallback_served = Counter(
+    "embrapa_fallback_served_total",
+    "Respostas servidas pelo fallback local, por aba e se a chave existia.",
+    ["aba", "found"],
+)
+cache_lookups = Counter(
+    "embrapa_cache_lookups_total",
+    "Consultas ao cache de respostas, por resultado.",
+    ["result"],
+    func=lambda: {
+        ("hit",): response_cache.hits,
+        ("stale",): response_cache.stale_hits,
+        ("miss",): response_cache.misses,
+    },
+)
+cache_hit_ratio = Gauge(
+    "embrapa_cache_hit_ratio",
+    "Fração das consultas ao cache respondidas com valor fresco.",
+    func=lambda: response_cache.stats()["hit_ratio"],
+)
+cache_entries = Gauge(
+    "embrapa_cache_entries",
+    "Respostas armazenadas no cache.",
+    func=lambda: len(response_cache),
+)
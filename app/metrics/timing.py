@@ -0,0 +1,138 @@
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+
+from app.config.settings import SERVER_TIMING_ENABLED
+
+# Tempos da requisição atual; None quando o Server-Timing está desligado
+_current = ContextVar("request_timing", default=None)
+
+
+class RequestTiming:
+    """Tempos acumulados por fase (em segundos) de uma requisição."""
+
+    def __init__(self):
+        self.phases = {}
+        # Fases de um intervalo de anos são gravadas pelo threadpool
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.endpoint_done = None
+
+    def record(self, name, seconds):
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def header(self):
+        """
+        Monta o valor do header Server-Timing, com as durações em ms.
+        Fases repetidas (ex: vários anos de um intervalo) são somadas.
+        """
+        total = time.perf_counter() - self.started
+        with self._lock:
+            items = [*self.phases.items(), ("total", total)]
+        return ", ".join(
+            f"{name};dur={seconds * 1000:.1f}" for name, seconds in items
+        )
+
+
+@contextmanager
+def phase(name):
+    """Mede um trecho da requisição atual como a fase `name`."""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.record(name, time.perf_counter() - started)
+
+
+def _mark_endpoint_done():
+    timing = _current.get()
+    if timing is not None:
+        timing.endpoint_done = time.perf_counter()
+
+
+def timed_endpoint(endpoint):
+    """
+    Envolve o endpoint para marcar quando ele retorna: o intervalo até a
+    renderização da resposta é a validação do response_model.
+    """
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _mark_endpoint_done()
+
+    else:
+
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                _mark_endpoint_done()
+
+    return wrapper
+
+
+class TimedRoute(APIRoute):
+    """Rota que registra as fases de validação e serialização."""
+
+    def __init__(self, path, endpoint, **kwargs):
+        super().__init__(path, timed_endpoint(endpoint), **kwargs)
+
+
+class TimedJSONResponse(JSONResponse):
+    """Resposta JSON que mede a validação e a serialização do corpo."""
+
+    def render(self, content):
+        timing = _current.get()
+        if timing is None:
+            return super().render(content)
+        if timing.endpoint_done is not None:
+            timing.record(
+                "validate", time.perf_counter() - timing.endpoint_done
+            )
+        with phase("serialize"):
+            return super().render(content)
+
+
+class ServerTimingMiddleware:
+    """
+    Middleware ASGI que abre o registro de tempos de cada requisição e
+    adiciona o header `Server-Timing` à resposta.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not SERVER_TIMING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        timing = RequestTiming()
+        token = _current.set(timing)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timing.header())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
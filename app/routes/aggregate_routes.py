@@ -0,0 +1,190 @@
+import math
+from http import HTTPStatus
+
+from fastapi import APIRouter, HTTPException, Path, Query
+
+from app.dataset.cube import data_cubes, measures
+from app.dataset.series_index import GROUP_FIELDS, AmbiguousSeriesError
+from app.metrics.timing import TimedRoute
+from app.schemas.invocation_parameters_schema import (
+    AbaSchema,
+    ItemAgregadoQueryParams,
+)
+from app.schemas.responses_schema import (
+    ItemAgregadoResponseSchema,
+    TopResponseSchema,
+    TotaisResponseSchema,
+)
+
+router = APIRouter(route_class=TimedRoute)
+
+
+def get_cube(aba, sub_aba, medida):
+    """
+    Busca o cubo da (aba, sub_aba) e resolve a medida pedida (por
+    padrão, a primeira medida da aba).
+
+    Returns:
+        tuple: (DataCube, medida).
+
+    Raises:
+        HTTPException: 404 se não houver dados e 422 se a medida não
+            existir na aba.
+    """
+    nomes = measures(aba.value)
+    medida = medida or nomes[0]
+    if medida not in nomes:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail=f"Medida inválida para {aba.value}: use {nomes}",
+        )
+    cube = data_cubes.get(aba, sub_aba)
+    if cube is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f"Sem dados para {aba.value}/{sub_aba}",
+        )
+    return cube, medida
+
+
+@router.get(
+    "/agregados/{aba}/totais",
+    status_code=HTTPStatus.OK,
+    response_model=TotaisResponseSchema,
+    description=(
+        "Totais anuais de uma medida e crescimento em relação ao ano "
+        "anterior, calculados sobre o cubo do dataset local."
+    ),
+)
+def get_totais(
+    aba: AbaSchema = Path(..., description="Aba agregada"),
+    sub_aba: str | None = Query(None, description="Sub-aba, se houver"),
+    medida: str | None = Query(None, description="Ex: quantidade_kg"),
+    de: int | None = Query(None, description="Ano inicial"),
+    ate: int | None = Query(None, description="Ano final"),
+):
+    """
+    Obtém os totais por ano e o crescimento ano a ano de uma medida.
+
+    Args:
+        aba (AbaSchema): Aba agregada.
+        sub_aba (str): Sub-aba, obrigatória nas abas que a possuem.
+        medida (str): Medida somada.
+        de (int): Ano inicial opcional.
+        ate (int): Ano final opcional.
+
+    Returns:
+        dict: Medida e lista de totais por ano.
+    """
+    cube, medida = get_cube(aba, sub_aba, medida)
+    anos, totais, crescimento = cube.growth(medida, de, ate)
+    return {
+        "medida": medida,
+        "data": [
+            {
+                "ano": int(ano),
+                "total": int(total),
+                "crescimento": None if math.isnan(taxa) else float(taxa),
+            }
+            for ano, total, taxa in zip(anos, totais, crescimento)
+        ],
+    }
+
+
+@router.get(
+    "/agregados/{aba}/top",
+    status_code=HTTPStatus.OK,
+    response_model=TopResponseSchema,
+    description=(
+        "Maiores itens (produtos, cultivos ou países) de um ano por uma "
+        "medida, calculados sobre o cubo do dataset local."
+    ),
+)
+def get_top(
+    aba: AbaSchema = Path(..., description="Aba agregada"),
+    ano: int = Query(..., description="Ano consultado"),
+    n: int = Query(10, ge=1, le=100, description="Quantidade de itens"),
+    sub_aba: str | None = Query(None, description="Sub-aba, se houver"),
+    medida: str | None = Query(None, description="Ex: valor_dolar"),
+):
+    """
+    Obtém os N maiores itens de um ano pela medida escolhida.
+
+    Args:
+        aba (AbaSchema): Aba agregada.
+        ano (int): Ano consultado.
+        n (int): Quantidade máxima de itens.
+        sub_aba (str): Sub-aba, obrigatória nas abas que a possuem.
+        medida (str): Medida usada na ordenação.
+
+    Returns:
+        dict: Medida e itens em ordem decrescente.
+    """
+    cube, medida = get_cube(aba, sub_aba, medida)
+    return {
+        "medida": medida,
+        "data": [
+            {"grupo": grupo, "item": item, "valor": int(valor)}
+            for (grupo, item), valor in cube.top(medida, ano, n)
+        ],
+    }
+
+
+@router.get(
+    "/agregados/{aba}/itens/{item}",
+    status_code=HTTPStatus.OK,
+    response_model=ItemAgregadoResponseSchema,
+    description=(
+        "Valores anuais de uma medida para um item (produto, cultivo ou "
+        "país), fatiados diretamente do cubo do dataset local."
+    ),
+)
+def get_item(
+    aba: AbaSchema = Path(..., description="Aba agregada"),
+    item: str = Path(..., description="Produto, cultivo ou país"),
+    params: ItemAgregadoQueryParams = Query(),
+):
+    """
+    Obtém os valores de um item ano a ano, com uma busca direta pela
+    coluna do item no cubo.
+
+    Args:
+        aba (AbaSchema): Aba agregada.
+        item (str): Item, sem diferenciar acentos e caixa.
+        params (ItemAgregadoQueryParams): Sub-aba, grupo (tipo de
+            produto ou de uva, se o nome for ambíguo), medida e anos
+            inicial e final opcionais.
+
+    Returns:
+        dict: Medida, item e valores por ano.
+    """
+    cube, medida = get_cube(aba, params.sub_aba, params.medida)
+    try:
+        fatia = cube.slice(medida, item, params.grupo, params.de, params.ate)
+    except AmbiguousSeriesError as e:
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail=(
+                f"'{item}' existe em mais de um grupo em {aba.value}; "
+                f"informe {GROUP_FIELDS[aba.value]}: {', '.join(e.grupos)}"
+            ),
+        ) from e
+    if fatia is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=(
+                f"Item '{item}' não encontrado em {aba.value}/{params.sub_aba}"
+            ),
+        )
+    anos, valores = fatia
+    return {
+        "medida": medida,
+        "item": item,
+        "data": [
+            {
+                "ano": int(ano),
+                "valor": None if math.isnan(valor) else int(valor),
+            }
+            for ano, valor in zip(anos, valores)
+        ],
+    }
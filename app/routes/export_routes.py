@@ -0,0 +1,110 @@
+import json
+from http import HTTPStatus
+
+from fastapi import APIRouter, Path, Query, Response
+from fastapi.responses import StreamingResponse
+
+from app.dataset.columnar import export_aba
+from app.dataset.dataset import iter_dataset
+from app.metrics.timing import TimedRoute
+from app.schemas.invocation_parameters_schema import (
+    AbaSchema,
+    FormatoColunarSchema,
+)
+
+router = APIRouter(route_class=TimedRoute)
+
+
+def iter_export_lines(aba=None):
+    """
+    Gera o dataset em NDJSON, uma linha por registro marcada com aba,
+    sub_aba e ano. Lê o fallback local chave a chave e, quando houver,
+    usa a versão mais recente do cache.
+
+    Args:
+        aba (str): Restringe a exportação a uma aba.
+
+    Yields:
+        str: Bloco de linhas NDJSON de uma chave (aba, sub_aba, ano).
+    """
+    for key, data in iter_dataset(aba):
+        aba_key, sub_aba, ano = key
+        tag = {"aba": aba_key, "sub_aba": sub_aba, "ano": ano}
+        yield "".join(
+            json.dumps({**tag, **record}, ensure_ascii=False) + "\n"
+            for record in data
+        )
+
+
+@router.get(
+    "/export",
+    status_code=HTTPStatus.OK,
+    response_class=StreamingResponse,
+    description=(
+        "Exporta todo o dataset em NDJSON (uma linha JSON por registro, "
+        "com aba, sub_aba e ano), transmitido à medida que é lido."
+    ),
+)
+def export_ndjson(
+    aba: AbaSchema | None = Query(
+        None, description="Exporta apenas a aba informada"
+    ),
+):
+    """
+    Exporta o dataset completo em streaming NDJSON.
+
+    Args:
+        aba (AbaSchema): Aba opcional para filtrar a exportação.
+
+    Returns:
+        StreamingResponse: Corpo NDJSON gerado sob demanda.
+    """
+    return StreamingResponse(
+        iter_export_lines(aba.value if aba else None),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/export/{aba}",
+    status_code=HTTPStatus.OK,
+    response_class=Response,
+    responses={
+        HTTPStatus.OK.value: {
+            "content": {
+                "application/vnd.apache.parquet": {},
+                "application/vnd.apache.arrow.file": {},
+            }
+        }
+    },
+    description=(
+        "Exporta uma aba em formato colunar (Parquet ou Arrow IPC), com "
+        "colunas tipadas e textos em dictionary encoding."
+    ),
+)
+def export_colunar(
+    aba: AbaSchema = Path(..., description="Aba exportada"),
+    formato: FormatoColunarSchema = Query(
+        FormatoColunarSchema.PARQUET, description="Formato do arquivo"
+    ),
+):
+    """
+    Exporta uma aba do dataset local em Parquet ou Arrow IPC.
+
+    Args:
+        aba (AbaSchema): Aba exportada.
+        formato (FormatoColunarSchema): 'parquet' ou 'arrow'.
+
+    Returns:
+        Response: Arquivo para download.
+    """
+    content, media_type = export_aba(aba.value, formato.value)
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{aba.value}.{formato.value}"'
+            )
+        },
+    )
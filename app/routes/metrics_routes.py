@@ -0,0 +1,33 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.metrics.metrics import default_registry
+from app.metrics.timing import TimedRoute
+
+router = APIRouter(route_class=TimedRoute)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get(
+    "/metrics",
+    status_code=HTTPStatus.OK,
+    response_class=PlainTextResponse,
+    description=(
+        "Métricas da API no formato do Prometheus: latência e volume das "
+        "consultas à Embrapa, tempo de extração, uso do cache e respostas "
+        "servidas pelo fallback."
+    ),
+)
+def get_metrics():
+    """
+    Expõe as métricas coletadas desde o início do processo.
+
+    Returns:
+        PlainTextResponse: Métricas em text format 0.0.4.
+    """
+    return PlainTextResponse(
+        default_registry.render(), media_type=CONTENT_TYPE
+    )
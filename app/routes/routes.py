@@ -1,23 +1,63 @@
+import asyncio
 import logging
+import time
 from http import HTTPStatus
 
-import requests
-from fastapi import APIRouter, HTTPException, Path, Response
+import httpx
+from fastapi import APIRouter, HTTPException, Path, Query, Response
+from starlette.concurrency import run_in_threadpool
 
-from app.fallback.fallback_handler import get_fallback_data
+from app.cache.encoded_body import (
+    EncodedJSONResponse,
+    body_cache,
+    trusted_response,
+)
+from app.cache.http_cache import FALLBACK_CACHE_CONTROL, cache_control
+from app.cache.response_cache import cache_key, cache_ttl, response_cache
+from app.cache.single_flight import upstream_flight
+from app.client.circuit_breaker import CircuitOpenError
+from app.client.embrapa_client import fetch_page
+from app.config.settings import (
+    CACHE_SWR_ENABLED,
+    LATENCY_BUDGET,
+    LATENCY_BUDGETS,
+    RANGE_MAX_CONCURRENCY,
+    SWR_MAX_CONCURRENCY,
+)
+from app.fallback.fallback_handler import (
+    get_fallback_body,
+    get_fallback_data,
+)
 from app.mapper.url_mapper import URLMapper
+from app.metrics.metrics import (
+    parse_duration,
+    upstream_duration,
+    upstream_in_flight,
+    upstream_requests,
+)
+from app.metrics.timing import TimedRoute, phase
 from app.schemas.invocation_parameters_schema import (
     ComercializacaoPathParams,
     ExportacaoPathParams,
+    ExportacaoSubAbaPathParams,
     ImportacaoPathParams,
+    ImportacaoSubAbaPathParams,
+    IntervaloAte2023QueryParams,
+    IntervaloAte2024QueryParams,
     ProcessamentoPathParams,
+    ProcessamentoSubAbaPathParams,
     ProducaoPathParams,
 )
 from app.schemas.responses_schema import (
+    ComercializacaoIntervaloResponseSchema,
     ComercializacaoResponseSchema,
+    ExportacaoIntervaloResponseSchema,
     ExportacaoResponseSchema,
+    ImportacaoIntervaloResponseSchema,
     ImportacaoResponseSchema,
+    ProcessamentoIntervaloResponseSchema,
     ProcessamentoResponseSchema,
+    ProducaoIntervaloResponseSchema,
     ProducaoResponseSchema,
 )
 from app.scrapper.scrapping import (
@@ -29,15 +69,165 @@ from app.scrapper.scrapping import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 Embrapa_URL_Builder = URLMapper()
 
 
-def fetch_and_extract(option, suboption, year, extract_func):
+# Revalidações em segundo plano, por chave (stale-while-revalidate)
+_revalidations = {}
+
+
+async def _timed_fetch(option, url):
+    # Timeouts e erros também entram no histograma: são a cauda que
+    # orienta o ajuste dos timeouts. Recusas do circuit breaker não
+    # chegam à Embrapa e só são contadas.
+    started = time.perf_counter()
+    outcome = "error"
+    with upstream_in_flight.track_inprogress():
+        try:
+            response = await fetch_page(url)
+            outcome = "ok"
+            return response
+        except CircuitOpenError:
+            outcome = "circuit_open"
+            raise
+        except (asyncio.TimeoutError, httpx.TimeoutException):
+            outcome = "timeout"
+            raise
+        finally:
+            upstream_requests.labels(option, outcome).inc()
+            if outcome != "circuit_open":
+                upstream_duration.labels(option).observe(
+                    time.perf_counter() - started
+                )
+
+
+def _timed_extract(option, extract_func, response):
+    with parse_duration.labels(option).time():
+        return extract_func(response)
+
+
+async def _fetch_upstream(key, option, suboption, year, extract_func):
+    async def _fetch():
+        request_url = Embrapa_URL_Builder.build_url(
+            option=option, suboption=suboption, year=year
+        )
+        with phase("fetch"):
+            request_response = await _timed_fetch(option, request_url)
+        with phase("parse"):
+            extracted_data = await run_in_threadpool(
+                _timed_extract, option, extract_func, request_response
+            )
+        result = {"data": extracted_data}
+        response_cache.set(key, result, ttl=cache_ttl(option, year))
+        return result
+
+    return await upstream_flight.do(key, _fetch)
+
+
+async def _revalidate(key, option, suboption, year, extract_func):
+    try:
+        await _fetch_upstream(key, option, suboption, year, extract_func)
+    except Exception as e:
+        logger.warning(f"Falha ao revalidar {key}: {e}")
+
+
+def _schedule_revalidation(key, option, suboption, year, extract_func):
+    """
+    Agenda a atualização de uma chave stale em segundo plano. Se o
+    limite de revalidações simultâneas for atingido, a chave será
+    revalidada em uma próxima requisição.
+    """
+    if key in _revalidations or len(_revalidations) >= SWR_MAX_CONCURRENCY:
+        return
+    task = asyncio.ensure_future(
+        _revalidate(key, option, suboption, year, extract_func)
+    )
+    _revalidations[key] = task
+    task.add_done_callback(lambda _: _revalidations.pop(key, None))
+
+
+def _mark_fallback(response):
+    if response is not None:
+        response.headers["X-Fallback"] = "true"
+        response.headers["Cache-Control"] = FALLBACK_CACHE_CONTROL
+
+
+def _set_cache_headers(response, entry):
+    if response is not None:
+        response.headers["Age"] = str(int(entry.age))
+        response.headers["X-Cache"] = "HIT" if entry.fresh else "STALE"
+
+
+def _route_headers(response):
+    # Repassa os headers definidos na rota (Cache-Control, X-Cache...)
+    if response is None:
+        return None
+    return {
+        name: value
+        for name, value in response.headers.items()
+        if name not in {"content-length", "content-type"}
+    }
+
+
+def _json_response(body, response):
+    return EncodedJSONResponse(body, headers=_route_headers(response))
+
+
+async def cached_response(aba, params, result, schema, response=None):
+    """
+    Responde com o JSON pré-serializado (e pré-comprimido) do resultado
+    da chave. Enquanto o valor em cache não muda, os mesmos bytes são
+    reaproveitados, sem validar nem serializar de novo; a codificação
+    (validação, JSON e compressão) roda em uma thread.
+
+    Args:
+        aba (str): Aba consultada.
+        params (BaseModel): Parâmetros da rota (sub_aba e ano).
+        result (dict): Valor devolvido por `fetch_and_extract`.
+        schema (type[BaseModel]): response_model da rota.
+        response (Response): Resposta da rota, com os headers a repassar.
+
+    Returns:
+        EncodedJSONResponse: Resposta com a codificação negociada.
+    """
+    sub_aba = getattr(params, "sub_aba", None)
+    key = ("cache", *cache_key(aba, sub_aba, params.ano))
+    body = body_cache.get(key, result)
+    if body is None:
+        body = await run_in_threadpool(
+            body_cache.get_or_encode, key, result, result, schema
+        )
+    return _json_response(body, response)
+
+
+async def fallback_response(aba, params, schema, response=None):
+    """Responde com o JSON pré-serializado do fallback da chave."""
+    body = await run_in_threadpool(get_fallback_body, aba, params, schema)
+    return _json_response(body, response)
+
+
+async def fetch_and_extract(
+    option, suboption, year, extract_func, response=None
+):
     """
     Realiza a requisição à URL construída e extrai os dados
     utilizando a função de extração fornecida.
 
+    A requisição é feita de forma assíncrona e a extração (CPU) roda
+    em uma thread, para não bloquear o event loop. Resultados válidos
+    ficam no cache em memória pelo TTL definido para a aba e o ano.
+    Chamadas simultâneas para a mesma chave compartilham uma única
+    requisição e extração.
+
+    Com stale-while-revalidate ativo, uma entrada expirada é devolvida
+    na hora e atualizada em segundo plano.
+
+    A espera pelo upstream é limitada pelo orçamento de latência da
+    rota. Esgotado o orçamento, devolve a entrada stale do cache, se
+    houver, ou falha para que a rota use o fallback; a busca continua
+    em segundo plano e atualiza o cache.
+
     Args:
         option (str): Opção principal da consulta
             (ex: 'producao', 'processamento').
@@ -45,22 +235,99 @@ def fetch_and_extract(option, suboption, year, extract_func):
         year (int): Ano de referência.
         extract_func (callable): Função responsável por extrair
             os dados da resposta.
+        response (Response): Resposta HTTP, para o header
+            `Cache-Control` e, quando o valor vem do cache, `Age` e
+            `X-Cache`.
 
     Returns:
         dict: Dados extraídos da resposta.
     """
-    try:
-        request_url = Embrapa_URL_Builder.build_url(
-            option=option, suboption=suboption, year=year
+    key = cache_key(option, suboption, year)
+    if response is not None:
+        response.headers["Cache-Control"] = cache_control(option, year)
+    entry = response_cache.lookup(key)
+    if entry is not None and (entry.fresh or CACHE_SWR_ENABLED):
+        if not entry.fresh:
+            _schedule_revalidation(key, option, suboption, year, extract_func)
+        _set_cache_headers(response, entry)
+        return entry.value
+
+    budget = LATENCY_BUDGETS.get(option, LATENCY_BUDGET)
+    fetch = asyncio.ensure_future(
+        _fetch_upstream(key, option, suboption, year, extract_func)
+    )
+    # Estourado o orçamento, a busca segue e preenche o cache
+    fetch.add_done_callback(lambda t: t.cancelled() or t.exception())
+    done, _ = await asyncio.wait({fetch}, timeout=budget)
+    if not done:
+        if entry is not None:
+            logger.warning(f"Orçamento de latência esgotado para {key}")
+            _set_cache_headers(response, entry)
+            return entry.value
+        raise HTTPException(
+            status_code=HTTPStatus.GATEWAY_TIMEOUT,
+            detail="Orçamento de latência esgotado",
         )
-        request_response = requests.get(request_url)
-        request_response.raise_for_status()
-        extracted_data = extract_func(request_response)
-        return {"data": extracted_data}
+    try:
+        return fetch.result()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def fetch_year_range(
+    aba, anos, extract_func, params_factory, response=None
+):
+    """
+    Busca vários anos de uma aba em paralelo, limitado por
+    RANGE_MAX_CONCURRENCY, reaproveitando `fetch_and_extract` (cache e
+    coalescência). Anos que falharem usam o fallback local.
+
+    Args:
+        aba (str): Aba consultada (ex: 'producao').
+        anos (range): Anos a buscar.
+        extract_func (callable): Função de extração da aba.
+        params_factory (callable): Monta os parâmetros de um ano
+            (sub_aba e ano), usados na busca e no fallback.
+        response (Response): Resposta HTTP, para os headers
+            `Cache-Control` e `X-Fallback`.
+
+    Returns:
+        dict: Dados por ano, no formato {"data": {ano: registros}}.
+    """
+    semaphore = asyncio.Semaphore(RANGE_MAX_CONCURRENCY)
+
+    async def _fetch_year(ano):
+        params = params_factory(ano)
+        sub_aba = getattr(params, "sub_aba", None)
+        async with semaphore:
+            try:
+                result = await fetch_and_extract(
+                    option=aba,
+                    suboption=sub_aba,
+                    year=ano,
+                    extract_func=extract_func,
+                )
+                return ano, result["data"], False
+            except Exception as e:
+                logger.warning(
+                    f"Usando fallback para {aba} {sub_aba} {ano}: {e}"
+                )
+                fallback = await run_in_threadpool(
+                    get_fallback_data, aba, params
+                )
+                return ano, fallback["data"], True
+
+    results = await asyncio.gather(*[_fetch_year(ano) for ano in anos])
+    fallback_anos = [str(ano) for ano, _, fallback in results if fallback]
+    if response is not None:
+        # O ano mais recente tem a política mais curta do intervalo
+        response.headers["Cache-Control"] = cache_control(aba, max(anos))
+    if response and fallback_anos:
+        _mark_fallback(response)
+        response.headers["X-Fallback-Anos"] = ",".join(fallback_anos)
+    return {"data": {ano: data for ano, data, _ in results}}
+
+
 @router.get(
     "/",
     status_code=HTTPStatus.OK,
@@ -101,19 +368,23 @@ async def get_producao(
     """
     aba = "producao"
     try:
-        result = fetch_and_extract(
+        result = await fetch_and_extract(
             option=aba,
             suboption=None,
             year=params.ano,
             extract_func=extract_producao_data,
+            response=response,
+        )
+        return await cached_response(
+            aba, params, result, ProducaoResponseSchema, response
         )
-        return result
 
     except Exception as e:
         logger.warning(f"Usando fallback para {aba} {params.ano}: {e}")
-        if response:
-            response.headers["X-Fallback"] = "true"
-        return get_fallback_data(aba, params)
+        _mark_fallback(response)
+        return await fallback_response(
+            aba, params, ProducaoResponseSchema, response
+        )
 
 
 @router.get(
@@ -143,19 +414,24 @@ async def get_processamento(
     """
     aba = "processamento"
     try:
-        return fetch_and_extract(
+        result = await fetch_and_extract(
             option=aba,
             suboption=params.sub_aba,
             year=params.ano,
             extract_func=extract_processamento_data,
+            response=response,
+        )
+        return await cached_response(
+            aba, params, result, ProcessamentoResponseSchema, response
         )
     except Exception as e:
         logger.warning(
             f"Usando fallback para {aba} {params.sub_aba} {params.ano}: {e}"
         )
-        if response:
-            response.headers["X-Fallback"] = "true"
-        return get_fallback_data(aba, params)
+        _mark_fallback(response)
+        return await fallback_response(
+            aba, params, ProcessamentoResponseSchema, response
+        )
 
 
 @router.get(
@@ -185,17 +461,22 @@ async def get_comercializacao(
     """
     aba = "comercializacao"
     try:
-        return fetch_and_extract(
+        result = await fetch_and_extract(
             option=aba,
             suboption=None,
             year=params.ano,
             extract_func=extract_comercializacao_data,
+            response=response,
+        )
+        return await cached_response(
+            aba, params, result, ComercializacaoResponseSchema, response
         )
     except Exception as e:
         logger.warning(f"Usando fallback para {aba} {params.ano}: {e}")
-        if response:
-            response.headers["X-Fallback"] = "true"
-        return get_fallback_data(aba, params)
+        _mark_fallback(response)
+        return await fallback_response(
+            aba, params, ComercializacaoResponseSchema, response
+        )
 
 
 @router.get(
@@ -224,19 +505,24 @@ async def get_importacao_(
     """
     aba = "importacao"
     try:
-        return fetch_and_extract(
+        result = await fetch_and_extract(
             option=aba,
             suboption=params.sub_aba,
             year=params.ano,
             extract_func=extract_import_export_data,
+            response=response,
+        )
+        return await cached_response(
+            aba, params, result, ImportacaoResponseSchema, response
         )
     except Exception as e:
         logger.warning(
             f"Usando fallback para {aba} {params.sub_aba} {params.ano}: {e}"
         )
-        if response:
-            response.headers["X-Fallback"] = "true"
-        return get_fallback_data(aba, params)
+        _mark_fallback(response)
+        return await fallback_response(
+            aba, params, ImportacaoResponseSchema, response
+        )
 
 
 @router.get(
@@ -265,16 +551,209 @@ async def get_exportacao(
     """
     aba = "exportacao"
     try:
-        return fetch_and_extract(
+        result = await fetch_and_extract(
             option=aba,
             suboption=params.sub_aba,
             year=params.ano,
             extract_func=extract_import_export_data,
+            response=response,
+        )
+        return await cached_response(
+            aba, params, result, ExportacaoResponseSchema, response
         )
     except Exception as e:
         logger.warning(
             f"Usando fallback para {aba} {params.sub_aba} {params.ano}: {e}"
         )
-        if response:
-            response.headers["X-Fallback"] = "true"
-        return get_fallback_data(aba, params)
+        _mark_fallback(response)
+        return await fallback_response(
+            aba, params, ExportacaoResponseSchema, response
+        )
+
+
+@router.get(
+    "/producao",
+    status_code=HTTPStatus.OK,
+    response_model=ProducaoIntervaloResponseSchema,
+    description=(
+        "Obtém dados de produção da vitivinicultura para um intervalo de "
+        "anos, buscados em paralelo. Retorna os dados agrupados por ano."
+    ),
+)
+async def get_producao_intervalo(
+    params: IntervaloAte2023QueryParams = Query(),
+    response: Response = None,
+):
+    """
+    Obtém dados de produção para o intervalo de anos informado.
+
+    Args:
+        params (IntervaloAte2023QueryParams): Parâmetros 'de' e 'ate'
+            (anos inicial e final, inclusive).
+
+    Returns:
+        FastJSONResponse: Dados de produção por ano.
+    """
+    data = await fetch_year_range(
+        aba="producao",
+        anos=params.anos(),
+        extract_func=extract_producao_data,
+        params_factory=lambda ano: ProducaoPathParams(ano=ano),
+        response=response,
+    )
+    return trusted_response(
+        data, ProducaoIntervaloResponseSchema, _route_headers(response)
+    )
+
+
+@router.get(
+    "/processamento/{sub_aba}",
+    status_code=HTTPStatus.OK,
+    response_model=ProcessamentoIntervaloResponseSchema,
+    description=(
+        "Obtém dados de processamento da vitivinicultura para um intervalo "
+        "de anos, buscados em paralelo. Retorna os dados agrupados por ano."
+    ),
+)
+async def get_processamento_intervalo(
+    path: ProcessamentoSubAbaPathParams = Path(...),
+    params: IntervaloAte2023QueryParams = Query(),
+    response: Response = None,
+):
+    """
+    Obtém dados de processamento para o intervalo de anos informado.
+
+    Args:
+        path (ProcessamentoSubAbaPathParams): Parâmetro 'sub_aba'.
+        params (IntervaloAte2023QueryParams): Parâmetros 'de' e 'ate'
+            (anos inicial e final, inclusive).
+
+    Returns:
+        FastJSONResponse: Dados de processamento por ano.
+    """
+    data = await fetch_year_range(
+        aba="processamento",
+        anos=params.anos(),
+        extract_func=extract_processamento_data,
+        params_factory=lambda ano: ProcessamentoPathParams(
+            sub_aba=path.sub_aba, ano=ano
+        ),
+        response=response,
+    )
+    return trusted_response(
+        data, ProcessamentoIntervaloResponseSchema, _route_headers(response)
+    )
+
+
+@router.get(
+    "/comercializacao",
+    status_code=HTTPStatus.OK,
+    response_model=ComercializacaoIntervaloResponseSchema,
+    description=(
+        "Obtém dados de comercialização da vitivinicultura para um "
+        "intervalo de anos, buscados em paralelo. Retorna os dados "
+        "agrupados por ano."
+    ),
+)
+async def get_comercializacao_intervalo(
+    params: IntervaloAte2023QueryParams = Query(),
+    response: Response = None,
+):
+    """
+    Obtém dados de comercialização para o intervalo de anos informado.
+
+    Args:
+        params (IntervaloAte2023QueryParams): Parâmetros 'de' e 'ate'
+            (anos inicial e final, inclusive).
+
+    Returns:
+        FastJSONResponse: Dados de comercialização por ano.
+    """
+    data = await fetch_year_range(
+        aba="comercializacao",
+        anos=params.anos(),
+        extract_func=extract_comercializacao_data,
+        params_factory=lambda ano: ComercializacaoPathParams(ano=ano),
+        response=response,
+    )
+    return trusted_response(
+        data, ComercializacaoIntervaloResponseSchema, _route_headers(response)
+    )
+
+
+@router.get(
+    "/importacao/{sub_aba}",
+    status_code=HTTPStatus.OK,
+    response_model=ImportacaoIntervaloResponseSchema,
+    description=(
+        "Obtém dados de importação da vitivinicultura para um intervalo "
+        "de anos, buscados em paralelo. Retorna os dados agrupados por ano."
+    ),
+)
+async def get_importacao_intervalo(
+    path: ImportacaoSubAbaPathParams = Path(...),
+    params: IntervaloAte2024QueryParams = Query(),
+    response: Response = None,
+):
+    """
+    Obtém dados de importação para o intervalo de anos informado.
+
+    Args:
+        path (ImportacaoSubAbaPathParams): Parâmetro 'sub_aba'.
+        params (IntervaloAte2024QueryParams): Parâmetros 'de' e 'ate'
+            (anos inicial e final, inclusive).
+
+    Returns:
+        FastJSONResponse: Dados de importação por ano.
+    """
+    data = await fetch_year_range(
+        aba="importacao",
+        anos=params.anos(),
+        extract_func=extract_import_export_data,
+        params_factory=lambda ano: ImportacaoPathParams(
+            sub_aba=path.sub_aba, ano=ano
+        ),
+        response=response,
+    )
+    return trusted_response(
+        data, ImportacaoIntervaloResponseSchema, _route_headers(response)
+    )
+
+
+@router.get(
+    "/exportacao/{sub_aba}",
+    status_code=HTTPStatus.OK,
+    response_model=ExportacaoIntervaloResponseSchema,
+    description=(
+        "Obtém dados de exportação da vitivinicultura para um intervalo "
+        "de anos, buscados em paralelo. Retorna os dados agrupados por ano."
+    ),
+)
+async def get_exportacao_intervalo(
+    path: ExportacaoSubAbaPathParams = Path(...),
+    params: IntervaloAte2024QueryParams = Query(),
+    response: Response = None,
+):
+    """
+    Obtém dados de exportação para o intervalo de anos informado.
+
+    Args:
+        path (ExportacaoSubAbaPathParams): Parâmetro 'sub_aba'.
+        params (IntervaloAte2024QueryParams): Parâmetros 'de' e 'ate'
+            (anos inicial e final, inclusive).
+
+    Returns:
+        FastJSONResponse: Dados de exportação por ano.
+    """
+    data = await fetch_year_range(
+        aba="exportacao",
+        anos=params.anos(),
+        extract_func=extract_import_export_data,
+        params_factory=lambda ano: ExportacaoPathParams(
+            sub_aba=path.sub_aba, ano=ano
+        ),
+        response=response,
+    )
+    return trusted_response(
+        data, ExportacaoIntervaloResponseSchema, _route_headers(response)
+    )
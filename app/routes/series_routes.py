@@ -0,0 +1,208 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, HTTPException, Path, Query
+
+from app.dataset.series_index import (
+    GROUP_FIELDS,
+    AmbiguousSeriesError,
+    series_index,
+)
+from app.metrics.timing import TimedRoute
+from app.schemas.invocation_parameters_schema import (
+    SubAbaExportacaoSchema,
+    SubAbaImportacaoSchema,
+    SubAbaProcessamentoSchema,
+)
+from app.schemas.responses_schema import (
+    ImportacaoExportacaoSerieResponseSchema,
+    ProcessamentoSerieResponseSchema,
+    ProdutoSerieResponseSchema,
+)
+
+router = APIRouter(route_class=TimedRoute)
+
+
+def get_serie(aba, sub_aba, item, grupo=None):
+    """
+    Busca no índice a série anual de um item, com uma única consulta
+    por (aba, sub_aba, grupo, item).
+
+    Returns:
+        dict: Pontos da série no formato {"data": [...]}.
+
+    Raises:
+        HTTPException: 409 se o item existir em mais de um grupo e o
+            grupo não for informado; 404 se não houver série.
+    """
+    try:
+        serie = series_index.get(aba, sub_aba, item, grupo)
+    except AmbiguousSeriesError as e:
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail=(
+                f"'{item}' existe em mais de um grupo em {aba}; informe "
+                f"{GROUP_FIELDS[aba]}: {', '.join(e.grupos)}"
+            ),
+        ) from e
+    if not serie:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f"Série não encontrada para '{item}' em {aba}",
+        )
+    return {"data": serie}
+
+
+@router.get(
+    "/series/producao/{produto}",
+    status_code=HTTPStatus.OK,
+    response_model=ProdutoSerieResponseSchema,
+    description=(
+        "Série anual de produção de um produto, a partir do índice "
+        "pré-calculado do dataset local."
+    ),
+)
+def get_serie_producao(
+    produto: str = Path(..., description="Produto (ex: Tinto)"),
+    tipo_produto: str | None = Query(
+        None,
+        description=(
+            "Tipo do produto (ex: Vinho De Mesa); obrigatório quando o "
+            "produto existe em mais de um tipo"
+        ),
+    ),
+):
+    """
+    Obtém a série de produção de um produto em todos os anos.
+
+    Args:
+        produto (str): Nome do produto, sem diferenciar acentos e caixa.
+        tipo_produto (str): Tipo de produto, se o nome for ambíguo.
+
+    Returns:
+        dict: Pontos da série ordenados por ano.
+    """
+    return get_serie("producao", None, produto, tipo_produto)
+
+
+@router.get(
+    "/series/processamento/{sub_aba}/cultivo/{cultivo}",
+    status_code=HTTPStatus.OK,
+    response_model=ProcessamentoSerieResponseSchema,
+    description=(
+        "Série anual de processamento de um cultivo, a partir do índice "
+        "pré-calculado do dataset local."
+    ),
+)
+def get_serie_processamento(
+    sub_aba: SubAbaProcessamentoSchema = Path(
+        ..., description="Sub-abas de processamento"
+    ),
+    cultivo: str = Path(..., description="Cultivo (ex: Merlot)"),
+    tipo_uva: str | None = Query(
+        None,
+        description=(
+            "Tipo de uva (ex: Tintas); obrigatório quando o cultivo "
+            "existe em mais de um tipo"
+        ),
+    ),
+):
+    """
+    Obtém a série de processamento de um cultivo em todos os anos.
+
+    Args:
+        sub_aba (SubAbaProcessamentoSchema): Sub-aba de processamento.
+        cultivo (str): Nome do cultivo, sem diferenciar acentos e caixa.
+        tipo_uva (str): Tipo de uva, se o nome for ambíguo.
+
+    Returns:
+        dict: Pontos da série ordenados por ano.
+    """
+    return get_serie("processamento", sub_aba, cultivo, tipo_uva)
+
+
+@router.get(
+    "/series/comercializacao/{produto}",
+    status_code=HTTPStatus.OK,
+    response_model=ProdutoSerieResponseSchema,
+    description=(
+        "Série anual de comercialização de um produto, a partir do índice "
+        "pré-calculado do dataset local."
+    ),
+)
+def get_serie_comercializacao(
+    produto: str = Path(..., description="Produto (ex: tinto)"),
+    tipo_produto: str | None = Query(
+        None,
+        description=(
+            "Tipo do produto (ex: Vinho De Mesa); obrigatório quando o "
+            "produto existe em mais de um tipo"
+        ),
+    ),
+):
+    """
+    Obtém a série de comercialização de um produto em todos os anos.
+
+    Args:
+        produto (str): Nome do produto, sem diferenciar acentos e caixa.
+        tipo_produto (str): Tipo de produto, se o nome for ambíguo.
+
+    Returns:
+        dict: Pontos da série ordenados por ano.
+    """
+    return get_serie("comercializacao", None, produto, tipo_produto)
+
+
+@router.get(
+    "/series/importacao/{sub_aba}/pais/{pais}",
+    status_code=HTTPStatus.OK,
+    response_model=ImportacaoExportacaoSerieResponseSchema,
+    description=(
+        "Série anual de importação de um país, a partir do índice "
+        "pré-calculado do dataset local."
+    ),
+)
+def get_serie_importacao(
+    sub_aba: SubAbaImportacaoSchema = Path(
+        ..., description="Sub-abas de importação"
+    ),
+    pais: str = Path(..., description="País (ex: Chile)"),
+):
+    """
+    Obtém a série de importação de um país em todos os anos.
+
+    Args:
+        sub_aba (SubAbaImportacaoSchema): Sub-aba de importação.
+        pais (str): Nome do país, sem diferenciar acentos e caixa.
+
+    Returns:
+        dict: Pontos da série ordenados por ano.
+    """
+    return get_serie("importacao", sub_aba, pais)
+
+
+@router.get(
+    "/series/exportacao/{sub_aba}/pais/{pais}",
+    status_code=HTTPStatus.OK,
+    response_model=ImportacaoExportacaoSerieResponseSchema,
+    description=(
+        "Série anual de exportação para um país, a partir do índice "
+        "pré-calculado do dataset local."
+    ),
+)
+def get_serie_exportacao(
+    sub_aba: SubAbaExportacaoSchema = Path(
+        ..., description="Sub-abas de exportação"
+    ),
+    pais: str = Path(..., description="País (ex: Paraguai)"),
+):
+    """
+    Obtém a série de exportação para um país em todos os anos.
+
+    Args:
+        sub_aba (SubAbaExportacaoSchema): Sub-aba de exportação.
+        pais (str): Nome do país, sem diferenciar acentos e caixa.
+
+    Returns:
+        dict: Pontos da série ordenados por ano.
+    """
+    return get_serie("exportacao", sub_aba, pais)
@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 ano_field_until_2023 = Field(
     ...,
@@ -17,6 +17,19 @@ ano_field_until_2024 = Field(
 )
 
 
+class AbaSchema(str, Enum):
+    PRODUCAO = "producao"
+    PROCESSAMENTO = "processamento"
+    COMERCIALIZACAO = "comercializacao"
+    IMPORTACAO = "importacao"
+    EXPORTACAO = "exportacao"
+
+
+class FormatoColunarSchema(str, Enum):
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
 class ProducaoPathParams(BaseModel):
     ano: int = ano_field_until_2023
 
@@ -66,3 +79,60 @@ class ExportacaoPathParams(BaseModel):
         ..., description="Sub-abas de exportação"
     )
     ano: int = ano_field_until_2024
+
+
+class ProcessamentoSubAbaPathParams(BaseModel):
+    sub_aba: SubAbaProcessamentoSchema = Field(
+        ..., description="Sub-abas de processamento"
+    )
+
+
+class ImportacaoSubAbaPathParams(BaseModel):
+    sub_aba: SubAbaImportacaoSchema = Field(
+        ..., description="Sub-abas de importação"
+    )
+
+
+class ExportacaoSubAbaPathParams(BaseModel):
+    sub_aba: SubAbaExportacaoSchema = Field(
+        ..., description="Sub-abas de exportação"
+    )
+
+
+class _IntervaloAnosQueryParams(BaseModel):
+    @model_validator(mode="after")
+    def valida_intervalo(self):
+        if self.de > self.ate:
+            raise ValueError("'de' deve ser menor ou igual a 'ate'")
+        return self
+
+    def anos(self):
+        return range(self.de, self.ate + 1)
+
+
+class IntervaloAte2023QueryParams(_IntervaloAnosQueryParams):
+    de: int = Field(
+        1970, ge=1970, le=2023, description="Ano inicial (1970 a 2023)"
+    )
+    ate: int = Field(
+        2023, ge=1970, le=2023, description="Ano final (1970 a 2023)"
+    )
+
+
+class IntervaloAte2024QueryParams(_IntervaloAnosQueryParams):
+    de: int = Field(
+        1970, ge=1970, le=2024, description="Ano inicial (1970 a 2024)"
+    )
+    ate: int = Field(
+        2024, ge=1970, le=2024, description="Ano final (1970 a 2024)"
+    )
+
+
+class ItemAgregadoQueryParams(BaseModel):
+    sub_aba: str | None = Field(None, description="Sub-aba, se houver")
+    grupo: str | None = Field(
+        None, description="Tipo do produto ou uva, se o nome for ambíguo"
+    )
+    medida: str | None = Field(None, description="Ex: valor_dolar")
+    de: int | None = Field(None, description="Ano inicial")
+    ate: int | None = Field(None, description="Ano final")
@@ -47,3 +47,104 @@ class ExportacaoResponseSchema(BaseModel):
     data: list[ImportacaoExportacaoSchema] = Field(
         ..., description="Lista de dados de exportacao"
     )
+
+
+class ProducaoIntervaloResponseSchema(BaseModel):
+    data: dict[int, list[ProdutoSchema]] = Field(
+        ..., description="Dados de produção por ano"
+    )
+
+
+class ProcessamentoIntervaloResponseSchema(BaseModel):
+    data: dict[int, list[ProcessamentoSchema]] = Field(
+        ..., description="Dados de processamento por ano"
+    )
+
+
+class ComercializacaoIntervaloResponseSchema(BaseModel):
+    data: dict[int, list[ProdutoSchema]] = Field(
+        ..., description="Dados de comercialização por ano"
+    )
+
+
+class ImportacaoIntervaloResponseSchema(BaseModel):
+    data: dict[int, list[ImportacaoExportacaoSchema]] = Field(
+        ..., description="Dados de importação por ano"
+    )
+
+
+class ExportacaoIntervaloResponseSchema(BaseModel):
+    data: dict[int, list[ImportacaoExportacaoSchema]] = Field(
+        ..., description="Dados de exportação por ano"
+    )
+
+
+class ProdutoSerieSchema(ProdutoSchema):
+    ano: int = Field(..., description="Ano de referência")
+
+
+class ProcessamentoSerieSchema(ProcessamentoSchema):
+    ano: int = Field(..., description="Ano de referência")
+
+
+class ImportacaoExportacaoSerieSchema(ImportacaoExportacaoSchema):
+    ano: int = Field(..., description="Ano de referência")
+
+
+class ProdutoSerieResponseSchema(BaseModel):
+    data: list[ProdutoSerieSchema] = Field(
+        ..., description="Série anual do produto"
+    )
+
+
+class ProcessamentoSerieResponseSchema(BaseModel):
+    data: list[ProcessamentoSerieSchema] = Field(
+        ..., description="Série anual do cultivo"
+    )
+
+
+class ImportacaoExportacaoSerieResponseSchema(BaseModel):
+    data: list[ImportacaoExportacaoSerieSchema] = Field(
+        ..., description="Série anual do país"
+    )
+
+
+class TotalAnualSchema(BaseModel):
+    ano: int = Field(..., description="Ano")
+    total: int = Field(..., description="Soma da medida no ano")
+    crescimento: float | None = Field(
+        None, description="Variação relativa ao ano anterior"
+    )
+
+
+class TotaisResponseSchema(BaseModel):
+    medida: str = Field(..., description="Medida agregada")
+    data: list[TotalAnualSchema] = Field(
+        ..., description="Totais e crescimento por ano"
+    )
+
+
+class TopItemSchema(BaseModel):
+    grupo: str | None = Field(None, description="Tipo do produto ou uva")
+    item: str = Field(..., description="Produto, cultivo ou país")
+    valor: int = Field(..., description="Valor da medida no ano")
+
+
+class TopResponseSchema(BaseModel):
+    medida: str = Field(..., description="Medida ordenada")
+    data: list[TopItemSchema] = Field(..., description="Maiores itens do ano")
+
+
+class ValorAnualSchema(BaseModel):
+    ano: int = Field(..., description="Ano")
+    valor: int | None = Field(
+        None, description="Valor da medida; nulo se o item não aparece"
+    )
+
+
+class ItemAgregadoResponseSchema(BaseModel):
+    medida: str = Field(..., description="Medida consultada")
+    item: str = Field(..., description="Produto, cultivo ou país")
+    data: list[ValorAnualSchema] = Field(
+        ..., description="Valores do item por ano"
+    )
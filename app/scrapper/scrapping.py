@@ -1,17 +1,26 @@
-from bs4 import BeautifulSoup
+from app.config.settings import SCRAPER_BACKEND
+from app.scrapper.table_parsers import get_backend
+
+SEM_CLASSIFICACAO = {"sem classificação", "sem classificacao"}
+
+
+def _table_rows(response, table_class):
+    return get_backend(SCRAPER_BACKEND)(response.text, table_class)
 
 
 def _parse_table(response, table_class, n_cols, row_parser, skip_header=False):
-    soup = BeautifulSoup(response.text, "html.parser")
-    table = soup.find("table", class_=table_class)
-    if not table:
+    return _parse_rows(
+        _table_rows(response, table_class), n_cols, row_parser, skip_header
+    )
+
+
+def _parse_rows(rows, n_cols, row_parser, skip_header=False):
+    if not rows:
         return []
-    rows = table.find_all("tr")
     if skip_header:
         rows = rows[1:]
     result = []
-    for row in rows:
-        cols = row.find_all("td")
+    for cols in rows:
         if len(cols) != n_cols:
             continue
         parsed = row_parser(cols)
@@ -45,60 +54,57 @@ def extract_producao_data(response):
     )
 
 
+def _sem_classificacao_row_parser(cols):
+    cultivar = cols[0].get_text(strip=True)
+    quantidade = cols[1].get_text(strip=True)
+    td_classes = cols[0].get("class", [])
+    if "tb_item" in td_classes and cultivar.strip().lower() in (
+        SEM_CLASSIFICACAO
+    ):
+        try:
+            valor = int(
+                quantidade.replace(".", "").replace(" ", "").replace("-", "0")
+            )
+        except Exception:
+            valor = 0
+        return {
+            "tipo_uva": cultivar.title(),
+            "cultivo": cultivar,
+            "quantidade_kg": valor,
+        }
+    return None
+
+
 def extract_processamento_sem_classificacao(response):
     """
     Extrai dados de processamento para tabelas de 'Sem classificação',
     onde só existe uma linha tb_item com o valor.
     """
+    return _parse_table(
+        response, "tb_base tb_dados", 2, _sem_classificacao_row_parser
+    )
 
-    def row_parser(cols):
-        cultivar = cols[0].get_text(strip=True)
-        quantidade = cols[1].get_text(strip=True)
-        td_classes = cols[0].get("class", [])
-        if "tb_item" in td_classes and cultivar.strip().lower() in {
-            "sem classificação",
-            "sem classificacao",
-        }:
-            try:
-                valor = int(
-                    quantidade.replace(".", "")
-                    .replace(" ", "")
-                    .replace("-", "0")
-                )
-            except Exception:
-                valor = 0
-            return {
-                "tipo_uva": cultivar.title(),
-                "cultivo": cultivar,
-                "quantidade_kg": valor,
-            }
-        return None
 
-    return [
-        row
-        for row in _parse_table(
-            response, "tb_base tb_dados", 2, row_parser, skip_header=False
-        )
-        if row
-    ]
+def _is_sem_classificacao(rows):
+    """Verifica se a primeira célula tb_item é 'Sem classificação'."""
+    for cols in rows:
+        for col in cols:
+            if "tb_item" in col.get("class", []):
+                return col.get_text(strip=True).lower() in SEM_CLASSIFICACAO
+    return False
 
 
 def extract_processamento_data(response):
     """
     Extrai dados de processamento para tabelas normais ou
     de 'Sem classificação'.
-    Se detectar que é 'Sem classificação', delega para a função específica.
+
+    A tabela é lida uma única vez: as mesmas linhas servem para detectar
+    o caso 'Sem classificação' e para extrair os registros.
     """
-    # Detecta se é "sem classificação" olhando a primeira linha de dados
-    soup = BeautifulSoup(response.text, "html.parser")
-    table = soup.find("table", class_="tb_base tb_dados")
-    if table:
-        first_td = table.find("td", class_="tb_item")
-        if first_td and first_td.get_text(strip=True).lower() in {
-            "sem classificação",
-            "sem classificacao",
-        }:
-            return extract_processamento_sem_classificacao(response)
+    rows = _table_rows(response, "tb_base tb_dados")
+    if rows and _is_sem_classificacao(rows):
+        return _parse_rows(rows, 2, _sem_classificacao_row_parser)
 
     current_group = {"value": None}
 
@@ -119,7 +125,7 @@ def extract_processamento_data(response):
             }
         return None
 
-    return _parse_table(response, "tb_base tb_dados", 2, row_parser)
+    return _parse_rows(rows, 2, row_parser)
 
 
 def extract_comercializacao_data(response):
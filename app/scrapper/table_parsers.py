@@ -0,0 +1,184 @@
+"""
+Backends de extração de tabelas HTML.
+
+Todos devolvem a tabela como uma lista de linhas (`<tr>`), cada uma com
+a lista de células (`<td>`), ou None se a tabela não existir. As células
+expõem a mesma interface mínima das tags do BeautifulSoup usada pelos
+extratores: `get(atributo, padrão)` e `get_text(strip=False)`.
+"""
+
+import re
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+except ImportError:  # pragma: no cover - dependência opcional
+    lxml = None
+
+
+def bs4_table_rows(html, table_class):
+    """Constrói a árvore completa com BeautifulSoup (backend original)."""
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table", class_=table_class)
+    if not table:
+        return None
+    return [row.find_all("td") for row in table.find_all("tr")]
+
+
+class Cell:
+    """Célula extraída pelo backend de streaming."""
+
+    __slots__ = ("attrs", "_texts")
+
+    def __init__(self, attrs):
+        self.attrs = attrs
+        self._texts = []
+
+    def get(self, name, default=None):
+        return self.attrs.get(name, default)
+
+    def get_text(self, strip=False):
+        if strip:
+            return "".join(t.strip() for t in self._texts if t.strip())
+        return "".join(self._texts)
+
+
+class _TableTokenizer(HTMLParser):
+    """Tokenizador que só monta linhas e células, sem árvore DOM."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self._row = None
+        self._cell = None
+        self._raw_text = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in {"script", "style"}:
+            # Como no BeautifulSoup, não fazem parte do texto da célula
+            self._raw_text = True
+        elif tag == "tr":
+            self._row = []
+            self._cell = None
+            self.rows.append(self._row)
+        elif tag == "td" and self._row is not None:
+            attrs = dict(attrs)
+            if "class" in attrs:
+                attrs["class"] = (attrs["class"] or "").split()
+            self._cell = Cell(attrs)
+            self._row.append(self._cell)
+
+    def handle_endtag(self, tag):
+        if tag in {"script", "style"}:
+            self._raw_text = False
+        elif tag == "td":
+            self._cell = None
+        elif tag == "tr":
+            self._row = None
+            self._cell = None
+
+    def handle_data(self, data):
+        if self._cell is not None and not self._raw_text:
+            self._cell._texts.append(data)
+
+
+# Comentários e scripts são consumidos para não confundir a busca
+_TABLE_TAG = re.compile(
+    r"<!--.*?-->|<script\b.*?</script\s*>|<(/?)table\b[^>]*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_CLASS_ATTR = re.compile(
+    r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE
+)
+
+
+def _find_table(html, table_class):
+    """
+    Localiza o trecho `<table class="...">...</table>` sem tokenizar o
+    restante da página, respeitando tabelas aninhadas.
+
+    Returns:
+        str | None: HTML da tabela ou None se não existir.
+    """
+    start = None
+    depth = 0
+    for match in _TABLE_TAG.finditer(html):
+        if match.group(1) is None:
+            continue
+        closing = match.group(1) == "/"
+        if start is None:
+            if closing:
+                continue
+            attr = _CLASS_ATTR.search(match.group(0))
+            if attr and next(g for g in attr.groups() if g is not None) == (
+                table_class
+            ):
+                start = match.start()
+                depth = 1
+            continue
+        depth += -1 if closing else 1
+        if depth == 0:
+            return html[start : match.end()]
+    return html[start:] if start is not None else None
+
+
+def stream_table_rows(html, table_class):
+    """
+    Recorta a tabela alvo por expressão regular e tokeniza apenas esse
+    trecho, montando as linhas em uma única passada.
+    """
+    fragment = _find_table(html, table_class)
+    if fragment is None:
+        return None
+    tokenizer = _TableTokenizer()
+    tokenizer.feed(fragment)
+    tokenizer.close()
+    return tokenizer.rows
+
+
+class _LxmlCell:
+    __slots__ = ("_element",)
+
+    def __init__(self, element):
+        self._element = element
+
+    def get(self, name, default=None):
+        value = self._element.get(name)
+        if value is None:
+            return default
+        return value.split() if name == "class" else value
+
+    def get_text(self, strip=False):
+        texts = self._element.itertext()
+        if strip:
+            return "".join(t.strip() for t in texts if t.strip())
+        return "".join(texts)
+
+
+def lxml_table_rows(html, table_class):
+    """Usa o parser em C do lxml sobre o trecho da tabela alvo."""
+    if lxml is None:
+        raise RuntimeError("Backend 'lxml' requer o pacote lxml instalado")
+    fragment = _find_table(html, table_class)
+    if fragment is None:
+        return None
+    table = lxml.html.fragment_fromstring(fragment)
+    return [
+        [_LxmlCell(td) for td in row.iter("td")] for row in table.iter("tr")
+    ]
+
+
+BACKENDS = {
+    "bs4": bs4_table_rows,
+    "stream": stream_table_rows,
+    "lxml": lxml_table_rows,
+}
+
+
+def get_backend(name):
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Invalid scraper backend: {name}") from None
@@ -0,0 +1,48 @@
+import pytest
+
+from app.cache.encoded_body import body_cache
+from app.cache.response_cache import response_cache
+from app.client.circuit_breaker import upstream_breaker
+from app.dataset.cube import data_cubes
+from app.dataset.series_index import series_index
+from app.fallback import fallback_handler
+from app.fallback.fallback_store import SqliteFallbackStore
+
+
+@pytest.fixture(autouse=True)
+def _valida_respostas(monkeypatch):
+    # Nos testes as respostas sempre passam pela validação completa
+    monkeypatch.setattr("app.cache.encoded_body.VALIDATE_RESPONSES", True)
+
+
+@pytest.fixture(autouse=True)
+def _limpa_cache():
+    response_cache.clear()
+    body_cache.clear()
+    upstream_breaker.reset()
+    yield
+    response_cache.clear()
+    body_cache.clear()
+    upstream_breaker.reset()
+
+
+@pytest.fixture
+def fallback_items():
+    """
+    Registros ((aba, sub_aba, ano), registros) gravados pelo fixture
+    `store`; sobrescreva no módulo de teste para trocar os dados.
+    """
+    return []
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch, fallback_items):
+    """Fallback SQLite temporário com `fallback_items`, usado pelas rotas."""
+    store = SqliteFallbackStore(str(tmp_path / "fallback.db"))
+    store.put_many(fallback_items)
+    monkeypatch.setattr(fallback_handler, "fallback_store", store)
+    series_index.invalidate()
+    data_cubes.invalidate()
+    yield store
+    series_index.invalidate()
+    data_cubes.invalidate()
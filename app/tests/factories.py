@@ -0,0 +1,10 @@
+def produto(tipo, produto, litros):
+    return {
+        "tipo_produto": tipo,
+        "produto": produto,
+        "quantidade_litros": litros,
+    }
+
+
+def pais(pais, kg, dolar):
+    return {"pais": pais, "quantidade_kg": kg, "valor_dolar": dolar}
@@ -18,13 +18,13 @@ def test_read_root():
 
 
 @patch("app.routes.routes.Embrapa_URL_Builder")
-@patch("app.routes.routes.requests.get")
-def test_get_producao_success(mock_requests_get, mock_url_builder):
+@patch("app.routes.routes.fetch_page")
+def test_get_producao_success(mock_fetch_page, mock_url_builder):
     mock_url_builder.build_url.return_value = "http://fake-url"
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
     mock_response.text = "<html></html>"
-    mock_requests_get.return_value = mock_response
+    mock_fetch_page.return_value = mock_response
 
     producao_mock = [
         {
@@ -44,13 +44,13 @@ def test_get_producao_success(mock_requests_get, mock_url_builder):
 
 
 @patch("app.routes.routes.Embrapa_URL_Builder")
-@patch("app.routes.routes.requests.get")
-def test_get_processamento_success(mock_requests_get, mock_url_builder):
+@patch("app.routes.routes.fetch_page")
+def test_get_processamento_success(mock_fetch_page, mock_url_builder):
     mock_url_builder.build_url.return_value = "http://fake-url"
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
     mock_response.text = "<html></html>"
-    mock_requests_get.return_value = mock_response
+    mock_fetch_page.return_value = mock_response
 
     processamento_mock = [
         {
@@ -75,13 +75,13 @@ def test_get_processamento_success(mock_requests_get, mock_url_builder):
 
 
 @patch("app.routes.routes.Embrapa_URL_Builder")
-@patch("app.routes.routes.requests.get")
-def test_get_comercializacao_success(mock_requests_get, mock_url_builder):
+@patch("app.routes.routes.fetch_page")
+def test_get_comercializacao_success(mock_fetch_page, mock_url_builder):
     mock_url_builder.build_url.return_value = "http://fake-url"
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
     mock_response.text = "<html></html>"
-    mock_requests_get.return_value = mock_response
+    mock_fetch_page.return_value = mock_response
 
     comercializacao_mock = [
         {
@@ -106,13 +106,13 @@ def test_get_comercializacao_success(mock_requests_get, mock_url_builder):
 
 
 @patch("app.routes.routes.Embrapa_URL_Builder")
-@patch("app.routes.routes.requests.get")
-def test_get_importacao_success(mock_requests_get, mock_url_builder):
+@patch("app.routes.routes.fetch_page")
+def test_get_importacao_success(mock_fetch_page, mock_url_builder):
     mock_url_builder.build_url.return_value = "http://fake-url"
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
     mock_response.text = "<html></html>"
-    mock_requests_get.return_value = mock_response
+    mock_fetch_page.return_value = mock_response
 
     importacao_mock = [
         {
@@ -137,13 +137,13 @@ def test_get_importacao_success(mock_requests_get, mock_url_builder):
 
 
 @patch("app.routes.routes.Embrapa_URL_Builder")
-@patch("app.routes.routes.requests.get")
-def test_get_exportacao_success(mock_requests_get, mock_url_builder):
+@patch("app.routes.routes.fetch_page")
+def test_get_exportacao_success(mock_fetch_page, mock_url_builder):
     mock_url_builder.build_url.return_value = "http://fake-url"
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
     mock_response.text = "<html></html>"
-    mock_requests_get.return_value = mock_response
+    mock_fetch_page.return_value = mock_response
 
     exportacao_mock = [
         {
@@ -165,3 +165,105 @@ def test_get_exportacao_success(mock_requests_get, mock_url_builder):
         assert response.status_code == HTTPStatus.OK
         assert "data" in response.json()
         assert response.json()["data"] == exportacao_mock
+
+
+@patch("app.fallback.fallback_handler.get_fallback_data")
+@patch("app.routes.routes.fetch_page")
+def test_get_producao_timeout_usa_fallback(
+    mock_fetch_page, mock_get_fallback_data
+):
+    fallback = {
+        "data": [
+            {
+                "tipo_produto": "Vinho De Mesa",
+                "produto": "Tinto",
+                "quantidade_litros": 100,
+            }
+        ]
+    }
+    mock_fetch_page.side_effect = TimeoutError()
+    mock_get_fallback_data.return_value = fallback
+
+    response = client.get(f"{API_PREFIX}/producao/2023")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["X-Fallback"] == "true"
+    assert response.json() == fallback
+    mock_get_fallback_data.assert_called_once()
+
+
+@patch("app.routes.routes.fetch_page")
+def test_get_producao_usa_cache(mock_fetch_page):
+    mock_response = MagicMock()
+    mock_response.text = "<html></html>"
+    mock_fetch_page.return_value = mock_response
+
+    with patch(
+        "app.routes.routes.extract_producao_data", return_value=[]
+    ) as mock_extract:
+        first = client.get(f"{API_PREFIX}/producao/1990")
+        second = client.get(f"{API_PREFIX}/producao/1990")
+
+    assert first.json() == second.json() == {"data": []}
+    mock_fetch_page.assert_awaited_once()
+    mock_extract.assert_called_once()
+
+
+@patch("app.routes.routes.fetch_page")
+def test_get_producao_intervalo(mock_fetch_page):
+    mock_response = MagicMock()
+    mock_response.text = "<html></html>"
+    mock_fetch_page.return_value = mock_response
+
+    with patch(
+        "app.routes.routes.extract_producao_data",
+        return_value=[
+            {
+                "tipo_produto": "Vinho",
+                "produto": "tinto",
+                "quantidade_litros": 1,
+            }
+        ],
+    ):
+        response = client.get(f"{API_PREFIX}/producao?de=2000&ate=2002")
+
+    assert response.status_code == HTTPStatus.OK
+    assert sorted(response.json()["data"]) == ["2000", "2001", "2002"]
+    assert mock_fetch_page.await_count == 3  # noqa: PLR2004
+
+
+@patch("app.routes.routes.get_fallback_data")
+@patch("app.routes.routes.fetch_page")
+def test_get_importacao_intervalo_fallback_parcial(
+    mock_fetch_page, mock_get_fallback_data
+):
+    async def fake_fetch(url):
+        if "ano=2021" in url:
+            raise TimeoutError()
+        response = MagicMock()
+        response.text = "<html></html>"
+        return response
+
+    mock_fetch_page.side_effect = fake_fetch
+    mock_get_fallback_data.return_value = {"data": []}
+
+    with patch(
+        "app.routes.routes.extract_import_export_data",
+        return_value=[{"pais": "Chile", "quantidade_kg": 1, "valor_dolar": 2}],
+    ):
+        response = client.get(
+            f"{API_PREFIX}/importacao/espumantes?de=2020&ate=2022"
+        )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["X-Fallback-Anos"] == "2021"
+    assert response.json()["data"]["2021"] == []
+    assert response.json()["data"]["2020"][0]["pais"] == "Chile"
+    fallback_params = mock_get_fallback_data.call_args.args[1]
+    assert fallback_params.sub_aba == "espumantes"
+    assert fallback_params.ano == 2021  # noqa: PLR2004
+
+
+def test_get_producao_intervalo_invalido():
+    response = client.get(f"{API_PREFIX}/producao?de=2020&ate=2010")
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -0,0 +1,144 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from app.fallback import fallback_creation
+from app.fallback.async_crawler import (
+    AdaptiveCrawler,
+    AimdController,
+    CrawlProgress,
+    HostLimiter,
+)
+from app.fallback.fallback_store import SqliteFallbackStore
+
+TABELA_HTML = '<table class="tb_base tb_dados"><tr><td>1</td></tr></table>'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_aimd_aumenta_aditivamente_ate_o_teto():
+    controller = AimdController(max_limit=4, initial=2, target_latency=1)
+
+    # Cerca de +1 a cada janela completa (2 + 1/2 + 1/2.5 + 1/2.9)
+    for _ in range(3):
+        controller.on_success(0.1)
+    assert controller.limit == 3  # noqa: PLR2004
+
+    for _ in range(20):
+        controller.on_success(0.1)
+    assert controller.limit == 4  # noqa: PLR2004
+
+
+def test_aimd_reduz_com_erro_e_latencia_respeitando_cooldown():
+    clock = FakeClock()
+    controller = AimdController(
+        max_limit=16, initial=16, target_latency=1, clock=clock
+    )
+
+    controller.on_failure()
+    controller.on_success(5.0)
+    assert controller.limit == 8  # noqa: PLR2004
+
+    clock.now = 1
+    controller.on_success(5.0)
+    assert controller.limit == 4  # noqa: PLR2004
+
+
+def test_aimd_respeita_minimo():
+    clock = FakeClock()
+    controller = AimdController(max_limit=4, initial=1, clock=clock)
+
+    for step in range(5):
+        clock.now = step * 10
+        controller.on_failure()
+
+    assert controller.limit == 1
+
+
+def test_host_limiter_limita_concorrencia():
+    controller = AimdController(max_limit=2, initial=2)
+    peak = 0
+
+    async def scenario():
+        nonlocal peak
+        limiter = HostLimiter(controller)
+
+        async def job():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(job() for _ in range(6)))
+
+    asyncio.run(scenario())
+    assert peak == 2  # noqa: PLR2004
+
+
+def test_crawler_reduz_concorrencia_com_5xx():
+    def handler(request):
+        return httpx.Response(503)
+
+    async def scenario():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AdaptiveCrawler(max_per_host=8, client=client) as crawler:
+            response = await crawler.get("http://embrapa/pagina")
+            return response.status_code, crawler.concurrency("http://embrapa")
+
+    assert asyncio.run(scenario()) == (503, 1)
+
+
+def test_progress_relatorio():
+    clock = FakeClock()
+    progress = CrawlProgress(total=4, interval=10, clock=clock)
+    clock.now = 2
+    progress.update("saved")
+    progress.update("errors")
+
+    assert progress.counts == {"saved": 1, "unchanged": 0, "errors": 1}
+    assert progress.report(concurrency=3) == (
+        "Progresso: 2/4 páginas, 1.0 páginas/s, 1 erro(s), restam ~2s, "
+        "concorrência 3"
+    )
+
+
+@pytest.mark.parametrize("status", [200, 500])
+def test_run_fallback_creation_async(tmp_path, monkeypatch, status):
+    extract = MagicMock(return_value=[{"ok": True}])
+    monkeypatch.setattr(
+        fallback_creation,
+        "tasks",
+        [
+            (extract, f"http://embrapa/{ano}", ["producao", str(ano)])
+            for ano in (2020, 2021)
+        ],
+    )
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(status, text=TABELA_HTML)
+        )
+    )
+    monkeypatch.setattr(fallback_creation, "CRAWLER_MAX_RETRIES", 0)
+    path = str(tmp_path / "fallback.db")
+
+    with patch(
+        "app.fallback.async_crawler.build_async_client", return_value=client
+    ):
+        fallback_creation.run_fallback_creation(
+            max_workers=4, path=path, use_async=True
+        )
+
+    store = SqliteFallbackStore(path)
+    if status == 200:  # noqa: PLR2004
+        assert store.get("producao", None, 2021) == [{"ok": True}]
+        assert store.get_meta("http://embrapa/2020")["content_hash"]
+    else:
+        assert len(store) == 0
@@ -0,0 +1,71 @@
+import json
+
+from benchmarks import bench_scrapping, corpus
+
+N_PAGINAS = len(corpus.PAGES) * len(corpus.ANOS)
+
+
+def test_synthesize_cobre_todas_as_paginas(tmp_path):
+    corpus.synthesize(tmp_path)
+    assert len(list(tmp_path.glob("*.html"))) == N_PAGINAS
+
+
+def test_pagina_sintetica_e_extraivel():
+    page = bench_scrapping.CorpusPage(
+        corpus.synthesize_page("importacao", "espumantes", 2023)
+    )
+    assert len(bench_scrapping.EXTRACTORS["importacao"](page)) > 100  # noqa: PLR2004
+
+
+def test_run_mede_cada_extrator(tmp_path):
+    corpus.synthesize(tmp_path)
+    results = bench_scrapping.run(tmp_path, ["stream"], repeat=1)
+    assert set(results) == {
+        f"{extrator}[{backend}]"
+        for extrator in (
+            "extract_producao_data",
+            "extract_processamento_data",
+            "extract_comercializacao_data",
+            "extract_import_export_data",
+        )
+        for backend in ("bs4", "stream")
+    }
+    assert all(r["pages_per_s"] > 0 for r in results.values())
+    assert all(
+        r["speedup"] == 1.0
+        for name, r in results.items()
+        if name.endswith("[bs4]")
+    )
+
+
+def test_compare_acusa_regressao():
+    baseline = {"x[stream]": {"speedup": 4.0, "peak_kib": 10}}
+    ok = {"x[stream]": {"speedup": 3.5, "peak_kib": 11}}
+    lento = {"x[stream]": {"speedup": 2.0, "peak_kib": 10}}
+    gordo = {"x[stream]": {"speedup": 4.0, "peak_kib": 20}}
+    tolerancias = {"tolerance": 0.2, "speedup_tolerance": 0.3}
+    assert bench_scrapping.compare(ok, baseline, **tolerancias) == []
+    assert len(bench_scrapping.compare(lento, baseline, **tolerancias)) == 1
+    assert len(bench_scrapping.compare(gordo, baseline, **tolerancias)) == 1
+
+
+def test_baseline_view_guarda_mediana_sem_vazao_absoluta():
+    runs = [
+        {"x[stream]": {"pages_per_s": p, "speedup": s, "peak_kib": 10}}
+        for p, s in ((100, 3.0), (900, 5.0), (300, 4.0))
+    ]
+    assert bench_scrapping.baseline_view(runs) == {
+        "x[stream]": {"speedup": 4.0, "peak_kib": 10}
+    }
+
+
+def test_main_salva_e_compara_baseline(tmp_path):
+    corpus_dir = corpus.synthesize(tmp_path / "corpus")
+    baseline = tmp_path / "baseline.json"
+    args = ["--corpus", str(corpus_dir), "--backend", "stream"]
+    args += ["--repeat", "1", "--baseline", str(baseline)]
+
+    assert bench_scrapping.main([*args, "--save-baseline"]) == 0
+    assert json.loads(baseline.read_text(encoding="utf-8"))
+    tolerancias = ["--tolerance", "1", "--speedup-tolerance", "1"]
+    assert bench_scrapping.main([*args, *tolerancias]) == 0
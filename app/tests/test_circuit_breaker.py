@@ -0,0 +1,124 @@
+import asyncio
+from http import HTTPStatus
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.app import app
+from app.client import embrapa_client
+from app.client.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    upstream_breaker,
+)
+
+client = TestClient(app)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+
+def test_abre_apos_falhas_seguidas(breaker):
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+
+def test_sucesso_zera_falhas(breaker):
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_libera_um_teste(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10
+
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_half_open_falha_reabre(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now = 10
+    breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == OPEN
+    clock.now = 15
+    assert not breaker.allow()
+
+
+def test_fetch_page_circuito_aberto_nao_chama_upstream():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    mock = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch.object(embrapa_client, "get_client", lambda: mock):
+        for _ in range(upstream_breaker.failure_threshold):
+            with pytest.raises(httpx.HTTPStatusError):
+                asyncio.run(embrapa_client.fetch_page("http://fake-url"))
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(embrapa_client.fetch_page("http://fake-url"))
+
+    assert len(calls) == upstream_breaker.failure_threshold
+
+
+def test_fetch_page_4xx_nao_conta_falha():
+    def handler(request):
+        return httpx.Response(404)
+
+    mock = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch.object(embrapa_client, "get_client", lambda: mock):
+        for _ in range(upstream_breaker.failure_threshold):
+            with pytest.raises(httpx.HTTPStatusError):
+                asyncio.run(embrapa_client.fetch_page("http://fake-url"))
+
+    assert upstream_breaker.state == CLOSED
+
+
+def test_rota_com_circuito_aberto_usa_fallback():
+    for _ in range(upstream_breaker.failure_threshold):
+        upstream_breaker.record_failure()
+
+    with patch.object(embrapa_client, "get_client") as get_client:
+        response = client.get("/api/v1/producao/2020")
+
+    get_client.assert_not_called()
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["X-Fallback"] == "true"
@@ -0,0 +1,80 @@
+import io
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from app.dataset.columnar import (
+    build_frame,
+    export_aba,
+    write_parquet_dir,
+)
+from app.tests.factories import produto
+
+IMPORTACAO = [
+    (
+        ("importacao", "espumantes", 2020),
+        [
+            {"pais": "Chile", "quantidade_kg": 10, "valor_dolar": 20},
+            {"pais": "Peru", "quantidade_kg": 1, "valor_dolar": 2},
+        ],
+    ),
+    (
+        ("importacao", "suco_de_uva", 2021),
+        [{"pais": "Chile", "quantidade_kg": 5, "valor_dolar": 7}],
+    ),
+]
+
+
+@pytest.fixture
+def fallback_items():
+    return [
+        *IMPORTACAO,
+        (("producao", None, 2022), [produto("Vinho", "tinto", 3)]),
+    ]
+
+
+def test_build_frame_tipos_e_colunas():
+    frame = build_frame("importacao", IMPORTACAO)
+
+    assert list(frame.columns) == [
+        "sub_aba",
+        "ano",
+        "pais",
+        "quantidade_kg",
+        "valor_dolar",
+    ]
+    assert len(frame) == 3  # noqa: PLR2004
+    assert isinstance(frame["pais"].dtype, pd.CategoricalDtype)
+    assert frame["ano"].dtype == "int16"
+    assert frame["valor_dolar"].dtype == "int64"
+    assert frame["pais"].cat.categories.tolist() == ["Chile", "Peru"]
+
+
+def test_build_frame_vazio():
+    frame = build_frame("producao", [])
+    assert frame.empty
+    assert "quantidade_litros" in frame.columns
+
+
+def test_export_aba_parquet(store):
+    content, media_type = export_aba("importacao", "parquet", store)
+
+    frame = pd.read_parquet(io.BytesIO(content))
+    assert media_type == "application/vnd.apache.parquet"
+    assert frame["quantidade_kg"].sum() == 16  # noqa: PLR2004
+
+
+def test_export_aba_arrow_dictionary_encoded(store):
+    content, _ = export_aba("importacao", "arrow", store)
+
+    table = pa.ipc.open_file(pa.BufferReader(content)).read_all()
+    assert pa.types.is_dictionary(table.schema.field("pais").type)
+    assert table.num_rows == 3  # noqa: PLR2004
+
+
+def test_write_parquet_dir(store, tmp_path):
+    paths = write_parquet_dir(tmp_path / "parquet", store)
+
+    assert len(paths) == 5  # noqa: PLR2004
+    assert len(pd.read_parquet(tmp_path / "parquet" / "producao.parquet")) == 1
@@ -0,0 +1,173 @@
+import math
+from http import HTTPStatus
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.app import app
+from app.dataset.cube import DataCube, build_cubes
+from app.dataset.series_index import AmbiguousSeriesError
+from app.tests.factories import pais, produto
+
+API_PREFIX = "/api/v1"
+client = TestClient(app, raise_server_exceptions=False)
+
+
+EXPORTACAO = [
+    (2019, [pais("Paraguai", 100, 10), pais("China", 50, 40)]),
+    (2020, [pais("Paraguai", 150, 15), pais("Japão", 80, 30)]),
+    (2021, [pais("Paraguai", 0, 0), pais("China", 0, 0)]),
+]
+
+
+@pytest.fixture
+def cube():
+    return DataCube.from_records("exportacao", EXPORTACAO)
+
+
+@pytest.fixture
+def fallback_items():
+    return [
+        (("exportacao", "espumantes", ano), records)
+        for ano, records in EXPORTACAO
+    ]
+
+
+def test_cubo_codifica_anos_e_itens(cube):
+    assert cube.anos.tolist() == [2019, 2020, 2021]
+    assert [item for _, item in cube.itens] == ["Paraguai", "China", "Japão"]
+    assert cube.valores["valor_dolar"].shape == (3, 3)
+    assert np.isnan(cube.valores["valor_dolar"][0, 2])
+
+
+def test_cubo_soma_itens_repetidos():
+    records = [
+        produto("Vinho", "Tinto", 1),
+        produto("VINHO", "tinto", 2),
+        produto("Suco", "Tinto", 5),
+    ]
+
+    cube = DataCube.from_records("producao", [(2020, records)])
+
+    assert cube.valores["quantidade_litros"].tolist() == [[3, 5]]
+
+
+def test_totais_e_crescimento(cube):
+    anos, totais, crescimento = cube.growth("quantidade_kg")
+
+    assert anos.tolist() == [2019, 2020, 2021]
+    assert totais.tolist() == [150, 230, 0]
+    assert math.isnan(crescimento[0])
+    assert crescimento[1] == pytest.approx(80 / 150)
+    assert crescimento[2] == -1
+
+
+def test_totais_intervalo(cube):
+    anos, totais = cube.totals("quantidade_kg", de=2020, ate=2020)
+    assert anos.tolist() == [2020]  # noqa: PLR2004
+    assert totais.tolist() == [230]  # noqa: PLR2004
+
+
+def test_top_n(cube):
+    top = cube.top("valor_dolar", 2019, n=1)
+    assert top == [((None, "China"), 40)]
+    assert cube.top("valor_dolar", 1990) == []
+
+
+def test_valor_e_fatia_por_item(cube):
+    assert cube.value("valor_dolar", "japao", 2020) == 30  # noqa: PLR2004
+    assert cube.value("valor_dolar", "Japão", 2019) is None
+    assert cube.value("valor_dolar", "Chile", 2019) is None
+
+    anos, valores = cube.slice("quantidade_kg", "China", de=2019, ate=2020)
+    assert anos.tolist() == [2019, 2020]  # noqa: PLR2004
+    assert valores[0] == 50  # noqa: PLR2004
+    assert np.isnan(valores[1])
+    assert cube.slice("quantidade_kg", "Chile") is None
+
+
+def test_item_ambiguo_exige_grupo():
+    cube = DataCube.from_records(
+        "producao",
+        [(2020, [produto("Vinho", "Tinto", 1), produto("Suco", "Tinto", 5)])],
+    )
+
+    with pytest.raises(AmbiguousSeriesError):
+        cube.value("quantidade_litros", "tinto", 2020)
+    assert cube.value("quantidade_litros", "tinto", 2020, "suco") == 5  # noqa: PLR2004
+
+
+def test_medida_invalida(cube):
+    with pytest.raises(ValueError, match="Medida inválida"):
+        cube.totals("quantidade_litros")
+
+
+def test_build_cubes_por_sub_aba():
+    cubes = build_cubes([
+        (("importacao", "espumantes", 2020), [pais("Chile", 1, 1)]),
+        (("importacao", "uvas_frescas", 2020), [pais("Chile", 2, 2)]),
+    ])
+    assert set(cubes) == {
+        ("importacao", "espumantes"),
+        ("importacao", "uvas_frescas"),
+    }
+
+
+@pytest.mark.usefixtures("store")
+def test_rota_totais():
+    response = client.get(
+        f"{API_PREFIX}/agregados/exportacao/totais?sub_aba=espumantes&de=2020"
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    body = response.json()
+    assert body["medida"] == "quantidade_kg"
+    assert body["data"] == [
+        {"ano": 2020, "total": 230, "crescimento": None},
+        {"ano": 2021, "total": 0, "crescimento": -1.0},
+    ]
+
+
+@pytest.mark.usefixtures("store")
+def test_rota_top():
+    response = client.get(
+        f"{API_PREFIX}/agregados/exportacao/top"
+        "?sub_aba=espumantes&ano=2020&n=2&medida=valor_dolar"
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [i["item"] for i in response.json()["data"]] == [
+        "Japão",
+        "Paraguai",
+    ]
+
+
+@pytest.mark.usefixtures("store")
+def test_rota_agregados_erros():
+    sem_dados = client.get(f"{API_PREFIX}/agregados/producao/totais")
+    medida = client.get(
+        f"{API_PREFIX}/agregados/exportacao/totais?medida=quantidade_litros"
+    )
+
+    assert sem_dados.status_code == HTTPStatus.NOT_FOUND
+    assert medida.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.usefixtures("store")
+def test_rota_item():
+    response = client.get(
+        f"{API_PREFIX}/agregados/exportacao/itens/paraguai"
+        "?sub_aba=espumantes&medida=valor_dolar&ate=2020"
+    )
+    inexistente = client.get(
+        f"{API_PREFIX}/agregados/exportacao/itens/chile?sub_aba=espumantes"
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "medida": "valor_dolar",
+        "item": "paraguai",
+        "data": [{"ano": 2019, "valor": 10}, {"ano": 2020, "valor": 15}],
+    }
+    assert inexistente.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,83 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.client import embrapa_client
+
+
+def _mock_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_fetch_page_success():
+    def handler(request):
+        return httpx.Response(200, text="<html>ok</html>")
+
+    with patch.object(
+        embrapa_client, "get_client", lambda: _mock_client(handler)
+    ):
+        response = asyncio.run(embrapa_client.fetch_page("http://fake-url"))
+
+    assert response.text == "<html>ok</html>"
+
+
+def test_fetch_page_http_error():
+    def handler(request):
+        return httpx.Response(503)
+
+    with (
+        patch.object(
+            embrapa_client, "get_client", lambda: _mock_client(handler)
+        ),
+        pytest.raises(httpx.HTTPStatusError),
+    ):
+        asyncio.run(embrapa_client.fetch_page("http://fake-url"))
+
+
+def test_fetch_page_timeout():
+    async def handler(request):
+        await asyncio.sleep(1)
+        return httpx.Response(200)
+
+    with (
+        patch.object(
+            embrapa_client, "get_client", lambda: _mock_client(handler)
+        ),
+        pytest.raises(asyncio.TimeoutError),
+    ):
+        asyncio.run(embrapa_client.fetch_page("http://fake-url", timeout=0.01))
+
+
+def test_get_client_reutiliza_instancia():
+    async def scenario():
+        await embrapa_client.start_client(pool_size=2)
+        first = embrapa_client.get_client()
+        second = embrapa_client.get_client()
+        await embrapa_client.close_client()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first is second
+    assert first.is_closed
+    assert embrapa_client._client is None
+
+
+def test_get_client_cria_sob_demanda():
+    async def scenario():
+        client = embrapa_client.get_client()
+        await embrapa_client.close_client()
+        return client
+
+    client = asyncio.run(scenario())
+
+    assert isinstance(client, httpx.AsyncClient)
+
+
+def test_build_session_pool():
+    pool_size = 7
+    session = embrapa_client.build_session(pool_size=pool_size)
+    adapter = session.get_adapter("http://vitibrasil.cnpuv.embrapa.br")
+    assert adapter._pool_maxsize == pool_size
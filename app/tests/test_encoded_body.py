@@ -0,0 +1,161 @@
+import gzip
+import json
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.app import app
+from app.cache.encoded_body import (
+    BodyCache,
+    accepted_encodings,
+    brotli,
+    dump_json,
+    encode_body,
+    trusted_response,
+)
+from app.fallback import fallback_handler
+from app.schemas.invocation_parameters_schema import ProducaoPathParams
+from app.schemas.responses_schema import (
+    ProducaoIntervaloResponseSchema,
+    ProducaoResponseSchema,
+)
+from app.tests.factories import produto
+
+client = TestClient(app)
+PRODUTOS = [produto("Vinho", f"Produto {i}", i) for i in range(100)]
+
+
+def test_encode_body_valida_e_comprime():
+    payload = {"data": [{**PRODUTOS[0], "extra": True}, *PRODUTOS[1:]]}
+
+    body = encode_body(payload, ProducaoResponseSchema)
+
+    assert json.loads(body.identity) == {"data": PRODUTOS}
+    assert gzip.decompress(body.gzip) == body.identity
+    if brotli is not None:
+        assert brotli.decompress(body.br) == body.identity
+
+
+def test_encode_body_pequeno_sem_compressao():
+    body = encode_body({"data": PRODUTOS[:1]}, ProducaoResponseSchema)
+    assert body.gzip is None
+    assert body.br is None
+
+
+def test_body_cache_respeita_versao():
+    cache = BodyCache()
+    payload = {"data": PRODUTOS[:1]}
+    first = cache.get_or_encode("k", 1, payload, ProducaoResponseSchema)
+
+    assert cache.get_or_encode("k", 1, {}, ProducaoResponseSchema) is first
+    assert cache.get("k", 2) is None
+
+
+def test_accepted_encodings():
+    assert accepted_encodings("gzip, br;q=0.5, deflate;q=0") == {"gzip", "br"}
+    assert accepted_encodings("*") >= {"gzip", "br"}
+    assert accepted_encodings("") == set()
+
+
+def test_accepted_encodings_curinga_respeita_recusa():
+    assert accepted_encodings("*, gzip;q=0") == {"*", "br"}
+    assert accepted_encodings("br;q=0, *;q=0.5") == {"*", "gzip"}
+
+
+@pytest.fixture
+def upstream():
+    with (
+        patch("app.routes.routes.fetch_page") as mock_fetch_page,
+        patch(
+            "app.routes.routes.extract_producao_data",
+            return_value=PRODUTOS,
+        ) as extract,
+    ):
+        mock_fetch_page.return_value = MagicMock(text="<html></html>")
+        yield extract
+
+
+@pytest.mark.usefixtures("upstream")
+def test_rota_negocia_gzip():
+    gz = client.get(
+        "/api/v1/producao/1999", headers={"Accept-Encoding": "gzip"}
+    )
+    plain = client.get(
+        "/api/v1/producao/1999", headers={"Accept-Encoding": "identity"}
+    )
+
+    assert gz.headers["Content-Encoding"] == "gzip"
+    assert gz.headers["Vary"] == "Accept-Encoding"
+    assert gz.json() == {"data": PRODUTOS}
+    assert "Content-Encoding" not in plain.headers
+    assert plain.json() == gz.json()
+    assert gz.headers["ETag"] != plain.headers["ETag"]
+
+
+@pytest.mark.usefixtures("upstream")
+def test_rota_304_com_etag_pre_calculada():
+    first = client.get(
+        "/api/v1/producao/1999", headers={"Accept-Encoding": "gzip"}
+    )
+    second = client.get(
+        "/api/v1/producao/1999",
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-None-Match": first.headers["ETag"],
+        },
+    )
+
+    assert second.status_code == HTTPStatus.NOT_MODIFIED
+    assert second.content == b""
+
+
+@pytest.mark.parametrize(
+    "fallback_items", [[(("producao", None, 2000), PRODUTOS[:1])]]
+)
+def test_fallback_body_invalida_quando_store_muda(store):
+    params = ProducaoPathParams(ano=2000)
+
+    first = fallback_handler.get_fallback_body(
+        "producao", params, ProducaoResponseSchema
+    )
+    again = fallback_handler.get_fallback_body(
+        "producao", params, ProducaoResponseSchema
+    )
+    store.put("producao", None, 2000, PRODUTOS[:2])
+    updated = fallback_handler.get_fallback_body(
+        "producao", params, ProducaoResponseSchema
+    )
+
+    assert again is first
+    assert json.loads(updated.identity) == {"data": PRODUTOS[:2]}
+
+
+def test_dump_json_chaves_numericas():
+    content = {"data": {2000: PRODUTOS[:1]}}
+    assert json.loads(dump_json(content)) == {"data": {"2000": PRODUTOS[:1]}}
+
+
+def test_trusted_response_so_valida_com_flag(monkeypatch):
+    payload = {"data": [{**PRODUTOS[0], "extra": True}]}
+
+    validada = trusted_response(payload, ProducaoResponseSchema)
+    monkeypatch.setattr("app.cache.encoded_body.VALIDATE_RESPONSES", False)
+    direta = trusted_response(payload, ProducaoResponseSchema)
+
+    assert json.loads(validada.body) == {"data": PRODUTOS[:1]}
+    assert json.loads(direta.body) == payload
+
+
+@pytest.mark.usefixtures("upstream")
+def test_rota_intervalo_sem_revalidacao(monkeypatch):
+    monkeypatch.setattr("app.cache.encoded_body.VALIDATE_RESPONSES", False)
+
+    response = client.get("/api/v1/producao?de=1999&ate=2000")
+    schema = app.openapi()["paths"]["/api/v1/producao"]["get"]
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"data": {"1999": PRODUTOS, "2000": PRODUTOS}}
+    assert response.headers["Cache-Control"]
+    assert ProducaoIntervaloResponseSchema.__name__ in json.dumps(schema)
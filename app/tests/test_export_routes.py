@@ -0,0 +1,93 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.app import app
+from app.cache.response_cache import response_cache
+from app.routes.export_routes import iter_export_lines
+from app.tests.factories import produto
+
+API_PREFIX = "/api/v1"
+client = TestClient(app, raise_server_exceptions=False)
+PRODUTO = produto("Vinho", "tinto", 1)
+PAIS = {"quantidade_kg": 10, "valor_dolar": 20}
+
+
+@pytest.fixture
+def fallback_items():
+    return [
+        (("producao", None, 2022), [PRODUTO]),
+        (
+            ("importacao", "espumantes", 2020),
+            [{**PAIS, "pais": "Chile"}, {**PAIS, "pais": "Peru"}],
+        ),
+    ]
+
+
+def _parse(body):
+    return [json.loads(line) for line in body.splitlines()]
+
+
+@pytest.mark.usefixtures("store")
+def test_export_ndjson():
+    response = client.get(f"{API_PREFIX}/export")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    espumantes = {"aba": "importacao", "sub_aba": "espumantes", "ano": 2020}
+    producao = {"aba": "producao", "sub_aba": None, "ano": 2022}
+    assert _parse(response.text) == [
+        {**espumantes, **PAIS, "pais": "Chile"},
+        {**espumantes, **PAIS, "pais": "Peru"},
+        {**producao, **PRODUTO},
+    ]
+
+
+@pytest.mark.usefixtures("store")
+def test_export_filtra_aba():
+    response = client.get(f"{API_PREFIX}/export?aba=producao")
+    assert [r["aba"] for r in _parse(response.text)] == ["producao"]
+
+
+def test_export_aba_invalida():
+    response = client.get(f"{API_PREFIX}/export?aba=xpto")
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.usefixtures("store")
+def test_export_prefere_cache():
+    response_cache.set(
+        ("producao", None, 2022), {"data": [{"produto": "novo"}]}, ttl=60
+    )
+    lines = _parse("".join(iter_export_lines("producao")))
+    assert lines == [
+        {"aba": "producao", "sub_aba": None, "ano": 2022, "produto": "novo"}
+    ]
+
+
+@pytest.mark.usefixtures("store")
+def test_export_e_gerador_por_chave():
+    chunks = iter_export_lines()
+    first = next(chunks)
+    assert len(_parse(first)) == 2  # noqa: PLR2004
+    chunks.close()
+
+
+@pytest.mark.usefixtures("store")
+def test_export_colunar_parquet():
+    response = client.get(f"{API_PREFIX}/export/importacao")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert "importacao.parquet" in response.headers["content-disposition"]
+    assert response.content.startswith(b"PAR1")
+
+
+@pytest.mark.usefixtures("store")
+def test_export_colunar_arrow():
+    response = client.get(f"{API_PREFIX}/export/producao?formato=arrow")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.content.startswith(b"ARROW1")
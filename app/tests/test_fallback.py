@@ -1,7 +1,26 @@
+import json
+from datetime import date
 from unittest.mock import MagicMock, patch
 
 from app.fallback import fallback_creation
-from app.fallback.fallback_creation import fetch_and_store
+from app.fallback.fallback_creation import (
+    UNCHANGED,
+    content_hash,
+    fetch_and_store,
+)
+from app.fallback.fallback_store import SqliteFallbackStore
+
+ANO_ATUAL = date.today().year
+TABELA_HTML = '<table class="tb_base tb_dados"><tr><td>1</td></tr></table>'
+
+
+def _fake_response(text=TABELA_HTML, status_code=200, headers=None):
+    response = MagicMock()
+    response.raise_for_status.return_value = None
+    response.status_code = status_code
+    response.text = text
+    response.headers = headers or {}
+    return response
 
 
 def test_fetch_and_store_success():
@@ -10,23 +29,30 @@ def test_fetch_and_store_success():
     key_path = ["producao", "2022"]
 
     with (
-        patch("app.fallback.fallback_creation.requests.get") as mock_get,
+        patch("app.fallback.fallback_creation.http_session.get") as mock_get,
         patch(
             "app.fallback.fallback_creation.time.sleep",
             return_value=None,
         ),
     ):
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
+        mock_response = _fake_response(headers={"ETag": '"v1"'})
         mock_get.return_value = mock_response
 
         result = fetch_and_store(mock_func, url, key_path)
 
-    assert result == (key_path, {"resultado": 123})
+    assert result == (
+        key_path,
+        {"resultado": 123},
+        {
+            "etag": '"v1"',
+            "last_modified": None,
+            "content_hash": content_hash(TABELA_HTML),
+        },
+    )
     mock_func.assert_called_once_with(mock_response)
 
 
-def test_run_fallback_creation_fast():
+def test_run_fallback_creation_fast(tmp_path):
     # Mock tasks para não rodar tudo
     fallback_creation.tasks = [
         (
@@ -35,18 +61,32 @@ def test_run_fallback_creation_fast():
             ["producao", "2022"],
         )
     ]
+    path = str(tmp_path / "fallback.db")
 
     with (
         patch(
             "app.fallback.fallback_creation.fetch_and_store",
-            return_value=(["producao", "2022"], {"ok": True}),
+            return_value=(["producao", "2022"], [{"ok": True}], {}),
         ),
-        patch("app.fallback.fallback_creation.os.makedirs"),
-        patch("app.fallback.fallback_creation.open"),
-        patch("app.fallback.fallback_creation.json.dump"),
         patch("app.fallback.fallback_creation.logger.info"),
     ):
-        fallback_creation.run_fallback_creation(max_workers=1)
+        fallback_creation.run_fallback_creation(max_workers=1, path=path)
+
+    assert SqliteFallbackStore(path).get("producao", None, 2022) == [
+        {"ok": True}
+    ]
+
+
+def test_main_from_json(tmp_path):
+    json_path = tmp_path / "fallback.json"
+    json_path.write_text(
+        json.dumps({"producao": {"2022": [{"ok": True}]}}), encoding="utf-8"
+    )
+    path = str(tmp_path / "fallback.db")
+
+    fallback_creation.main(["--path", path, "--from-json", str(json_path)])
+
+    assert len(SqliteFallbackStore(path)) == 1
 
 
 def test_fetch_and_store_error():
@@ -57,12 +97,243 @@ def test_fetch_and_store_error():
     url = "http://fake-url"
     key_path = ["producao", "2022"]
 
-    with patch("app.fallback.fallback_creation.requests.get") as mock_get:
-        mock_response = MagicMock()
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    with patch("app.fallback.fallback_creation.http_session.get") as mock_get:
+        mock_get.return_value = _fake_response()
 
         result = fetch_and_store(raise_error, url, key_path)
 
-    # Deve retornar (key_path, None) em caso de erro
-    assert result == (key_path, None)
+    # Deve retornar (key_path, None, None) em caso de erro
+    assert result == (key_path, None, None)
+
+
+def test_fetch_and_store_not_modified():
+    mock_func = MagicMock()
+    meta = {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024"}
+
+    with (
+        patch("app.fallback.fallback_creation.http_session.get") as mock_get,
+        patch("app.fallback.fallback_creation.time.sleep"),
+    ):
+        mock_get.return_value = _fake_response(status_code=304)
+        result = fetch_and_store(mock_func, "http://fake-url", ["x"], meta)
+
+    assert result == (["x"], UNCHANGED, meta)
+    assert mock_get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024",
+    }
+    mock_func.assert_not_called()
+
+
+def test_fetch_and_store_hash_igual_nao_reprocessa():
+    mock_func = MagicMock()
+    meta = {"content_hash": content_hash(TABELA_HTML)}
+
+    with (
+        patch("app.fallback.fallback_creation.http_session.get") as mock_get,
+        patch("app.fallback.fallback_creation.time.sleep"),
+    ):
+        mock_get.return_value = _fake_response(
+            text=f"<p>rodapé dinâmico</p>{TABELA_HTML}"
+        )
+        _, data, _ = fetch_and_store(mock_func, "http://fake-url", ["x"], meta)
+
+    assert data is UNCHANGED
+    mock_func.assert_not_called()
+
+
+def test_run_fallback_creation_incremental(tmp_path, monkeypatch):
+    path = str(tmp_path / "fallback.db")
+    store = SqliteFallbackStore(path)
+    store.put("producao", None, 1990, [{"antigo": True}])
+    store.put_meta("http://antigo", {"content_hash": "h"})
+    store.put("producao", None, ANO_ATUAL, [{"antigo": True}])
+    store.put_meta("http://recente", {"content_hash": "h"})
+    monkeypatch.setattr(
+        fallback_creation,
+        "tasks",
+        [
+            (MagicMock(), "http://antigo", ["producao", "1990"]),
+            (MagicMock(), "http://recente", ["producao", str(ANO_ATUAL)]),
+            (MagicMock(), "http://novo", ["producao", "1980"]),
+        ],
+    )
+    results = {
+        "http://recente": UNCHANGED,
+        "http://novo": [{"novo": True}],
+    }
+
+    def fake_fetch(func, url, key_path, meta):
+        return (key_path, results[url], {"content_hash": "h2"})
+
+    with patch(
+        "app.fallback.fallback_creation.fetch_and_store",
+        side_effect=fake_fetch,
+    ) as mock_fetch:
+        fallback_creation.run_fallback_creation(
+            max_workers=1, path=path, incremental=True
+        )
+
+    fetched = sorted(call.args[1] for call in mock_fetch.call_args_list)
+    assert fetched == ["http://novo", "http://recente"]
+    assert store.get("producao", None, ANO_ATUAL) == [{"antigo": True}]
+    assert store.get("producao", None, 1980) == [{"novo": True}]
+    assert store.get_meta("http://novo")["content_hash"] == "h2"
+
+
+def test_run_fallback_creation_incremental_seguidas(tmp_path, monkeypatch):
+    path = str(tmp_path / "fallback.db")
+    store = SqliteFallbackStore(path)
+    store.put_meta("http://antigo", {"content_hash": "h"})
+    monkeypatch.setattr(
+        fallback_creation,
+        "tasks",
+        [
+            (MagicMock(), "http://antigo", ["producao", "1990"]),
+            (MagicMock(), "http://recente", ["producao", str(ANO_ATUAL)]),
+        ],
+    )
+
+    def fake_fetch(func, url, key_path, meta):
+        return (key_path, [{"url": url}], {"content_hash": "h"})
+
+    with patch(
+        "app.fallback.fallback_creation.fetch_and_store",
+        side_effect=fake_fetch,
+    ) as mock_fetch:
+        for _ in range(2):
+            mock_fetch.reset_mock()
+            fallback_creation.run_fallback_creation(
+                max_workers=1, path=path, incremental=True
+            )
+            # Anos recentes continuam sendo atualizados a cada execução
+            assert [c.args[1] for c in mock_fetch.call_args_list] == [
+                "http://recente"
+            ]
+
+    assert store.get_checkpoint() == {
+        "http://antigo": "skipped",
+        "http://recente": "done",
+    }
+
+
+def test_main_grava_parquet(tmp_path):
+    json_path = tmp_path / "fallback.json"
+    json_path.write_text(json.dumps({"producao": {}}), encoding="utf-8")
+    parquet_dir = tmp_path / "parquet"
+
+    fallback_creation.main([
+        "--path",
+        str(tmp_path / "fallback.db"),
+        "--from-json",
+        str(json_path),
+        "--parquet-dir",
+        str(parquet_dir),
+    ])
+
+    assert (parquet_dir / "importacao.parquet").exists()
+
+
+def test_backoff_delay_exponencial_com_jitter():
+    with patch("app.fallback.fallback_creation.random.uniform") as uniform:
+        uniform.side_effect = lambda low, high: high
+        delays = [
+            fallback_creation.backoff_delay(attempt, base=1, cap=5)
+            for attempt in range(4)
+        ]
+
+    assert delays == [1, 2, 4, 5]
+
+
+def test_fetch_with_retries_repete_ate_sucesso(monkeypatch):
+    results = iter([None, None, [{"ok": True}]])
+    monkeypatch.setattr(
+        fallback_creation,
+        "fetch_and_store",
+        lambda func, url, key_path, meta: (key_path, next(results), {}),
+    )
+
+    with patch("app.fallback.fallback_creation.time.sleep") as sleep:
+        result = fallback_creation._fetch_with_retries(
+            None, "http://fake-url", ["producao", "2022"], None
+        )
+
+    assert result[1] == [{"ok": True}]
+    assert sleep.call_count == 2  # noqa: PLR2004
+
+
+def test_run_fallback_creation_retoma_do_checkpoint(tmp_path, monkeypatch):
+    path = str(tmp_path / "fallback.db")
+    monkeypatch.setattr(
+        fallback_creation,
+        "tasks",
+        [
+            (MagicMock(), "http://ok", ["producao", "1990"]),
+            (MagicMock(), "http://falha", ["producao", "1991"]),
+        ],
+    )
+    monkeypatch.setattr(fallback_creation, "CRAWLER_MAX_RETRIES", 0)
+    failing = {"http://falha"}
+
+    def fake_fetch(func, url, key_path, meta):
+        data = None if url in failing else [{"url": url}]
+        return (key_path, data, {"content_hash": "h"})
+
+    with patch(
+        "app.fallback.fallback_creation.fetch_and_store",
+        side_effect=fake_fetch,
+    ) as mock_fetch:
+        missing = fallback_creation.run_fallback_creation(
+            max_workers=1, path=path
+        )
+        assert missing == [["producao", "1991"]]
+
+        failing.clear()
+        mock_fetch.reset_mock()
+        missing = fallback_creation.run_fallback_creation(
+            max_workers=1, path=path
+        )
+
+    assert missing == []
+    assert [call.args[1] for call in mock_fetch.call_args_list] == [
+        "http://falha"
+    ]
+    store = SqliteFallbackStore(path)
+    assert store.get("producao", None, 1991) == [{"url": "http://falha"}]
+    assert store.get_checkpoint() == {
+        "http://ok": "done",
+        "http://falha": "done",
+    }
+
+
+def test_run_fallback_creation_full_ignora_checkpoint(tmp_path, monkeypatch):
+    path = str(tmp_path / "fallback.db")
+    urls = ["http://a", "http://b"]
+    monkeypatch.setattr(
+        fallback_creation,
+        "tasks",
+        [
+            (MagicMock(), url, ["producao", str(1990 + i)])
+            for i, url in enumerate(urls)
+        ],
+    )
+    store = SqliteFallbackStore(path)
+    store.set_checkpoint("http://a", "done")
+    store.close()
+
+    def fake_fetch(func, url, key_path, meta):
+        return (key_path, [{"url": url}], {"content_hash": "h"})
+
+    with patch(
+        "app.fallback.fallback_creation.fetch_and_store",
+        side_effect=fake_fetch,
+    ) as mock_fetch:
+        fallback_creation.run_fallback_creation(
+            max_workers=1, path=path, full=True
+        )
+        assert mock_fetch.call_count == len(urls)
+
+        # Checkpoint completo: a próxima execução é um crawl novo
+        mock_fetch.reset_mock()
+        fallback_creation.run_fallback_creation(max_workers=1, path=path)
+        assert mock_fetch.call_count == len(urls)
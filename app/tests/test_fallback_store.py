@@ -0,0 +1,188 @@
+import json
+import os
+
+from app.fallback import fallback_handler
+from app.fallback.fallback_store import (
+    JsonFallbackStore,
+    SqliteFallbackStore,
+    build_index,
+    import_json,
+    key_from_path,
+    open_fallback_store,
+)
+from app.schemas.invocation_parameters_schema import (
+    ImportacaoPathParams,
+    ProducaoPathParams,
+)
+
+FALLBACK_JSON = {
+    "producao": {"2022": [{"produto": "tinto"}]},
+    "importacao": {"espumantes": {"2020": [{"pais": "Chile"}]}},
+}
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_build_index():
+    index = build_index(FALLBACK_JSON)
+    assert index == {
+        ("producao", None, 2022): [{"produto": "tinto"}],
+        ("importacao", "espumantes", 2020): [{"pais": "Chile"}],
+    }
+
+
+def test_store_carrega_uma_vez(tmp_path, monkeypatch):
+    path = tmp_path / "fallback.json"
+    _write(path, FALLBACK_JSON)
+    store = JsonFallbackStore(str(path))
+    loads = []
+    original_load = json.load
+    monkeypatch.setattr(
+        "app.fallback.fallback_store.json.load",
+        lambda f: loads.append(1) or original_load(f),
+    )
+
+    assert store.get("producao", None, 2022) == [{"produto": "tinto"}]
+    assert store.get("importacao", "espumantes", "2020") == [{"pais": "Chile"}]
+    assert store.get("producao", None, 1999) is None
+    assert len(loads) == 1
+
+
+def test_store_recarrega_quando_arquivo_muda(tmp_path):
+    path = tmp_path / "fallback.json"
+    _write(path, FALLBACK_JSON)
+    store = JsonFallbackStore(str(path))
+    assert store.get("producao", None, 2023) is None
+
+    _write(path, {"producao": {"2023": [{"produto": "branco"}]}})
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert store.get("producao", None, 2023) == [{"produto": "branco"}]
+    assert store.get("producao", None, 2022) is None
+
+
+def test_store_mantem_indice_se_arquivo_invalido(tmp_path):
+    path = tmp_path / "fallback.json"
+    _write(path, FALLBACK_JSON)
+    store = JsonFallbackStore(str(path))
+    assert len(store) == 2  # noqa: PLR2004
+
+    path.write_text("{invalido", encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert store.get("producao", None, 2022) == [{"produto": "tinto"}]
+
+
+def test_store_arquivo_ausente(tmp_path):
+    store = JsonFallbackStore(str(tmp_path / "nao_existe.json"))
+    assert store.get("producao", None, 2022) is None
+
+
+def test_get_fallback_data(tmp_path, monkeypatch):
+    path = tmp_path / "fallback.json"
+    _write(path, FALLBACK_JSON)
+    monkeypatch.setattr(
+        fallback_handler, "fallback_store", JsonFallbackStore(str(path))
+    )
+
+    assert fallback_handler.get_fallback_data(
+        "importacao", ImportacaoPathParams(sub_aba="espumantes", ano=2020)
+    ) == {"data": [{"pais": "Chile"}]}
+    assert fallback_handler.get_fallback_data(
+        "producao", ProducaoPathParams(ano=1999)
+    ) == {"data": []}
+
+
+def test_sqlite_store_put_get(tmp_path):
+    store = SqliteFallbackStore(str(tmp_path / "fallback.db"))
+    store.put("producao", None, 2022, [{"produto": "tinto"}])
+    store.put("importacao", "espumantes", "2020", [{"pais": "Chile"}])
+
+    assert store.get("producao", None, "2022") == [{"produto": "tinto"}]
+    assert store.get("importacao", "espumantes", 2020) == [{"pais": "Chile"}]
+    assert store.get("importacao", "espumantes", 2021) is None
+    assert len(store) == 2  # noqa: PLR2004
+    assert store.keys() == [
+        ("importacao", "espumantes", 2020),
+        ("producao", None, 2022),
+    ]
+
+
+def test_sqlite_store_substitui_chave(tmp_path):
+    store = SqliteFallbackStore(str(tmp_path / "fallback.db"))
+    store.put("producao", None, 2022, [{"produto": "tinto"}])
+    store.put("producao", None, 2022, [{"produto": "branco"}])
+
+    assert store.get("producao", None, 2022) == [{"produto": "branco"}]
+    assert len(store) == 1
+
+
+def test_sqlite_store_arquivo_ausente(tmp_path):
+    path = tmp_path / "nao_existe.db"
+    store = SqliteFallbackStore(str(path))
+
+    assert store.get("producao", None, 2022) is None
+    assert len(store) == 0
+    assert not path.exists()
+
+
+def test_import_json(tmp_path):
+    json_path = tmp_path / "fallback.json"
+    _write(json_path, FALLBACK_JSON)
+    store = SqliteFallbackStore(str(tmp_path / "fallback.db"))
+
+    assert import_json(str(json_path), store) == 2  # noqa: PLR2004
+    assert store.get("importacao", "espumantes", 2020) == [{"pais": "Chile"}]
+
+
+def test_open_fallback_store_por_extensao():
+    assert isinstance(open_fallback_store("x.json"), JsonFallbackStore)
+    assert isinstance(open_fallback_store("x.db"), SqliteFallbackStore)
+
+
+def test_open_fallback_store_migra_json_legado(tmp_path):
+    _write(tmp_path / "fallback_data.json", FALLBACK_JSON)
+    path = tmp_path / "fallback_data.db"
+
+    store = open_fallback_store(str(path))
+
+    assert isinstance(store, SqliteFallbackStore)
+    assert path.exists()
+    assert store.get("importacao", "espumantes", 2020) == [{"pais": "Chile"}]
+
+
+def test_open_fallback_store_usa_json_se_migracao_falha(tmp_path):
+    (tmp_path / "fallback_data.json").write_text("[]", encoding="utf-8")
+    path = tmp_path / "fallback_data.db"
+
+    store = open_fallback_store(str(path))
+
+    assert isinstance(store, JsonFallbackStore)
+    assert store.path == str(tmp_path / "fallback_data.json")
+    assert not path.exists()
+
+
+def test_key_from_path():
+    assert key_from_path(["producao", "2022"]) == ("producao", None, 2022)
+    assert key_from_path(["exportacao", "espumantes", "2020"]) == (
+        "exportacao",
+        "espumantes",
+        2020,
+    )
+
+
+def test_sqlite_store_meta(tmp_path):
+    store = SqliteFallbackStore(str(tmp_path / "fallback.db"))
+    assert store.get_meta("http://fake-url") is None
+
+    store.put_meta("http://fake-url", {"etag": '"v1"', "content_hash": "h"})
+    meta = store.get_meta("http://fake-url")
+
+    assert meta["etag"] == '"v1"'
+    assert meta["last_modified"] is None
+    assert meta["content_hash"] == "h"
+    assert meta["checked_at"] > 0
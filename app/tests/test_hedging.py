@@ -0,0 +1,116 @@
+import asyncio
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException, Response
+
+from app.cache.response_cache import response_cache
+from app.client.hedging import LatencyTracker, hedge_delay, hedged
+from app.routes import routes
+
+KEY = ("producao", None, 1990)
+
+
+def test_latency_tracker_percentil():
+    tracker = LatencyTracker()
+    for ms in range(1, 101):
+        tracker.record(ms / 1000)
+
+    assert tracker.percentile(50) == pytest.approx(0.05, abs=0.001)
+    assert tracker.percentile(100) == pytest.approx(0.1)
+    assert LatencyTracker().percentile(95) is None
+
+
+def test_hedge_delay_usa_padrao_com_poucas_amostras():
+    tracker = LatencyTracker()
+    tracker.record(5.0)
+
+    with patch("app.client.hedging.HEDGE_DEFAULT_DELAY", 1.5):
+        assert hedge_delay(tracker) == 1.5  # noqa: PLR2004
+
+
+def test_hedge_delay_respeita_piso():
+    tracker = LatencyTracker()
+    for _ in range(50):
+        tracker.record(0.001)
+
+    with patch("app.client.hedging.HEDGE_MIN_DELAY", 0.2):
+        assert hedge_delay(tracker) == 0.2  # noqa: PLR2004
+
+
+def _attempts(*delays):
+    calls = []
+
+    async def func():
+        delay = delays[len(calls)]
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        return delay
+
+    return func, calls
+
+
+def test_hedged_resposta_rapida_nao_dispara_hedge():
+    func, calls = _attempts(0.0, 0.0)
+
+    assert asyncio.run(hedged(func, delay=0.5)) == 0.0
+    assert calls == [0.0]
+
+
+def test_hedged_segunda_tentativa_vence():
+    func, calls = _attempts(5.0, 0.0)
+
+    assert asyncio.run(hedged(func, delay=0.01)) == 0.0
+    assert len(calls) == 2  # noqa: PLR2004
+
+
+def test_hedged_propaga_erro_quando_todas_falham():
+    async def failing():
+        await asyncio.sleep(0.02)
+        raise TimeoutError()
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(hedged(failing, delay=0.01))
+
+
+def _fetch_with_budget(budget):
+    async def slow_fetch(url):
+        await asyncio.sleep(1)
+
+    async def scenario():
+        response = Response()
+        try:
+            return await routes.fetch_and_extract(
+                option="producao",
+                suboption=None,
+                year=1990,
+                extract_func=lambda r: [],
+                response=response,
+            ), response
+        finally:
+            for task in asyncio.all_tasks() - {asyncio.current_task()}:
+                task.cancel()
+
+    with (
+        patch("app.routes.routes.fetch_page", slow_fetch),
+        patch.dict(routes.LATENCY_BUDGETS, {"producao": budget}),
+        patch("app.routes.routes.CACHE_SWR_ENABLED", False),
+    ):
+        return asyncio.run(scenario())
+
+
+def test_orcamento_esgotado_usa_cache_stale():
+    response_cache.set(KEY, {"data": [{"antigo": True}]}, ttl=0)
+
+    result, response = _fetch_with_budget(0.01)
+
+    assert result == {"data": [{"antigo": True}]}
+    assert response.headers["X-Cache"] == "STALE"
+
+
+def test_orcamento_esgotado_sem_cache_falha():
+    with pytest.raises(HTTPException) as exc:
+        _fetch_with_budget(0.01)
+
+    assert exc.value.status_code == HTTPStatus.GATEWAY_TIMEOUT
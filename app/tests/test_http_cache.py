@@ -0,0 +1,76 @@
+from datetime import date
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from app.app import app
+from app.cache.http_cache import (
+    FALLBACK_CACHE_CONTROL,
+    cache_control,
+    compute_etag,
+    etag_matches,
+)
+
+client = TestClient(app)
+
+
+def test_cache_control_por_ano():
+    with patch("app.cache.http_cache.CACHE_SWR_ENABLED", False):
+        recente = cache_control("producao", date.today().year)
+        historico = cache_control("producao", 1970)
+
+    assert recente == "public, max-age=3600"
+    assert historico == "public, max-age=604800"
+
+
+def test_etag_matches():
+    etag = compute_etag(b'{"data":[]}')
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"outra", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"outra"', etag)
+
+
+@patch("app.routes.routes.fetch_page")
+def test_rota_responde_304_com_if_none_match(mock_fetch_page):
+    mock_fetch_page.return_value = MagicMock(text="<html></html>")
+    first = client.get("/api/v1/producao/1975")
+    etag = first.headers["ETag"]
+
+    second = client.get(
+        "/api/v1/producao/1975", headers={"If-None-Match": etag}
+    )
+
+    assert first.status_code == HTTPStatus.OK
+    assert first.headers["Cache-Control"].startswith("public, max-age=")
+    assert second.status_code == HTTPStatus.NOT_MODIFIED
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+    assert "Cache-Control" in second.headers
+
+
+@patch("app.routes.routes.fetch_page")
+def test_rota_etag_diferente_retorna_corpo(mock_fetch_page):
+    mock_fetch_page.return_value = MagicMock(text="<html></html>")
+
+    response = client.get(
+        "/api/v1/producao/1975", headers={"If-None-Match": '"antiga"'}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"data": []}
+
+
+def test_rota_fallback_usa_cache_control_curto():
+    with patch("app.routes.routes.fetch_page", side_effect=TimeoutError()):
+        response = client.get("/api/v1/producao/1980")
+
+    assert response.headers["X-Fallback"] == "true"
+    assert response.headers["Cache-Control"] == FALLBACK_CACHE_CONTROL
+
+
+def test_stream_ndjson_sem_etag():
+    response = client.get("/api/v1/export?aba=producao")
+    assert "ETag" not in response.headers
@@ -5,6 +5,8 @@ from app.schemas.invocation_parameters_schema import (
     ComercializacaoPathParams,
     ExportacaoPathParams,
     ImportacaoPathParams,
+    IntervaloAte2023QueryParams,
+    IntervaloAte2024QueryParams,
     ProcessamentoPathParams,
     ProducaoPathParams,
     SubAbaExportacaoSchema,
@@ -107,3 +109,19 @@ def test_exportacao_path_params_invalid_ano():
 def test_exportacao_path_params_invalid_subaba():
     with pytest.raises(ValidationError):
         ExportacaoPathParams(sub_aba="invalido", ano=2020)
+
+
+def test_intervalo_padrao_cobre_todos_os_anos():
+    params = IntervaloAte2023QueryParams()
+    assert params.anos() == range(ANO_MIN, ANO_MAX_2023 + 1)
+    assert IntervaloAte2024QueryParams().ate == ANO_MAX_2024
+
+
+def test_intervalo_invertido_invalido():
+    with pytest.raises(ValidationError):
+        IntervaloAte2023QueryParams(de=2020, ate=2010)
+
+
+def test_intervalo_fora_dos_limites():
+    with pytest.raises(ValidationError):
+        IntervaloAte2023QueryParams(ate=ANO_MAX_2024)
@@ -0,0 +1,121 @@
+from http import HTTPStatus
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.app import app
+from app.client.circuit_breaker import CircuitOpenError
+from app.metrics.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+    upstream_duration,
+    upstream_requests,
+)
+
+client = TestClient(app)
+
+
+def test_counter_com_labels():
+    registry = Registry()
+    counter = Counter("req_total", "Requisições.", ["aba"], registry=registry)
+    counter.labels("producao").inc()
+    counter.labels("producao").inc(2)
+    counter.labels('a"b').inc()
+
+    assert registry.render() == (
+        "# HELP req_total Requisições.\n"
+        "# TYPE req_total counter\n"
+        'req_total{aba="producao"} 3\n'
+        'req_total{aba="a\\"b"} 1\n'
+    )
+
+
+def test_gauge_em_andamento_e_callback():
+    registry = Registry()
+    gauge = Gauge("in_flight", "Em andamento.", registry=registry)
+    Gauge("ratio", "Razão.", func=lambda: 0.5, registry=registry)
+
+    with gauge.track_inprogress():
+        assert "in_flight 1" in registry.render()
+
+    text = registry.render()
+    assert "in_flight 0" in text
+    assert "ratio 0.5" in text
+
+
+def test_histogram_buckets_cumulativos():
+    registry = Registry()
+    histogram = Histogram(
+        "latencia",
+        "Latência.",
+        ["option"],
+        buckets=(0.1, 1),
+        registry=registry,
+    )
+    for value in (0.05, 0.5, 0.7, 3):
+        histogram.labels("producao").observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert lines[2:] == [
+        'latencia_bucket{option="producao",le="0.1"} 1',
+        'latencia_bucket{option="producao",le="1"} 3',
+        'latencia_bucket{option="producao",le="+Inf"} 4',
+        'latencia_sum{option="producao"} 4.25',
+        'latencia_count{option="producao"} 4',
+    ]
+
+
+@patch("app.routes.routes.fetch_page")
+def test_rota_metrics_registra_upstream_parse_e_cache(mock_fetch_page):
+    mock_fetch_page.return_value = MagicMock(text="<html></html>")
+    client.get("/api/v1/producao/2001")
+    client.get("/api/v1/producao/2001")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert (
+        'embrapa_upstream_request_duration_seconds_count{option="producao"}'
+        in text
+    )
+    assert 'embrapa_parse_duration_seconds_count{option="producao"}' in text
+    assert (
+        'embrapa_upstream_requests_total{option="producao",outcome="ok"}'
+        in text
+    )
+    assert 'embrapa_cache_lookups_total{result="hit"}' in text
+    assert "embrapa_upstream_in_flight 0" in text
+
+
+def test_rota_metrics_conta_fallback():
+    with patch("app.routes.routes.fetch_page", side_effect=TimeoutError()):
+        client.get("/api/v1/producao/1985")
+
+    text = client.get("/metrics").text
+    assert 'embrapa_fallback_served_total{aba="producao",found=' in text
+
+
+@pytest.mark.parametrize(
+    ("erro", "outcome", "observado"),
+    [
+        (TimeoutError(), "timeout", 1),
+        (ConnectionError(), "error", 1),
+        (CircuitOpenError("aberto"), "circuit_open", 0),
+    ],
+)
+def test_upstream_registra_falhas(erro, outcome, observado):
+    contador = upstream_requests.labels("comercializacao", outcome)
+    histograma = upstream_duration.labels("comercializacao")
+    antes = contador.value, sum(histograma.counts)
+
+    with patch("app.routes.routes.fetch_page", side_effect=erro):
+        client.get("/api/v1/comercializacao/1991")
+
+    assert contador.value == antes[0] + 1
+    assert sum(histograma.counts) == antes[1] + observado
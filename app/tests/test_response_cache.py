@@ -0,0 +1,77 @@
+from datetime import date
+
+from app.cache.response_cache import (
+    ResponseCache,
+    cache_key,
+    cache_ttl,
+)
+from app.config.settings import CACHE_TTL_HISTORICAL, CACHE_TTL_RECENT
+from app.schemas.invocation_parameters_schema import (
+    SubAbaImportacaoSchema,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hit_and_miss():
+    cache = ResponseCache(max_size=10)
+    assert cache.get("a") is None
+    cache.set("a", {"data": []}, ttl=60)
+    assert cache.get("a") == {"data": []}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_ratio"] == 0.5  # noqa: PLR2004
+
+
+def test_cache_expira_pelo_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(max_size=10, stale_ttl=0, clock=clock)
+    cache.set("a", 1, ttl=10)
+    clock.now = 9
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_despeja_lru():
+    cache = ResponseCache(max_size=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+
+
+def test_cache_key_normaliza_enum():
+    key = cache_key("importacao", SubAbaImportacaoSchema.ESPUMANTES, "2020")
+    assert key == ("importacao", "espumantes", 2020)
+
+
+def test_cache_ttl_por_ano():
+    assert cache_ttl("producao", 1990) == CACHE_TTL_HISTORICAL
+    assert cache_ttl("producao", date.today().year) == CACHE_TTL_RECENT
+
+
+def test_cache_lookup_stale():
+    clock = FakeClock()
+    cache = ResponseCache(max_size=10, stale_ttl=100, clock=clock)
+    cache.set("a", 1, ttl=10)
+
+    clock.now = 5
+    assert cache.lookup("a") == (1, 5, True)
+    clock.now = 50
+    assert cache.lookup("a") == (1, 50, False)
+    assert cache.get("a") is None
+    clock.now = 110
+    assert cache.lookup("a") is None
+    assert len(cache) == 0
+    assert cache.stats()["stale_hits"] == 1
@@ -0,0 +1,76 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from fastapi import Response
+
+from app.cache.response_cache import response_cache
+from app.routes import routes
+
+KEY = ("producao", None, 1990)
+
+
+def _run_stale_request(mock_fetch_page):
+    async def scenario():
+        response = Response()
+        result = await routes.fetch_and_extract(
+            option="producao",
+            suboption=None,
+            year=1990,
+            extract_func=lambda r: [{"novo": True}],
+            response=response,
+        )
+        await asyncio.gather(*routes._revalidations.values())
+        return result, response
+
+    with patch("app.routes.routes.fetch_page", mock_fetch_page):
+        return asyncio.run(scenario())
+
+
+def test_fetch_and_extract_stale_while_revalidate():
+    response_cache.set(KEY, {"data": [{"antigo": True}]}, ttl=0)
+    mock_fetch_page = MagicMock()
+
+    async def fake_fetch(url):
+        return mock_fetch_page(url)
+
+    result, response = _run_stale_request(fake_fetch)
+
+    assert result == {"data": [{"antigo": True}]}
+    assert response.headers["X-Cache"] == "STALE"
+    assert "Age" in response.headers
+    mock_fetch_page.assert_called_once()
+    assert response_cache.get(KEY) == {"data": [{"novo": True}]}
+
+
+def test_fetch_and_extract_revalidacao_com_erro_mantem_stale():
+    response_cache.set(KEY, {"data": [{"antigo": True}]}, ttl=0)
+
+    async def failing_fetch(url):
+        raise TimeoutError()
+
+    result, _ = _run_stale_request(failing_fetch)
+
+    assert result == {"data": [{"antigo": True}]}
+    assert response_cache.lookup(KEY).value == {"data": [{"antigo": True}]}
+    assert routes._revalidations == {}
+
+
+def test_schedule_revalidation_respeita_limite():
+    async def scenario():
+        async def slow_fetch(url):
+            await asyncio.sleep(0.01)
+            raise TimeoutError()
+
+        with (
+            patch("app.routes.routes.fetch_page", slow_fetch),
+            patch("app.routes.routes.SWR_MAX_CONCURRENCY", 1),
+        ):
+            for ano in (1990, 1991):
+                routes._schedule_revalidation(
+                    ("producao", None, ano), "producao", None, ano, None
+                )
+            scheduled = len(routes._revalidations)
+            await asyncio.gather(*routes._revalidations.values())
+        return scheduled
+
+    assert asyncio.run(scenario()) == 1
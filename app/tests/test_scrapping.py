@@ -224,3 +224,38 @@ def test_extract_comercializacao_data_linha_invalida():
     response = FakeResponse(html)
     result = scrapping.extract_comercializacao_data(response)
     assert result == []  # Linha sem classe tb_item/tb_subitem é ignorada
+
+
+def test_extract_processamento_data_sem_classificacao():
+    html = """
+    <table class="tb_base tb_dados">
+        <tr>
+            <td class="tb_item">Sem classificação</td>
+            <td class="tb_item">1.223.400</td>
+        </tr>
+    </table>
+    """
+    response = FakeResponse(html)
+    result = scrapping.extract_processamento_data(response)
+    assert result == [
+        {
+            "tipo_uva": "Sem Classificação",
+            "cultivo": "Sem classificação",
+            "quantidade_kg": 1223400,
+        },
+    ]
+
+
+def test_extract_processamento_data_le_tabela_uma_vez(
+    monkeypatch, processamento_html
+):
+    calls = []
+    original = scrapping._table_rows
+
+    def counting_table_rows(response, table_class):
+        calls.append(table_class)
+        return original(response, table_class)
+
+    monkeypatch.setattr(scrapping, "_table_rows", counting_table_rows)
+    scrapping.extract_processamento_data(FakeResponse(processamento_html))
+    assert len(calls) == 1
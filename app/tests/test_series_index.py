@@ -0,0 +1,130 @@
+from http import HTTPStatus
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.app import app
+from app.dataset.series_index import (
+    AmbiguousSeriesError,
+    SeriesIndex,
+    build_series,
+    normalize,
+    series_index,
+)
+from app.tests.factories import produto
+
+API_PREFIX = "/api/v1"
+client = TestClient(app, raise_server_exceptions=False)
+PAIS = {"quantidade_kg": 10, "valor_dolar": 20}
+
+
+@pytest.fixture
+def fallback_items():
+    return [
+        (("producao", None, 2021), [produto("Vinho", "Tinto", 2)]),
+        (
+            ("producao", None, 2020),
+            [produto("Vinho", "Tinto", 1), produto("Suco", "Tinto", 5)],
+        ),
+        (
+            ("exportacao", "vinhos_de_mesa", 2020),
+            [{**PAIS, "pais": "Paraguai"}],
+        ),
+        (
+            ("exportacao", "vinhos_de_mesa", 2019),
+            [{**PAIS, "pais": "Paraguai"}],
+        ),
+    ]
+
+
+def test_normalize_ignora_acentos_caixa_e_espacos():
+    assert normalize("  Alemanha,  República  Democrática ") == (
+        "alemanha, republica democratica"
+    )
+
+
+def test_build_series_ordena_por_ano():
+    items = [
+        (("importacao", "frescas", 2021), [{**PAIS, "pais": "Chile"}]),
+        (("importacao", "frescas", 2019), [{**PAIS, "pais": "chile"}]),
+    ]
+
+    index = build_series(items)
+
+    serie = index[("importacao", "frescas", "", "chile")]
+    assert [p["ano"] for p in serie] == [2019, 2021]  # noqa: PLR2004
+
+
+def test_build_series_separa_grupos():
+    items = [
+        (
+            ("producao", None, 2020),
+            [produto("Vinho", "Tinto", 1), produto("Suco", "Tinto", 5)],
+        ),
+    ]
+
+    index = build_series(items)
+
+    assert index[("producao", None, "vinho", "tinto")][0]["ano"] == 2020  # noqa: PLR2004
+    suco = index[("producao", None, "suco", "tinto")]
+    assert suco[0]["quantidade_litros"] == 5  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("store")
+def test_series_index_item_ambiguo():
+    with pytest.raises(AmbiguousSeriesError) as exc:
+        series_index.get("producao", None, "tinto")
+
+    assert exc.value.grupos == ["Suco", "Vinho"]
+
+
+def test_series_index_reconstroi_apos_ttl(store):
+    now = [0.0]
+    index = SeriesIndex(ttl=10, clock=lambda: now[0])
+    assert len(index.get("exportacao", "vinhos_de_mesa", "paraguai")) == 2  # noqa: PLR2004
+
+    store.put(
+        "exportacao", "vinhos_de_mesa", 2021, [{**PAIS, "pais": "Paraguai"}]
+    )
+    assert len(index.get("exportacao", "vinhos_de_mesa", "paraguai")) == 2  # noqa: PLR2004
+
+    now[0] = 10.0
+    assert len(index.get("exportacao", "vinhos_de_mesa", "paraguai")) == 3  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("store")
+def test_rota_serie_producao_ambigua():
+    response = client.get(f"{API_PREFIX}/series/producao/tinto")
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert "Suco, Vinho" in response.json()["detail"]
+
+
+@pytest.mark.usefixtures("store")
+def test_rota_serie_producao_por_tipo():
+    response = client.get(
+        f"{API_PREFIX}/series/producao/tinto?tipo_produto=vinho"
+    )
+
+    litros = [p["quantidade_litros"] for p in response.json()["data"]]
+    assert litros == [1, 2]
+    suco = client.get(f"{API_PREFIX}/series/producao/tinto?tipo_produto=suco")
+    assert [p["ano"] for p in suco.json()["data"]] == [2020]  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("store")
+def test_rota_serie_exportacao_pais():
+    response = client.get(
+        f"{API_PREFIX}/series/exportacao/vinhos_de_mesa/pais/PARAGUAI"
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [p["ano"] for p in response.json()["data"]] == [2019, 2020]  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("store")
+def test_rota_serie_inexistente():
+    response = client.get(
+        f"{API_PREFIX}/series/importacao/espumantes/pais/Chile"
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
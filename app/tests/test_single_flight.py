@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from app.cache.single_flight import SingleFlight
+
+CHAMADAS_CONCORRENTES = 50
+
+
+def test_single_flight_coalesce_chamadas():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"data": [1]}
+
+    async def scenario():
+        return await asyncio.gather(*[
+            flight.do("key", work) for _ in range(CHAMADAS_CONCORRENTES)
+        ])
+
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert all(r == {"data": [1]} for r in results)
+    assert len(flight) == 0
+
+
+def test_single_flight_chaves_distintas():
+    flight = SingleFlight()
+    calls = []
+
+    async def work(value):
+        calls.append(value)
+        await asyncio.sleep(0)
+        return value
+
+    async def scenario():
+        return await asyncio.gather(
+            flight.do("a", lambda: work("a")),
+            flight.do("b", lambda: work("b")),
+        )
+
+    assert asyncio.run(scenario()) == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]
+
+
+def test_single_flight_propaga_excecao():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise ValueError("falhou")
+
+    async def scenario():
+        return await asyncio.gather(
+            flight.do("key", work),
+            flight.do("key", work),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(flight) == 0
+
+
+def test_single_flight_nova_chamada_apos_conclusao():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        return len(calls)
+
+    async def scenario():
+        first = await flight.do("key", work)
+        second = await flight.do("key", work)
+        return first, second
+
+    assert asyncio.run(scenario()) == (1, 2)
+
+
+def test_single_flight_cancelamento_nao_afeta_outros():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    async def scenario():
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "ok"
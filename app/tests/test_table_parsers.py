@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pytest
+
+from app.scrapper import scrapping
+from app.scrapper.table_parsers import (
+    BACKENDS,
+    get_backend,
+    stream_table_rows,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+EXTRACTORS = [
+    ("producao.html", scrapping.extract_producao_data),
+    ("comercializacao.html", scrapping.extract_comercializacao_data),
+    ("processamento_viniferas.html", scrapping.extract_processamento_data),
+    (
+        "processamento_sem_classificacao.html",
+        scrapping.extract_processamento_data,
+    ),
+    ("importacao.html", scrapping.extract_import_export_data),
+]
+
+
+class FakeResponse:
+    def __init__(self, html):
+        self.text = html
+
+
+def _extract(monkeypatch, backend, fixture, extractor):
+    monkeypatch.setattr(scrapping, "SCRAPER_BACKEND", backend)
+    html = (FIXTURES / fixture).read_text(encoding="utf-8")
+    return extractor(FakeResponse(html))
+
+
+@pytest.mark.parametrize("backend", ["stream", "lxml"])
+@pytest.mark.parametrize(("fixture", "extractor"), EXTRACTORS)
+def test_paridade_com_bs4(monkeypatch, backend, fixture, extractor):
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    expected = _extract(monkeypatch, "bs4", fixture, extractor)
+    result = _extract(monkeypatch, backend, fixture, extractor)
+    assert expected
+    assert result == expected
+
+
+def test_stream_ignora_tabela_em_comentario_e_script():
+    html = """
+    <!-- <table class="tb_base tb_dados"><tr><td>x</td></tr></table> -->
+    <script>var t = '<table class="tb_base tb_dados">';</script>
+    <table class="tb_base tb_dados">
+        <tr><td class="tb_item">A<script>ignorar()</script></td></tr>
+    </table>
+    """
+    rows = stream_table_rows(html, "tb_base tb_dados")
+    assert len(rows) == 1
+    assert rows[0][0].get_text(strip=True) == "A"
+    assert rows[0][0].get("class") == ["tb_item"]
+
+
+def test_stream_tabela_aninhada():
+    html = """
+    <table class="tb_base tb_dados">
+        <tr><td><table><tr><td>interna</td></tr></table></td></tr>
+        <tr><td>depois</td></tr>
+    </table>
+    <table><tr><td>fora</td></tr></table>
+    """
+    rows = stream_table_rows(html, "tb_base tb_dados")
+    texts = [cell.get_text(strip=True) for row in rows for cell in row]
+    assert "depois" in texts
+    assert "fora" not in texts
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_tabela_ausente(backend):
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    assert get_backend(backend)("<p>nada</p>", "tb_base tb_dados") is None
+
+
+def test_get_backend_invalido():
+    with pytest.raises(ValueError, match="Invalid scraper backend: xpto"):
+        get_backend("xpto")
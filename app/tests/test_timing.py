@@ -0,0 +1,82 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.app import app
+from app.metrics.timing import RequestTiming, phase
+
+client = TestClient(app)
+SERVER_TIMING = re.compile(r"^(\w+;dur=\d+\.\d)(, \w+;dur=\d+\.\d)*$")
+
+
+@pytest.fixture
+def server_timing():
+    with patch("app.metrics.timing.SERVER_TIMING_ENABLED", True):
+        yield
+
+
+def _phases(response):
+    header = response.headers["Server-Timing"]
+    assert SERVER_TIMING.match(header)
+    return [item.split(";")[0] for item in header.split(", ")]
+
+
+def test_request_timing_soma_fases_repetidas():
+    timing = RequestTiming()
+    timing.record("fetch", 0.010)
+    timing.record("fetch", 0.0025)
+
+    assert timing.header().startswith("fetch;dur=12.5, total;dur=")
+
+
+def test_request_timing_record_concorrente():
+    timing = RequestTiming()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(4000):
+            pool.submit(timing.record, "parse", 0.001)
+    assert timing.phases["parse"] == pytest.approx(4.0)
+
+
+def test_phase_sem_requisicao_nao_registra():
+    with phase("fetch"):
+        pass
+
+
+@pytest.mark.usefixtures("server_timing")
+@patch("app.routes.routes.fetch_page")
+def test_server_timing_fases_da_rota(mock_fetch_page):
+    mock_fetch_page.return_value = MagicMock(text="<html></html>")
+
+    response = client.get("/api/v1/importacao/espumantes/2020")
+
+    assert _phases(response) == [
+        "fetch",
+        "parse",
+        "validate",
+        "serialize",
+        "compress",
+        "total",
+    ]
+
+
+@pytest.mark.usefixtures("server_timing")
+def test_server_timing_validacao_e_serializacao():
+    response = client.get("/api/v1/")
+
+    assert _phases(response) == ["validate", "serialize", "total"]
+
+
+@pytest.mark.usefixtures("server_timing")
+def test_server_timing_fallback():
+    with patch("app.routes.routes.fetch_page", side_effect=TimeoutError()):
+        response = client.get("/api/v1/producao/2020")
+
+    assert "fallback" in _phases(response)
+
+
+def test_server_timing_desligado():
+    response = client.get("/api/v1/")
+    assert "Server-Timing" not in response.headers
@@ -0,0 +1,245 @@
+"""
+Micro-benchmark dos extratores de app/scrapper/scrapping.py.
+
+Mede, por extrator e backend de parsing, a vazão (páginas/s e linhas/s)
+e o pico de memória sobre o corpus de páginas da Embrapa, e compara com
+um baseline salvo para acusar regressões.
+
+A vazão absoluta depende da máquina; por isso o baseline guarda só
+medidas comparáveis entre ambientes: a vazão de cada backend relativa ao
+`bs4` (medido na mesma execução) e o pico de memória.
+
+    python -m benchmarks.bench_scrapping
+    python -m benchmarks.bench_scrapping --save-baseline
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from app.scrapper import scrapping
+from app.scrapper.table_parsers import BACKENDS, lxml
+from benchmarks.corpus import CORPUS_DIR, synthesize
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+# Execuções combinadas (mediana) ao gravar o baseline
+BASELINE_RUNS = 3
+# Backend de referência para a vazão relativa
+REFERENCE_BACKEND = "bs4"
+
+EXTRACTORS = {
+    "producao": scrapping.extract_producao_data,
+    "processamento": scrapping.extract_processamento_data,
+    "comercializacao": scrapping.extract_comercializacao_data,
+    "importacao": scrapping.extract_import_export_data,
+    "exportacao": scrapping.extract_import_export_data,
+}
+
+
+class CorpusPage:
+    """Imita a resposta HTTP usada pelos extratores."""
+
+    def __init__(self, text):
+        self.text = text
+
+
+def load_corpus(corpus_dir):
+    """Agrupa as páginas do corpus pelo nome do extrator."""
+    pages = {}
+    for path in sorted(Path(corpus_dir).glob("*.html")):
+        option = path.name.split("_")[0]
+        name = EXTRACTORS[option].__name__
+        pages.setdefault(name, []).append(
+            CorpusPage(path.read_text(encoding="utf-8"))
+        )
+    return pages
+
+
+def _timed_pass(extractor, pages, backend):
+    scrapping.SCRAPER_BACKEND = backend
+    start = time.perf_counter()
+    for page in pages:
+        extractor(page)
+    return time.perf_counter() - start
+
+
+def _peak_kib(extractor, pages, backend):
+    scrapping.SCRAPER_BACKEND = backend
+    tracemalloc.start()
+    for page in pages:
+        extractor(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def measure(extractor, pages, backends, repeat):
+    """
+    Executa o extrator sobre as páginas com cada backend. Os backends
+    se alternam a cada repetição, para que variações de carga da
+    máquina afetem todos da mesma forma.
+
+    Returns:
+        dict: {backend: {pages_per_s, rows_per_s, peak_kib}}, com o pico
+            de memória de uma passada.
+    """
+    n_rows = {}
+    for backend in backends:  # aquecimento
+        scrapping.SCRAPER_BACKEND = backend
+        n_rows[backend] = sum(len(extractor(page)) for page in pages)
+
+    best = dict.fromkeys(backends, float("inf"))
+    for _ in range(repeat):
+        for backend in backends:
+            elapsed = _timed_pass(extractor, pages, backend)
+            best[backend] = min(best[backend], elapsed)
+
+    return {
+        backend: {
+            "pages_per_s": len(pages) / best[backend],
+            "rows_per_s": n_rows[backend] / best[backend],
+            "peak_kib": _peak_kib(extractor, pages, backend),
+        }
+        for backend in backends
+    }
+
+
+def run(corpus_dir, backends, repeat):
+    """
+    Mede cada extrator com cada backend. O backend de referência é
+    sempre medido, para calcular a vazão relativa (`speedup`).
+    """
+    pages = load_corpus(corpus_dir)
+    if REFERENCE_BACKEND not in backends:
+        backends = [REFERENCE_BACKEND, *backends]
+    original_backend = scrapping.SCRAPER_BACKEND
+    results = {}
+    try:
+        for name, group in pages.items():
+            by_backend = measure(
+                getattr(scrapping, name), group, backends, repeat
+            )
+            reference = by_backend[REFERENCE_BACKEND]["pages_per_s"]
+            for backend, result in by_backend.items():
+                result["speedup"] = result["pages_per_s"] / reference
+                results[f"{name}[{backend}]"] = result
+    finally:
+        scrapping.SCRAPER_BACKEND = original_backend
+    return results
+
+
+def baseline_view(runs):
+    """
+    Recorta as medidas independentes da máquina, gravadas no baseline,
+    usando a mediana de várias execuções para amortecer oscilações.
+    """
+    return {
+        name: {
+            key: statistics.median(results[name][key] for results in runs)
+            for key in ("speedup", "peak_kib")
+        }
+        for name in runs[0]
+    }
+
+
+def compare(results, baseline, tolerance, speedup_tolerance):
+    """
+    Lista as medições abaixo do baseline além de `speedup_tolerance`
+    (vazão relativa ao backend de referência) ou acima de `tolerance`
+    (memória).
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["speedup"] < previous["speedup"] * (1 - speedup_tolerance):
+            regressions.append(
+                f"{name}: {current['speedup']:.2f}x o {REFERENCE_BACKEND} "
+                f"(baseline {previous['speedup']:.2f}x)"
+            )
+        if current["peak_kib"] > previous["peak_kib"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: pico de {current['peak_kib']:.0f} KiB "
+                f"(baseline {previous['peak_kib']:.0f})"
+            )
+    return regressions
+
+
+def format_report(results):
+    lines = [
+        f"{'extrator[backend]':<45}{'páginas/s':>12}"
+        f"{'linhas/s':>12}{'x bs4':>8}{'pico KiB':>10}"
+    ]
+    lines += [
+        f"{name:<45}{r['pages_per_s']:>12.1f}"
+        f"{r['rows_per_s']:>12.0f}{r['speedup']:>8.2f}"
+        f"{r['peak_kib']:>10.0f}"
+        for name, r in results.items()
+    ]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    available = [b for b in BACKENDS if b != "lxml" or lxml is not None]
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--corpus", default=str(CORPUS_DIR))
+    parser.add_argument(
+        "--backend", action="append", choices=available, dest="backends"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    # Razões entre tempos oscilam mais que o pico de memória
+    parser.add_argument("--speedup-tolerance", type=float, default=0.3)
+    args = parser.parse_args(argv)
+
+    corpus_dir = Path(args.corpus)
+    if not any(corpus_dir.glob("*.html")):
+        # Sem corpus gravado: usa páginas sintéticas no layout do site
+        corpus_dir = synthesize(tempfile.mkdtemp(prefix="corpus_"))
+        print(f"Corpus vazio, usando páginas sintéticas em {corpus_dir}")
+
+    results = run(corpus_dir, args.backends or available, args.repeat)
+    print(format_report(results))
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        runs = [results] + [
+            run(corpus_dir, args.backends or available, args.repeat)
+            for _ in range(BASELINE_RUNS - 1)
+        ]
+        baseline_path.write_text(
+            json.dumps(baseline_view(runs), indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"Baseline salvo em {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(
+            f"AVISO: baseline {baseline_path} não encontrado; gere com "
+            "--save-baseline",
+            file=sys.stderr,
+        )
+        return 2
+    regressions = compare(
+        results,
+        json.loads(baseline_path.read_text(encoding="utf-8")),
+        args.tolerance,
+        args.speedup_tolerance,
+    )
+    for regression in regressions:
+        print(f"REGRESSÃO {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""
+Corpus de páginas da Embrapa para os benchmarks do scraper.
+
+Cada arquivo se chama `<aba>[_<sub_aba>]_<ano>.html`. O corpus pode ser
+gravado a partir do site (`--record`) ou sintetizado no mesmo layout
+(`--synthesize`), com volumes de linhas compatíveis com anos antigos
+(pequenos) e recentes (grandes).
+"""
+
+import argparse
+import logging
+import os
+import random
+from pathlib import Path
+
+from app.client.embrapa_client import build_session
+from app.mapper.url_mapper import URLMapper
+
+logger = logging.getLogger(__name__)
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+ANOS = {"pequeno": 1970, "grande": 2023}
+
+# (aba, sub_aba) de todas as páginas do site
+PAGES = [("producao", None), ("comercializacao", None)]
+PAGES += [
+    (option, suboption)
+    for option in ("processamento", "importacao", "exportacao")
+    for suboption in URLMapper.SUBOPTIONS[option]
+]
+
+PAISES = [
+    "Africa do Sul", "Alemanha", "Angola", "Argentina", "Austrália",
+    "Bélgica", "Bolívia", "Canadá", "Chile", "China", "Colômbia",
+    "Côte d'Ivoire", "Espanha", "Estados Unidos", "França", "Grécia",
+    "Itália", "Japão", "México", "Nova Zelândia", "Paraguai", "Peru",
+    "Portugal", "Reino Unido", "Uruguai", "Venezuela",
+]  # fmt: skip
+CULTIVARES = [
+    "Alicante Bouschet", "Ancelota", "Aramon", "Bacarina", "Barbera",
+    "Cabernet Franc", "Cabernet Sauvignon", "Chardonnay", "Egiodola",
+    "Gewürztraminer", "Malbec", "Merlot", "Moscato Branco", "Pinot Noir",
+    "Riesling Itálico", "Sauvignon Blanc", "Tannat", "Trebbiano",
+]  # fmt: skip
+GRUPOS = {
+    "producao": ["VINHO DE MESA", "VINHO FINO DE MESA (VINIFERA)", "SUCO",
+                 "DERIVADOS"],
+    "comercializacao": ["VINHO DE MESA", "VINHO FINO DE MESA", "ESPUMANTES",
+                        "SUCO DE UVAS", "OUTROS PRODUTOS COMERCIALIZADOS"],
+    "processamento": ["TINTAS", "BRANCAS E ROSADAS"],
+}  # fmt: skip
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head>
+<meta http-equiv="Content-Type" content="text/html; charset=utf-8" />
+<title>Banco de dados de uva, vinho e derivados</title>
+<link href="css/estilo.css" rel="stylesheet" type="text/css" />
+<script type="text/javascript">function abre(url) {{ location = url; }}
+</script>
+</head>
+<body>
+<table width="100%" border="0" class="tb_base tb_header"><tr>
+{menu}
+</tr></table>
+<table class="tb_base tb_linhas" width="100%"><tr><td class="col_center">
+<div class="content_center">
+<p class="text_center">{titulo} [{ano}]</p>
+<table class="tb_base tb_dados">
+<thead><tr>{cabecalho}</tr></thead>
+<tbody>
+{linhas}
+</tbody>
+<tfoot class="tb_total"><tr><td>Total</td>{total}</tr></tfoot>
+</table>
+</div>
+</td></tr></table>
+<table class="tb_base tb_footer"><tr><td>Copyright &copy; Embrapa</td></tr>
+</table>
+</body>
+</html>
+"""
+
+
+def file_name(option, suboption, year):
+    parts = [option] + ([suboption] if suboption else []) + [str(year)]
+    return "_".join(parts) + ".html"
+
+
+def _number(rng):
+    value = rng.choice([0, rng.randint(1, 999_999_999)])
+    return f"{value:,}".replace(",", ".") if value else "-"
+
+
+def _name(rng, names, i):
+    base = names[i % len(names)]
+    return base if i < len(names) else f"{base} {i // len(names)}"
+
+
+def _td(css_class, text):
+    return f'<td class="{css_class}">\n\t\t\t{text}\t\t\t</td>'
+
+
+def _grouped_rows(rng, groups, names, n_items):
+    rows = []
+    for group in groups:
+        rows.append(f"<tr>{_td('tb_item', group)}{_td('tb_item', 1)}</tr>")
+        for i in range(n_items):
+            name, value = _name(rng, names, i), _number(rng)
+            rows.append(
+                f"<tr>{_td('tb_subitem', name)}{_td('tb_subitem', value)}</tr>"
+            )
+    return rows
+
+
+def synthesize_page(option, suboption, year):
+    """Gera uma página no layout do site, com volume conforme o ano."""
+    rng = random.Random(f"{option}-{suboption}-{year}")
+    grande = year >= ANOS["grande"]
+    if option in {"importacao", "exportacao"}:
+        n_rows = 140 if grande else 20
+        cabecalho = (
+            "<th>Países</th><th>Quantidade (Kg)</th><th>Valor (US$)</th>"
+        )
+        linhas = [
+            f"<tr><td> {_name(rng, PAISES, i)} </td>"
+            f"<td>{_number(rng)}</td><td>{_number(rng)}</td></tr>"
+            for i in range(n_rows)
+        ]
+        total = "<td>1</td><td>1</td>"
+    elif suboption == "sem_classificacao":
+        cabecalho = "<th>Cultivar</th><th>Quantidade (Kg)</th>"
+        valor = _number(rng)
+        linhas = [
+            f"<tr>{_td('tb_item', 'Sem classificação')}"
+            f"{_td('tb_item', valor)}</tr>"
+        ]
+        total = "<td>1</td>"
+    else:
+        n_items = 60 if grande else 8
+        names = CULTIVARES if option == "processamento" else PAISES
+        cabecalho = "<th>Produto</th><th>Quantidade (L.)</th>"
+        linhas = _grouped_rows(rng, GRUPOS[option], names, n_items)
+        total = "<td>1</td>"
+    menu = "\n".join(
+        f'<td><button class="btn_opt" value="opt_0{i}">Opção {i}</button></td>'
+        for i in range(1, 8)
+    )
+    return PAGE_TEMPLATE.format(
+        menu=menu,
+        titulo=option.title(),
+        ano=year,
+        cabecalho=cabecalho,
+        linhas="\n".join(linhas),
+        total=total,
+    )
+
+
+def synthesize(dest=CORPUS_DIR):
+    """Grava o corpus sintético em `dest`."""
+    os.makedirs(dest, exist_ok=True)
+    for option, suboption in PAGES:
+        for year in ANOS.values():
+            path = Path(dest) / file_name(option, suboption, year)
+            path.write_text(
+                synthesize_page(option, suboption, year), encoding="utf-8"
+            )
+    return Path(dest)
+
+
+def record(dest=CORPUS_DIR):
+    """Baixa do site da Embrapa as páginas do corpus."""
+    os.makedirs(dest, exist_ok=True)
+    session = build_session(pool_size=1)
+    for option, suboption in PAGES:
+        for year in ANOS.values():
+            url = URLMapper.build_url(option, suboption=suboption, year=year)
+            response = session.get(url, timeout=30)
+            response.raise_for_status()
+            response.encoding = response.apparent_encoding
+            path = Path(dest) / file_name(option, suboption, year)
+            path.write_text(response.text, encoding="utf-8")
+            logger.info(f"Gravado {path}")
+    return Path(dest)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dest", default=str(CORPUS_DIR))
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--record", action="store_true")
+    group.add_argument("--synthesize", action="store_true")
+    args = parser.parse_args(argv)
+    if args.record:
+        record(args.dest)
+    else:
+        synthesize(args.dest)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()